@@ -0,0 +1,192 @@
+"""
+Deterministic generator of synthetic roster data for the benchmarks.
+
+The same `--scale` and `--random-seed` always produce the same rows (ids,
+names, timestamps, soft-deletes), so results from different runs and
+machines compare like for like:
+
+    python -m benchmarks.datasets --scale large
+
+Runs against the database configured in `player_roster.settings`
+(SQLite when `DEBUG` is on, `DATABASE_URL` otherwise).
+"""
+
+import argparse
+import os
+import random
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "player_roster.settings")
+django.setup()
+
+from django.core.management import call_command  # noqa: E402
+from django.db import connection  # noqa: E402
+
+from roster.models import Comment, Player, Team  # noqa: E402
+from user_account.models import UserAccount  # noqa: E402
+
+BATCH_SIZE = 10_000
+
+SCALES = {
+    "small": {"teams": 100, "players": 5_000, "comments": 50_000, "users": 1_000},
+    "medium": {
+        "teams": 1_000,
+        "players": 50_000,
+        "comments": 500_000,
+        "users": 10_000,
+    },
+    "large": {
+        "teams": 10_000,
+        "players": 500_000,
+        "comments": 5_000_000,
+        "users": 100_000,
+    },
+}
+
+# The oldest row of every table is created at EPOCH, one row every ten seconds.
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+CITIES = [
+    "Boston", "Chicago", "Dallas", "Denver", "Detroit", "Houston", "Miami",
+    "Oakland", "Phoenix", "Seattle", "Tokyo", "Osaka", "Nagoya", "Sapporo",
+]  # fmt: skip
+FIRST_NAMES = [
+    "James", "John", "Robert", "Michael", "David", "Daniel", "Kenji", "Hiroshi",
+    "Takeshi", "Yuki", "Carlos", "Luis", "Pedro", "Shohei", "Ichiro", "Mark",
+]  # fmt: skip
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller",
+    "Davis", "Tanaka", "Suzuki", "Sato", "Takahashi", "Ohtani", "Matsui",
+]  # fmt: skip
+WORDS = [
+    "great", "game", "swing", "pitch", "catch", "season", "rookie", "trade",
+    "homerun", "defense", "speed", "power", "clutch", "slump", "injury",
+]  # fmt: skip
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """
+    Let `bulk_create` keep the `created_at` / `updated_at` values set on the
+    objects instead of overwriting them with the current time.
+    """
+    fields = [
+        field
+        for model in models
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def generate(teams, players, comments, users, deleted_ratio=0.1, random_seed=0):
+    """
+    Insert `teams`, `players`, `comments` and `users` synthetic rows, about
+    `deleted_ratio` of them soft-deleted, and recount the counters and the
+    statistics rollups.
+
+    The first user is a superuser (`admin`) for the admin scenarios.
+    """
+    rng = random.Random(random_seed)
+
+    def uuid():
+        return UUID(int=rng.getrandbits(128), version=4)
+
+    def timestamps(i, total):
+        created_at = EPOCH + timedelta(seconds=10 * i)
+        deleted_at = None
+        if i and rng.random() < deleted_ratio:
+            deleted_at = created_at + timedelta(seconds=10 * (total - i))
+        return {"created_at": created_at, "updated_at": created_at}, deleted_at
+
+    def insert(model, total, build):
+        ids = []
+        for start in range(0, total, BATCH_SIZE):
+            batch = []
+            for i in range(start, min(start + BATCH_SIZE, total)):
+                dates, deleted_at = timestamps(i, total)
+                batch.append(
+                    model(id=uuid(), **build(i), **dates, deleted_at=deleted_at)
+                )
+            model.objects.bulk_create(batch)
+            ids.extend(obj.id for obj in batch)
+        return ids
+
+    with explicit_timestamps(Team, Player, Comment, UserAccount):
+        user_ids = insert(
+            UserAccount,
+            users,
+            lambda i: {
+                "username": "admin" if i == 0 else f"user{i:06d}",
+                "email": f"user{i:06d}@example.com",
+                "password": "!",
+                "is_staff": i == 0,
+                "is_superuser": i == 0,
+            },
+        )
+        team_ids = insert(
+            Team,
+            teams,
+            lambda i: {
+                "name": f"{rng.choice(CITIES)} {i}",
+                "sport": rng.choice(Team.SportChoice.values),
+            },
+        )
+        player_ids = insert(
+            Player,
+            players,
+            lambda i: {
+                "first_name": rng.choice(FIRST_NAMES),
+                "last_name": rng.choice(LAST_NAMES),
+                "team_id": rng.choice(team_ids),
+            },
+        )
+        insert(
+            Comment,
+            comments,
+            lambda i: {
+                "user_id": rng.choice(user_ids),
+                "player_id": rng.choice(player_ids),
+                "body": " ".join(rng.choices(WORDS, k=rng.randint(3, 12))),
+            },
+        )
+
+    # `bulk_create` sends no signals, so the counters and the statistics
+    # rollups are recomputed at once.
+    call_command("rebuild_counters")
+    call_command("rebuild_stats")
+
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", choices=SCALES, default="small")
+    parser.add_argument("--deleted-ratio", type=float, default=0.1)
+    parser.add_argument("--random-seed", type=int, default=0)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    generate(
+        **SCALES[args.scale],
+        deleted_ratio=args.deleted_ratio,
+        random_seed=args.random_seed,
+    )
+    print(f"Generated {args.scale} dataset in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""
+Time the read endpoints of `roster` and `user_account` against the data in
+the configured database, and save the results as JSON:
+
+    python -m benchmarks.endpoints --seed --scale large --output large.json
+    python -m benchmarks.endpoints --compare large.json
+
+Every scenario is requested `--iterations` times through the full middleware,
+authentication and rendering stack, and reports the p50/p95 latency, the
+queries per request and the peak RSS of the process. The response cache and
+the throttles are disabled, so every request is served from the database.
+
+With `--compare`, scenarios whose p95 latency grew by more than
+`--threshold` or that run more queries than in the baseline are listed and
+the command exits with status 1.
+"""
+
+import argparse
+import json
+import math
+import platform
+import resource
+import sys
+import time
+from datetime import datetime, timezone
+from fnmatch import fnmatch
+
+from django.db import connection
+from django.test import Client, override_settings
+from django.urls import reverse
+
+# Sets up Django, so it is imported before the models.
+from benchmarks.datasets import EPOCH, SCALES, generate
+from core.instrumentation import RequestMetrics
+from roster.models import Comment, Player, Team
+from user_account.models import UserAccount
+
+BENCHMARK_SETTINGS = {
+    "ALLOWED_HOSTS": ["testserver"],
+    "CACHES": {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}},
+}
+
+
+def scenarios():
+    """
+    Return `(name, role, url)` for every list, retrieve, search, ordering and
+    nested action. Nested actions target the parent with the most children.
+    """
+    public = {"deleted_at__isnull": True}
+    team = Team.objects.filter(**public).order_by("-player_count").first()
+    player = Player.objects.filter(**public).order_by("-comment_count").first()
+    comment = Comment.objects.filter(**public).order_by("created_at").first()
+    user = (
+        UserAccount.objects.filter(is_staff=False, **public)
+        .order_by("-comment_count")
+        .first()
+    )
+
+    def url(name, *args, **query):
+        path = reverse(name, args=args)
+        if query:
+            path += "?" + "&".join(f"{key}={value}" for key, value in query.items())
+        return path
+
+    return [
+        ("team-list", "anon", url("team-list")),
+        ("team-list (admin)", "admin", url("team-list")),
+        ("team-list search", "anon", url("team-list", search="Tokyo")),
+        ("team-list ordering", "anon", url("team-list", ordering="-player_count")),
+        ("team-detail", "anon", url("team-detail", team.pk)),
+        ("team-players", "anon", url("team-players", team.pk)),
+        ("player-list", "anon", url("player-list")),
+        ("player-list (admin)", "admin", url("player-list")),
+        ("player-list search", "anon", url("player-list", search="Suzuki")),
+        ("player-list ordering", "anon", url("player-list", ordering="last_name")),
+        ("player-detail", "anon", url("player-detail", player.pk)),
+        ("player-comments", "anon", url("player-comments", player.pk)),
+        ("comment-list", "anon", url("comment-list")),
+        ("comment-list (admin)", "admin", url("comment-list")),
+        ("comment-list search", "anon", url("comment-list", search="homerun")),
+        (
+            "comment-list ordering",
+            "anon",
+            url("comment-list", ordering="player__team__name"),
+        ),
+        ("comment-detail", "anon", url("comment-detail", comment.pk)),
+        ("user_account-list", "anon", url("user_account-list")),
+        ("user_account-list (admin)", "admin", url("user_account-list")),
+        (
+            "user_account-list search",
+            "anon",
+            url("user_account-list", search=user.username),
+        ),
+        (
+            "user_account-list ordering",
+            "anon",
+            url("user_account-list", ordering="-comment_count"),
+        ),
+        ("user_account-detail", "anon", url("user_account-detail", user.pk)),
+        ("user_account-comments", "anon", url("user_account-comments", user.pk)),
+        ("me", user, url("me")),
+        ("me_comments", user, url("me_comments")),
+        ("player_comment_stat-list", "admin", url("player_comment_stat-list")),
+        ("team_player_stat-list", "admin", url("team_player_stat-list")),
+        (
+            "sport_commenter_stat-list",
+            "admin",
+            url("sport_commenter_stat-list", created_at_year_gte=EPOCH.year),
+        ),
+    ]
+
+
+def get_headers(role):
+    # Needs the app registry, which `benchmarks.datasets` sets up.
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    if role == "anon":
+        return {}
+    if role == "admin":
+        role = UserAccount.objects.get(username="admin")
+    return {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(role)}"}
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def run_scenario(client, url, headers, iterations, warmup):
+    for _ in range(warmup):
+        client.get(url, **headers)
+
+    latencies = []
+    queries = []
+    for _ in range(iterations):
+        metrics = RequestMetrics()
+        with connection.execute_wrapper(metrics):
+            started = time.perf_counter()
+            response = client.get(url, **headers)
+            latencies.append((time.perf_counter() - started) * 1000)
+        if response.status_code != 200:
+            raise RuntimeError(f"GET {url} returned {response.status_code}")
+        queries.append(metrics.queries)
+
+    return {
+        "url": url,
+        "iterations": iterations,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "mean_ms": round(sum(latencies) / len(latencies), 3),
+        "max_ms": round(max(latencies), 3),
+        "queries": max(queries),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def run(iterations, warmup, only=None):
+    results = {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "vendor": connection.vendor,
+            "python": platform.python_version(),
+            "rows": {
+                "teams": Team.objects.count(),
+                "players": Player.objects.count(),
+                "comments": Comment.objects.count(),
+                "users": UserAccount.objects.count(),
+            },
+        },
+        "scenarios": {},
+    }
+
+    client = Client()
+    with override_settings(**BENCHMARK_SETTINGS):
+        for name, role, url in scenarios():
+            if only and not fnmatch(name, only):
+                continue
+            result = run_scenario(client, url, get_headers(role), iterations, warmup)
+            results["scenarios"][name] = result
+            print(
+                f"{name:<28} p50 {result['p50_ms']:>9.2f} ms"
+                f"  p95 {result['p95_ms']:>9.2f} ms"
+                f"  {result['queries']:>3} queries"
+                f"  {result['peak_rss_mb']:>7.1f} MB"
+            )
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Print the scenarios that got slower or run more queries than `baseline`."""
+    regressions = []
+    for name, result in results["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            continue
+        change = result["p95_ms"] / before["p95_ms"] - 1 if before["p95_ms"] else 0
+        if change > threshold or result["queries"] > before["queries"]:
+            regressions.append(
+                f"{name}: p95 {before['p95_ms']:.2f} -> {result['p95_ms']:.2f} ms"
+                f" ({change:+.0%}), queries {before['queries']} -> "
+                f"{result['queries']}"
+            )
+
+    print(f"\n## {len(regressions)} regression(s) against the baseline")
+    for regression in regressions:
+        print(regression)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed", action="store_true", help="Insert synthetic rows")
+    parser.add_argument("--scale", choices=SCALES, default="small")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--only", help="Run the scenarios matching this pattern")
+    parser.add_argument("--output", help="Save the results to this JSON file")
+    parser.add_argument("--compare", help="Compare with this JSON results file")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    if args.seed:
+        generate(**SCALES[args.scale])
+
+    results = run(args.iterations, args.warmup, only=args.only)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
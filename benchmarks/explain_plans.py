@@ -0,0 +1,89 @@
+"""
+Print query plans of the soft-delete access patterns with and without the
+`Meta.indexes` of `Team`, `Player`, `Comment` and `UserAccount`.
+
+Runs against the database configured in `player_roster.settings`
+(SQLite when `DEBUG` is on, `DATABASE_URL` otherwise):
+
+    python -m benchmarks.explain_plans --seed --comments 1000000
+
+The indexes are dropped inside a transaction that is rolled back afterwards,
+so the schema is left untouched.
+"""
+
+import argparse
+import time
+
+from django.db import connection, transaction
+
+# Sets up Django, so it is imported before the models.
+from benchmarks.datasets import generate
+from roster.models import Comment, Player, Team
+from user_account.models import UserAccount
+
+
+def access_patterns():
+    team = Team.objects.order_by("?").first()
+    player = Player.objects.order_by("?").first()
+    user = UserAccount.objects.order_by("?").first()
+
+    public = {"deleted_at__isnull": True}
+    return {
+        "team-list": Team.objects.filter(**public).order_by("-created_at", "-id"),
+        "player-list": Player.objects.filter(**public).order_by("-created_at", "-id"),
+        "comment-list": Comment.objects.filter(**public).order_by("-created_at", "-id"),
+        "user_account-list": UserAccount.objects.filter(**public).order_by(
+            "-created_at", "-id"
+        ),
+        "team-players": Player.objects.filter(team=team, **public).order_by(
+            "-created_at"
+        ),
+        "player-comments": Comment.objects.filter(player=player, **public).order_by(
+            "-created_at"
+        ),
+        "user_account-comments": Comment.objects.filter(user=user, **public).order_by(
+            "-created_at"
+        ),
+    }
+
+
+def explain_all(queries):
+    for name, queryset in queries.items():
+        page = queryset[:10]
+        started = time.perf_counter()
+        list(page)
+        elapsed = (time.perf_counter() - started) * 1000
+
+        print(f"--- {name} ({elapsed:.2f} ms)")
+        print(page.explain())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed", action="store_true", help="Insert synthetic rows")
+    parser.add_argument("--comments", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    if args.seed:
+        generate(teams=500, players=10_000, comments=args.comments, users=10_000)
+
+    print(f"# {connection.vendor}: {Comment.objects.count()} comments")
+    queries = access_patterns()
+
+    print("\n## With indexes\n")
+    explain_all(queries)
+
+    print("\n## Without indexes\n")
+    # A fresh connection drops sqlite3's statement cache, which would otherwise
+    # keep returning the plans prepared while the indexes still existed.
+    connection.close()
+    with transaction.atomic(), connection.cursor() as cursor:
+        for model in (Team, Player, Comment, UserAccount):
+            for index in model._meta.indexes:
+                cursor.execute(f"DROP INDEX {connection.ops.quote_name(index.name)}")
+        explain_all(queries)
+        transaction.set_rollback(True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Load test the read endpoints through real servers with many concurrent slow
+clients, comparing the async views under uvicorn with the sync views:
+
+    python -m benchmarks.load --seed --scale small --clients 200 --duration 20
+
+Targets (`--targets`):
+
+- `asgi`: uvicorn serving the async views (`/api/v1/async/...`)
+- `asgi-sync`: uvicorn serving the sync views through ASGI
+- `wsgi`: uvicorn serving the sync views through its WSGI interface
+- `gunicorn`: gunicorn `gthread` workers serving the sync views
+
+Every client sends its request in small chunks over `--slow` seconds, like a
+client on a bad network, then reads the whole response, and starts again.
+The servers run with `benchmarks.settings` (no throttles, no response cache)
+against the database configured in `player_roster.settings`.
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import socket
+import subprocess
+import sys
+import time
+
+# Sets up Django, so it is imported before the models.
+from benchmarks.datasets import SCALES, generate
+from roster.models import Player
+
+HOST = "127.0.0.1"
+
+TARGETS = {
+    "asgi": (
+        ["uvicorn", "player_roster.asgi:application", "--workers", "{workers}"],
+        "/api/v1/async/",
+    ),
+    "asgi-sync": (
+        ["uvicorn", "player_roster.asgi:application", "--workers", "{workers}"],
+        "/api/v1/",
+    ),
+    "wsgi": (
+        [
+            "uvicorn",
+            "player_roster.wsgi:application",
+            "--interface",
+            "wsgi",
+            "--workers",
+            "{workers}",
+        ],
+        "/api/v1/",
+    ),
+    "gunicorn": (
+        [
+            "gunicorn",
+            "player_roster.wsgi:application",
+            "--worker-class",
+            "gthread",
+            "--workers",
+            "{workers}",
+            "--threads",
+            "{threads}",
+        ],
+        "/api/v1/",
+    ),
+}
+
+
+def get_paths(prefix):
+    # `comment-list` is left out: its validator aggregate alone would saturate
+    # the workers whatever the server.
+    player = Player.objects.filter(deleted_at__isnull=True).order_by("-comment_count")
+    player_pk, team_pk = player.values_list("pk", "team_id").first()
+    return [
+        f"{prefix}teams/",
+        f"{prefix}teams/{team_pk}/",
+        f"{prefix}players/{player_pk}/",
+        f"{prefix}players/{player_pk}/comments/",
+        f"{prefix}user-accounts/",
+    ]
+
+
+def get_free_port():
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def start_server(target, port, workers, threads):
+    command, _ = TARGETS[target]
+    command = [
+        sys.executable,
+        "-m",
+        *(part.format(workers=workers, threads=threads) for part in command),
+    ]
+    if command[2] == "uvicorn":
+        command += ["--host", HOST, "--port", str(port), "--log-level", "warning"]
+    else:
+        command += ["--bind", f"{HOST}:{port}", "--log-level", "warning"]
+
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": "benchmarks.settings"}
+    server = subprocess.Popen(command, env=env)
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((HOST, port), timeout=1).close()
+            return server
+        except OSError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError(f"{target} did not start on port {port}")
+
+
+async def slow_request(port, path, slow):
+    """Return the latency and status of one request dribbled over `slow` seconds."""
+    started = time.perf_counter()
+    reader, writer = await asyncio.open_connection(HOST, port)
+    try:
+        request = (
+            f"GET {path} HTTP/1.1\r\nHost: {HOST}\r\nConnection: close\r\n\r\n"
+        ).encode()
+        chunks = [request[i : i + 16] for i in range(0, len(request), 16)]
+        for chunk in chunks:
+            writer.write(chunk)
+            await writer.drain()
+            await asyncio.sleep(slow / len(chunks))
+        response = await reader.read()
+    finally:
+        writer.close()
+    status = int(response.split(b" ", 2)[1]) if response else 0
+    return time.perf_counter() - started, status
+
+
+async def run_clients(port, paths, clients, duration, slow):
+    latencies = []
+    errors = 0
+    deadline = time.monotonic() + duration
+
+    async def client(index):
+        nonlocal errors
+        while time.monotonic() < deadline:
+            path = paths[index % len(paths)]
+            index += 1
+            try:
+                latency, status = await slow_request(port, path, slow)
+            except OSError:
+                errors += 1
+                continue
+            if status == 200:
+                latencies.append(latency)
+            else:
+                errors += 1
+
+    await asyncio.gather(*(client(index) for index in range(clients)))
+    return latencies, errors
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed", action="store_true", help="Insert synthetic rows")
+    parser.add_argument("--scale", choices=SCALES, default="small")
+    parser.add_argument("--targets", nargs="+", choices=TARGETS, default=list(TARGETS))
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--slow", type=float, default=0.5)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    if args.seed:
+        generate(**SCALES[args.scale])
+
+    print(
+        f"# {args.clients} clients sending requests over {args.slow}s, "
+        f"{args.duration}s per target, {args.workers} workers\n"
+    )
+    for target in args.targets:
+        port = get_free_port()
+        paths = get_paths(TARGETS[target][1])
+        server = start_server(target, port, args.workers, args.threads)
+        try:
+            latencies, errors = asyncio.run(
+                run_clients(port, paths, args.clients, args.duration, args.slow)
+            )
+        finally:
+            server.terminate()
+            server.wait()
+
+        if not latencies:
+            print(f"{target:<10} no successful request, {errors} errors")
+            continue
+        print(
+            f"{target:<10} {len(latencies) / args.duration:8.1f} req/s"
+            f"  p50 {percentile(latencies, 50) * 1000:8.1f} ms"
+            f"  p95 {percentile(latencies, 95) * 1000:8.1f} ms"
+            f"  {errors} errors"
+        )
+
+
+if __name__ == "__main__":
+    main()
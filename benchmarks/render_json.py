@@ -0,0 +1,88 @@
+"""
+Compare the render time of `JSONRenderer` and `FastJSONRenderer` (and of
+their parsers) on a page of comments rendered by
+`CommentListRetrieveAdminSerializer`:
+
+    python -m benchmarks.render_json --comments 1000
+
+The comments are built in memory, so no database rows are needed.
+"""
+
+import argparse
+import io
+import os
+import time
+from datetime import timedelta
+from uuid import UUID
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "player_roster.settings")
+django.setup()
+
+from rest_framework.parsers import JSONParser  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from benchmarks.datasets import EPOCH  # noqa: E402
+from core import renderers  # noqa: E402
+from core.parsers import FastJSONParser  # noqa: E402
+from core.renderers import FastJSONRenderer  # noqa: E402
+from roster.models import Comment, Player, Team  # noqa: E402
+from roster.serializers.comment import CommentListRetrieveAdminSerializer  # noqa: E402
+from user_account.models import UserAccount  # noqa: E402
+
+
+def build_payload(comments):
+    team = Team(id=UUID(int=1), name="Tokyo Giants")
+    player = Player(id=UUID(int=2), first_name="Shohei", last_name="Ohtani", team=team)
+    user = UserAccount(id=UUID(int=3), username="user000001")
+    objects = [
+        Comment(
+            id=UUID(int=10 + i),
+            player=player,
+            user=user,
+            body="great game, great swing " * 4,
+            created_at=EPOCH + timedelta(seconds=10 * i),
+            updated_at=EPOCH + timedelta(seconds=10 * i),
+            deleted_at=EPOCH + timedelta(days=1) if i % 10 == 0 else None,
+        )
+        for i in range(comments)
+    ]
+    return CommentListRetrieveAdminSerializer(objects, many=True).data
+
+
+def timeit(func, iterations):
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--comments", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    data = build_payload(args.comments)
+    body = JSONRenderer().render(data)
+    assert FastJSONRenderer().render(data) == body
+
+    print(f"# {args.comments} comments, {len(body) / 1024:.0f} KiB, median of runs")
+    print(f"orjson: {'installed' if renderers.orjson else 'not installed'}\n")
+
+    results = {
+        "JSONRenderer": lambda: JSONRenderer().render(data),
+        "FastJSONRenderer": lambda: FastJSONRenderer().render(data),
+        "JSONParser": lambda: JSONParser().parse(io.BytesIO(body)),
+        "FastJSONParser": lambda: FastJSONParser().parse(io.BytesIO(body)),
+    }
+    for name, func in results.items():
+        print(f"{name:<18} {timeit(func, args.iterations):8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
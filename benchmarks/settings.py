@@ -0,0 +1,13 @@
+"""
+Settings of the servers started by `benchmarks.load`: throttles and response
+cache disabled, so every request is served from the database.
+"""
+
+from player_roster.settings import *  # noqa: F401,F403
+from player_roster.settings import REST_FRAMEWORK
+
+REST_FRAMEWORK = {**REST_FRAMEWORK, "DEFAULT_THROTTLE_CLASSES": ()}
+
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+ALLOWED_HOSTS = ["127.0.0.1"]
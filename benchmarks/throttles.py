@@ -0,0 +1,141 @@
+"""
+Compare DRF's `SimpleRateThrottle` with `SlidingWindowRateThrottle` at the
+admin rate (10000 requests/hour):
+
+    python -m benchmarks.throttles --requests 2000 --processes 8
+
+Each throttle is timed on a local memory cache and on `SQLiteCounterCache`
+once its key already holds an hour of requests. Then `--processes` workers
+sharing `SQLiteCounterCache` send requests at once against a 100/hour rate,
+and the number of requests let through is reported.
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "player_roster.settings")
+django.setup()
+
+from django.core.cache.backends.locmem import LocMemCache  # noqa: E402
+from rest_framework.throttling import SimpleRateThrottle  # noqa: E402
+
+from core.cache_backends import SQLiteCounterCache  # noqa: E402
+from core.throttling import SlidingWindowRateThrottle  # noqa: E402
+
+RATE = "10000/hour"
+# Seconds between two requests at RATE.
+INTERVAL = 0.36
+
+
+class Clock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def build(base, cache, rate=RATE, clock=time.time):
+    class Throttle(base):
+        def get_cache_key(self, request, view):
+            return "throttle_benchmark"
+
+    Throttle.rate = rate
+    Throttle.timer = staticmethod(clock)
+    throttle = Throttle()
+    throttle.cache = cache
+    return throttle
+
+
+def fill(throttle, clock, requests):
+    """Record `requests` requests in the past hour, without timing them."""
+    if isinstance(throttle, SlidingWindowRateThrottle):
+        for _ in range(requests):
+            clock.now += INTERVAL
+            throttle.allow_request(None, None)
+    else:
+        history = [clock.now + INTERVAL * i for i in range(requests, 0, -1)]
+        clock.now += INTERVAL * requests
+        throttle.cache.set(throttle.get_cache_key(None, None), history)
+
+
+def time_requests(base, cache, requests):
+    clock = Clock()
+    throttle = build(base, cache, clock=clock)
+    # Just under the limit, so every timed request is allowed and recorded.
+    fill(throttle, clock, throttle.num_requests - 100)
+
+    timings = []
+    for _ in range(requests):
+        clock.now += INTERVAL
+        started = time.perf_counter()
+        throttle.allow_request(None, None)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2], timings[int(len(timings) * 0.95)]
+
+
+def hammer(base, path, requests, allowed):
+    throttle = build(base, SQLiteCounterCache(path, {}), rate="100/hour")
+    for _ in range(requests):
+        if throttle.allow_request(None, None):
+            with allowed.get_lock():
+                allowed.value += 1
+
+
+def count_allowed(base, directory, processes, requests):
+    path = os.path.join(directory, f"{base.__name__}.sqlite3")
+    context = multiprocessing.get_context("fork")
+    allowed = context.Value("i", 0)
+    workers = [
+        context.Process(target=hammer, args=(base, path, requests, allowed))
+        for _ in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return allowed.value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--processes", type=int, default=8)
+    args = parser.parse_args()
+
+    throttles = [SimpleRateThrottle, SlidingWindowRateThrottle]
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"# {RATE}, {args.requests} requests after an hour of them\n")
+        for base in throttles:
+            caches = {
+                "locmem": LocMemCache(base.__name__, {}),
+                "sqlite": SQLiteCounterCache(
+                    os.path.join(directory, f"timing-{base.__name__}.sqlite3"), {}
+                ),
+            }
+            for name, cache in caches.items():
+                p50, p95 = time_requests(base, cache, args.requests)
+                print(
+                    f"{base.__name__:<26} {name:<7} p50 {p50:8.3f} ms"
+                    f"  p95 {p95:8.3f} ms"
+                )
+
+        print(
+            f"\n# 100/hour, {args.processes} processes sending "
+            f"{args.requests // args.processes} requests each\n"
+        )
+        for base in throttles:
+            allowed = count_allowed(
+                base, directory, args.processes, args.requests // args.processes
+            )
+            print(f"{base.__name__:<26} {allowed:>5} allowed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from rest_framework import serializers
+
+from core.counters import adjust_counters
+from core.mixins.querysets import get_serializer_query_paths
+
+
+class BulkPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    `PrimaryKeyRelatedField` that resolves its value from the objects fetched
+    up front by `BulkCreateListSerializer` instead of running one query per item.
+    Outside of a bulk request it behaves exactly like its parent.
+    """
+
+    prefetched = None
+
+    def to_internal_value(self, data):
+        if self.prefetched is None:
+            return super().to_internal_value(data)
+
+        if self.pk_field is not None:
+            data = self.pk_field.to_internal_value(data)
+        try:
+            pk = self.get_queryset().model._meta.pk.to_python(data)
+            return self.prefetched[pk]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+        except (TypeError, ValueError, DjangoValidationError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+
+class BulkCreateListSerializer(serializers.ListSerializer):
+    """
+    Validate a list of items with the child serializer, resolving every
+    `BulkPrimaryKeyRelatedField` of the whole list with one `IN` query, and
+    insert them with `bulk_create` in batches inside a single transaction.
+
+    Validation errors are returned per item, in the order of the request.
+    """
+
+    batch_size = 500
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            self.prefetch_related_objects(data)
+        return super().to_internal_value(data)
+
+    def prefetch_related_objects(self, data):
+        nested_fields = {
+            field.source: field
+            for field in self.child.fields.values()
+            if isinstance(field, serializers.ModelSerializer)
+        }
+
+        for name, field in self.child.fields.items():
+            if not isinstance(field, BulkPrimaryKeyRelatedField) or field.read_only:
+                continue
+
+            queryset = field.get_queryset()
+            pks = set()
+            for item in data:
+                if not isinstance(item, dict) or name not in item:
+                    continue
+                try:
+                    pks.add(queryset.model._meta.pk.to_python(item[name]))
+                except (TypeError, ValueError, DjangoValidationError):
+                    continue
+
+            # Fetch what the nested representation of the relation renders too.
+            nested = nested_fields.get(field.source)
+            if nested is not None:
+                select_related, _ = get_serializer_query_paths(type(nested))
+                queryset = queryset.select_related(*select_related)
+
+            field.prefetched = queryset.in_bulk(pks)
+
+    def create(self, validated_data):
+        model = self.child.Meta.model
+        objects = [model(**attrs) for attrs in validated_data]
+        with transaction.atomic():
+            objects = model.objects.bulk_create(objects, batch_size=self.batch_size)
+            # `bulk_create` sends no `post_save`, so count the new rows here.
+            adjust_counters(
+                model, [obj for obj in objects if obj.deleted_at is None], 1
+            )
+            return objects
+
+
+class BulkUpdateListSerializer(BulkCreateListSerializer):
+    """
+    Partially update the instances of a `{pk: instance}` dict from a list of
+    items identified by their `id`, each validated by the child serializer
+    against its instance, and save the columns the items set with
+    `bulk_update` in a single transaction.
+
+    The child serializer moves the counters and rollups of every item at once
+    in `move_many(pairs)` when it defines it. Validation errors are returned
+    per item, in the order of the request.
+    """
+
+    def to_internal_value(self, data):
+        # The instances of the valid items, in the order of the request.
+        self.targets = {}
+        return super().to_internal_value(data)
+
+    def run_child_validation(self, data):
+        if not isinstance(data, dict):
+            return super().run_child_validation(data)
+        if data.get("id") is None:
+            raise serializers.ValidationError({"id": ["This field is required."]})
+
+        model = self.child.Meta.model
+        try:
+            instance = self.instance[model._meta.pk.to_python(data["id"])]
+        except (KeyError, TypeError, ValueError, DjangoValidationError):
+            raise serializers.ValidationError({"id": ["Not found."]})
+        if instance.pk in self.targets:
+            raise serializers.ValidationError({"id": ["Duplicate ID."]})
+
+        self.child.instance = instance
+        self.child.initial_data = data
+        attrs = super().run_child_validation(data)
+        self.targets[instance.pk] = instance
+        return attrs
+
+    def update(self, instances, validated_data):
+        model = self.child.Meta.model
+        targets = list(self.targets.values())
+        pairs = list(zip(targets, validated_data))
+        auto_now = [
+            field
+            for field in model._meta.concrete_fields
+            if getattr(field, "auto_now", False)
+        ]
+        fields = {name for attrs in validated_data for name in attrs}
+        fields.update(field.name for field in auto_now)
+
+        with transaction.atomic():
+            move_many = getattr(self.child, "move_many", None)
+            if move_many is not None:
+                move_many(pairs)
+            for instance, attrs in pairs:
+                for name, value in attrs.items():
+                    setattr(instance, name, value)
+                for field in auto_now:
+                    field.pre_save(instance, add=False)
+            model._base_manager.bulk_update(
+                targets, sorted(fields), batch_size=self.batch_size
+            )
+        return targets
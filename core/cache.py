@@ -0,0 +1,183 @@
+import secrets
+from collections import Counter
+from functools import wraps
+from hashlib import sha256
+from urllib.parse import urlencode
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+KEY_PREFIX = "response-cache"
+
+# Response headers stored along with the data, so hits keep their validators.
+CACHED_HEADERS = ("ETag", "Last-Modified")
+
+# Per-process hit/miss counters keyed by (url name, "hit" | "miss").
+response_cache_stats = Counter()
+
+
+def get_response_cache():
+    return caches[getattr(settings, "RESPONSE_CACHE_ALIAS", "default")]
+
+
+def get_model_label(model):
+    return model._meta.label_lower
+
+
+def get_version_timeout():
+    # Generations expire so that writes which skip `invalidate_models()`
+    # (raw SQL, a forgotten `QuerySet.update()`) still show within this delay.
+    return getattr(settings, "RESPONSE_CACHE_VERSION_TIMEOUT", 300)
+
+
+def get_versions(models):
+    """
+    Return the current generation of every model in `models`, or `None` for
+    the ones the cache does not keep (e.g. `DummyCache`).
+
+    Missing generations start at a random value rather than 0, so that a
+    generation is not reused after the cache is cleared or the generation
+    expires (`RESPONSE_CACHE_VERSION_TIMEOUT`), and list ETags built from
+    them (`core.conditional`) do not come back with other rows.
+    """
+    cache = get_response_cache()
+    keys = [f"{KEY_PREFIX}:version:{get_model_label(model)}" for model in models]
+    versions = cache.get_many(keys)
+
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        for key in missing:
+            cache.add(key, secrets.randbits(48), timeout=get_version_timeout())
+        versions.update(cache.get_many(missing))
+    return [versions.get(key) for key in keys]
+
+
+def invalidate_models(*models):
+    """
+    Bump the generation of `models`, orphaning every cached response that
+    depends on one of them.
+
+    Generations are per model, not per row: any write drops every cached
+    response built from the model, for every role and parent object. This
+    costs one cache operation per write whatever the number of cached pages.
+
+    Saves and deletes are picked up through signals; call this directly after
+    writes that bypass them (`QuerySet.update()`, `bulk_update()`, ...).
+    """
+    cache = get_response_cache()
+    for model in models:
+        key = f"{KEY_PREFIX}:version:{get_model_label(model)}"
+        try:
+            cache.incr(key)
+        except ValueError:
+            if not cache.add(key, secrets.randbits(48), timeout=get_version_timeout()):
+                cache.incr(key)
+
+
+def invalidate_on_write(sender, **kwargs):
+    invalidate_models(sender)
+    # Bump again once committed, in case a concurrent request cached the
+    # pre-commit rows under the generation bumped above.
+    transaction.on_commit(lambda: invalidate_models(sender))
+
+
+def get_view_name(view):
+    return f"{view.basename}-{view.action}"
+
+
+def build_cache_key(view, request):
+    role = "admin" if request.user.is_staff else "public"
+    query = urlencode(sorted(request.query_params.lists()), doseq=True)
+    kwargs = sorted((key, str(value)) for key, value in view.kwargs.items())
+    versions = get_versions(view.cache_models)
+
+    raw = "|".join(
+        [
+            get_view_name(view),
+            role,
+            request.build_absolute_uri(request.path),
+            query,
+            repr(kwargs),
+            repr(versions),
+        ]
+    )
+    return f"{KEY_PREFIX}:{sha256(raw.encode()).hexdigest()}"
+
+
+def get_cached_response(view, request):
+    """
+    Return the cache key of the response of `view` and the cached response,
+    or `None` when it is not cached.
+    """
+    cache_key = build_cache_key(view, request)
+    view_name = get_view_name(view)
+
+    cached = get_response_cache().get(cache_key)
+    if cached is None:
+        response_cache_stats[(view_name, "miss")] += 1
+        return cache_key, None
+
+    response_cache_stats[(view_name, "hit")] += 1
+    data, headers = cached
+    response = Response(data, headers={**headers, "X-Cache": "HIT"})
+    return cache_key, get_conditional_response(
+        request,
+        etag=headers.get("ETag"),
+        last_modified=parse_http_date_safe(headers.get("Last-Modified", "")),
+        response=response,
+    )
+
+
+def store_response(cache_key, response):
+    if response.status_code == status.HTTP_200_OK:
+        headers = {name: response[name] for name in CACHED_HEADERS if name in response}
+        get_response_cache().set(
+            cache_key,
+            (response.data, headers),
+            timeout=getattr(settings, "RESPONSE_CACHE_TIMEOUT", 60),
+        )
+        response["X-Cache"] = "MISS"
+    return response
+
+
+def cache_response(method):
+    """
+    Serve a view method from the response cache, keyed on the view, action,
+    role (public / admin), normalized query parameters and the generation of
+    every model in `view.cache_models`.
+
+    Validators set by an inner `core.conditional.conditional_response` are
+    cached too, and hits answer conditional requests from them. Async methods
+    read and write the cache in a worker thread.
+    """
+    if iscoroutinefunction(method):
+
+        @wraps(method)
+        async def async_wrapper(view, request, *args, **kwargs):
+            cache_key, response = await sync_to_async(get_cached_response)(
+                view, request
+            )
+            if response is not None:
+                return response
+
+            response = await method(view, request, *args, **kwargs)
+            return await sync_to_async(store_response)(cache_key, response)
+
+        return async_wrapper
+
+    @wraps(method)
+    def wrapper(view, request, *args, **kwargs):
+        cache_key, response = get_cached_response(view, request)
+        if response is not None:
+            return response
+
+        response = method(view, request, *args, **kwargs)
+        return store_response(cache_key, response)
+
+    return wrapper
@@ -0,0 +1,147 @@
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+# Expired rows are purged once every this many writes of a process.
+PURGE_EVERY = 1000
+
+
+class SQLiteCounterCache(BaseCache):
+    """
+    Cache stored in a SQLite file shared by every process of the host, e.g.
+    the gunicorn workers, with an atomic `incr()`.
+
+    Meant for small, hot entries such as the throttle counters:
+    `LocMemCache` is private to each process and `FileBasedCache` reads and
+    rewrites a file on `incr()`, so neither counts the requests of all the
+    workers. `LOCATION` is the path of the database file.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        self._path = location
+        self._local = threading.local()
+        self._writes = 0
+
+    def _get_connection(self):
+        # Connections are not shared between threads nor inherited on fork.
+        if getattr(self._local, "pid", None) != os.getpid():
+            connection = sqlite3.connect(self._path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value BLOB, expires REAL)"
+            )
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return self._local.connection
+
+    def _execute(self, sql, params=()):
+        return self._get_connection().execute(sql, params)
+
+    def _write(self, sql, params=()):
+        self._writes += 1
+        if self._writes % PURGE_EVERY == 0:
+            self._execute("DELETE FROM cache WHERE expires <= ?", (time.time(),))
+        return self._execute(sql, params)
+
+    def _encode(self, value):
+        # Integers are stored as such, so `incr()` can add to them in SQL.
+        if type(value) is int:
+            return value
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    def _decode(self, value):
+        if isinstance(value, bytes):
+            return pickle.loads(value)
+        return value
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        cursor = self._write(
+            "INSERT INTO cache VALUES (?, ?, ?) ON CONFLICT (key) DO UPDATE "
+            "SET value = excluded.value, expires = excluded.expires "
+            "WHERE cache.expires <= ?",
+            (
+                key,
+                self._encode(value),
+                self.get_backend_timeout(timeout),
+                time.time(),
+            ),
+        )
+        return cursor.rowcount > 0
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        row = self._execute(
+            "SELECT value FROM cache "
+            "WHERE key = ? AND (expires IS NULL OR expires > ?)",
+            (key, time.time()),
+        ).fetchone()
+        return default if row is None else self._decode(row[0])
+
+    def get_many(self, keys, version=None):
+        if not keys:
+            return {}
+        originals = {
+            self.make_and_validate_key(key, version=version): key for key in keys
+        }
+        rows = self._execute(
+            "SELECT key, value FROM cache WHERE key IN (%s) "
+            "AND (expires IS NULL OR expires > ?)" % ", ".join("?" * len(originals)),
+            (*originals, time.time()),
+        )
+        return {originals[key]: self._decode(value) for key, value in rows}
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        self._write(
+            "INSERT OR REPLACE INTO cache VALUES (?, ?, ?)",
+            (key, self._encode(value), self.get_backend_timeout(timeout)),
+        )
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        cursor = self._write(
+            "UPDATE cache SET expires = ? "
+            "WHERE key = ? AND (expires IS NULL OR expires > ?)",
+            (self.get_backend_timeout(timeout), key, time.time()),
+        )
+        return cursor.rowcount > 0
+
+    def incr(self, key, delta=1, version=None):
+        validated = self.make_and_validate_key(key, version=version)
+        # Fetching every row finishes the statement, which commits it.
+        rows = self._write(
+            "UPDATE cache SET value = value + ? WHERE key = ? "
+            "AND (expires IS NULL OR expires > ?) AND typeof(value) = 'integer' "
+            "RETURNING value",
+            (delta, validated, time.time()),
+        ).fetchall()
+        if not rows:
+            raise ValueError("Key '%s' not found" % key)
+        return rows[0][0]
+
+    def delete(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return self._write("DELETE FROM cache WHERE key = ?", (key,)).rowcount > 0
+
+    def has_key(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        row = self._execute(
+            "SELECT 1 FROM cache WHERE key = ? AND (expires IS NULL OR expires > ?)",
+            (key, time.time()),
+        ).fetchone()
+        return row is not None
+
+    def clear(self):
+        self._execute("DELETE FROM cache")
+
+    def close(self, **kwargs):
+        # The connection is kept for the next requests of the thread.
+        pass
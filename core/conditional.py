@@ -0,0 +1,255 @@
+from functools import lru_cache, wraps
+from hashlib import sha256
+from urllib.parse import urlencode
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.core.exceptions import FieldDoesNotExist
+from django.db import transaction
+from django.db.models import Count, Max, Sum
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.permissions import SAFE_METHODS
+
+from core.cache import get_versions
+from core.counters import get_counter_fields
+from core.sparse_fields import parse_sparse_params
+
+DETAIL_ACTIONS = ("retrieve", "partial_update")
+
+
+@lru_cache(maxsize=None)
+def get_validator_paths(model, depth=2):
+    """
+    Return the forward foreign key paths of `model` (up to `depth` hops) whose
+    `updated_at` also shapes a response, since nested serializers follow them.
+    """
+    paths = []
+    for field in model._meta.concrete_fields:
+        if not field.many_to_one:
+            continue
+        try:
+            field.related_model._meta.get_field("updated_at")
+        except FieldDoesNotExist:
+            continue
+
+        paths.append(field.name)
+        if depth > 1:
+            paths.extend(
+                f"{field.name}__{path}"
+                for path in get_validator_paths(field.related_model, depth - 1)
+            )
+    return tuple(paths)
+
+
+def get_path_model(model, path):
+    for name in path.split("__"):
+        model = model._meta.get_field(name).related_model
+    return model
+
+
+def get_validator_values(queryset):
+    """
+    Aggregate the row count, the latest `updated_at` / `deleted_at` and the
+    counters of `queryset` and of the rows it joins, in a single query and
+    without serializing anything.
+    """
+    return queryset.order_by().aggregate(**get_validator_aggregates(queryset.model))
+
+
+async def aget_validator_values(queryset):
+    aggregates = get_validator_aggregates(queryset.model)
+    return await queryset.order_by().aaggregate(**aggregates)
+
+
+def get_validator_aggregates(model):
+    aggregates = {
+        "count": Count("pk"),
+        "updated_at": Max("updated_at"),
+        "deleted_at": Max("deleted_at"),
+    }
+    for counter in get_counter_fields(model):
+        aggregates[counter] = Sum(counter)
+    for path in get_validator_paths(model):
+        aggregates[f"{path}__updated_at"] = Max(f"{path}__updated_at")
+        for counter in get_counter_fields(get_path_model(model, path)):
+            aggregates[f"{path}__{counter}"] = Sum(f"{path}__{counter}")
+    return aggregates
+
+
+def build_validators(view, request, values):
+    """
+    Return the `(etag, last_modified)` pair of the response `view` would
+    render from the rows summarized in `values`.
+
+    Detail responses get a strong ETag, usable with `If-Match`, and a
+    `Last-Modified` date. Counters do not touch `updated_at`, so only the
+    ETag follows them. A list can lose rows without any remaining row
+    changing, so it only gets a weak ETag that also covers the row count and
+    the query parameters.
+    """
+    if view.action in DETAIL_ACTIONS:
+        # `fields` / `expand` pick another representation of the same row;
+        # writes ignore them.
+        sparse = (None, None)
+        if request.method in SAFE_METHODS:
+            sparse = parse_sparse_params(request.query_params)
+        digest = get_digest(view, request, "detail", sorted(values.items()), sparse)
+        timestamps = [
+            value
+            for key, value in values.items()
+            if key.endswith("_at") and value is not None
+        ]
+        last_modified = int(max(timestamps).timestamp()) if timestamps else None
+        return f'"{digest}"', last_modified
+
+    query = urlencode(sorted(request.query_params.lists()), doseq=True)
+    digest = get_digest(view, request, view.action, sorted(values.items()), query)
+    return f'W/"{digest}"', None
+
+
+def build_list_validators(view, request, versions):
+    """
+    Return the validators of a list-like response of `view` from the
+    generations of `view.cache_models`: a weak ETag and no `Last-Modified`.
+
+    The generations move with every write that would invalidate the cached
+    response, so the ETag follows the rows without aggregating them, and the
+    list is only as fresh as the response cache (`core.cache`).
+    """
+    query = urlencode(sorted(request.query_params.lists()), doseq=True)
+    digest = get_digest(view, request, view.action, versions, query)
+    return f'W/"{digest}"', None
+
+
+def get_digest(view, request, *parts):
+    role = "admin" if request.user.is_staff else "public"
+    kwargs = sorted((key, str(value)) for key, value in view.kwargs.items())
+    raw = "|".join([view.basename, role, repr(kwargs), *map(str, parts)])
+    return sha256(raw.encode()).hexdigest()[:32]
+
+
+def get_validators(view, request):
+    """
+    Return the validators of the current state of `view`'s response, or
+    `(None, None)` when a detail row does not exist (the view answers 404).
+
+    Lists use the cache generations, falling back to aggregating the rows
+    when the cache does not keep them.
+    """
+    if view.action not in DETAIL_ACTIONS:
+        versions = get_versions(view.cache_models)
+        if None not in versions:
+            return build_list_validators(view, request, versions)
+
+    values = get_validator_values(view.get_validator_queryset())
+    if view.action in DETAIL_ACTIONS and not values["count"]:
+        return None, None
+    return build_validators(view, request, values)
+
+
+async def aget_validators(view, request):
+    """`get_validators()` for views built on `AsyncReadMixin`."""
+    if view.action not in DETAIL_ACTIONS:
+        versions = await sync_to_async(get_versions)(view.cache_models)
+        if None not in versions:
+            return build_list_validators(view, request, versions)
+
+    values = await aget_validator_values(await view.aget_validator_queryset())
+    if view.action in DETAIL_ACTIONS and not values["count"]:
+        return None, None
+    return build_validators(view, request, values)
+
+
+def set_validator_headers(response, etag, last_modified):
+    if etag is not None:
+        response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+def conditional_response(method):
+    """
+    Answer `If-None-Match` / `If-Modified-Since` (and `If-Match` /
+    `If-Unmodified-Since`) from validators aggregated by
+    `view.get_validator_queryset()`, before the view serializes anything.
+
+    Async methods get their validators from `view.aget_validator_queryset()`.
+    """
+    if iscoroutinefunction(method):
+
+        @wraps(method)
+        async def async_wrapper(view, request, *args, **kwargs):
+            etag, last_modified = await aget_validators(view, request)
+            if etag is None:
+                return await method(view, request, *args, **kwargs)
+
+            response = get_conditional_response(
+                request, etag=etag, last_modified=last_modified
+            )
+            if response is not None:
+                return set_validator_headers(response, etag, last_modified)
+
+            response = await method(view, request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                set_validator_headers(response, etag, last_modified)
+            return response
+
+        return async_wrapper
+
+    @wraps(method)
+    def wrapper(view, request, *args, **kwargs):
+        etag, last_modified = get_validators(view, request)
+        if etag is None:
+            return method(view, request, *args, **kwargs)
+
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is not None:
+            return set_validator_headers(response, etag, last_modified)
+
+        response = method(view, request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            set_validator_headers(response, etag, last_modified)
+        return response
+
+    return wrapper
+
+
+def conditional_update(method):
+    """
+    Reject an update with `412 Precondition Failed` unless the row still
+    matches the request's `If-Match` / `If-Unmodified-Since`, and return the
+    validators of the updated row.
+
+    The row is locked while the preconditions are checked and the update is
+    written, so two clients holding the same ETag cannot both succeed.
+    """
+
+    @wraps(method)
+    def wrapper(view, request, *args, **kwargs):
+        with transaction.atomic():
+            if "If-Match" in request.headers or (
+                "If-Unmodified-Since" in request.headers
+            ):
+                list(view.get_validator_queryset().select_for_update().values("pk"))
+                # Object permissions come before preconditions.
+                view.get_object()
+
+                etag, last_modified = get_validators(view, request)
+                if etag is not None:
+                    failed = get_conditional_response(
+                        request, etag=etag, last_modified=last_modified
+                    )
+                    if failed is not None:
+                        return set_validator_headers(failed, etag, last_modified)
+
+            response = method(view, request, *args, **kwargs)
+
+        if response.status_code == status.HTTP_200_OK:
+            set_validator_headers(response, *get_validators(view, request))
+        return response
+
+    return wrapper
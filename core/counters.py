@@ -0,0 +1,135 @@
+from collections import Counter, defaultdict
+
+from django.db.models import Count, F, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+from django.dispatch import Signal
+
+from .cache import invalidate_on_write
+
+# Sent by `adjust_counters()` with the `objects` that start (`delta=1`) or stop
+# (`delta=-1`) being counted, for aggregates maintained outside the counters.
+# `objects` may be a queryset, which receivers aggregate instead of loading.
+counters_adjusted = Signal()
+
+
+def get_counter_fields(model):
+    """Return the names of the counter fields of `model` kept by its children."""
+    return tuple(
+        counter
+        for relation in model._meta.related_objects
+        for fk_name, counter in getattr(
+            relation.related_model, "PARENT_COUNTERS", {}
+        ).items()
+        if relation.field.name == fk_name
+    )
+
+
+def update_counter(parent_model, pks, counter, amount):
+    # `updated_at` is left alone: a new child is not an edit of its parent.
+    # The ETags follow the counters through `get_validator_aggregates()`.
+    updated = parent_model._base_manager.filter(pk__in=pks).update(
+        **{counter: F(counter) + amount}
+    )
+    # `QuerySet.update()` sends no signals.
+    invalidate_on_write(parent_model)
+    return updated
+
+
+def adjust_counters(model, objects, delta):
+    """
+    Add `delta` to the `PARENT_COUNTERS` of the parents of `objects` for each
+    of them, with one `UPDATE` per parent model and distinct amount.
+
+    Callers pass only rows that are counted, i.e. not soft-deleted. When
+    `objects` is a queryset, the counts are aggregated by the database.
+    """
+    is_queryset = isinstance(objects, QuerySet)
+    for fk_name, counter in getattr(model, "PARENT_COUNTERS", {}).items():
+        field = model._meta.get_field(fk_name)
+        if is_queryset:
+            counts = dict(
+                objects.order_by()
+                .values_list(field.attname)
+                .annotate(count=Count("pk"))
+            )
+        else:
+            counts = Counter(getattr(obj, field.attname) for obj in objects)
+
+        pks_by_amount = defaultdict(list)
+        for pk, amount in counts.items():
+            pks_by_amount[amount].append(pk)
+        for amount, pks in pks_by_amount.items():
+            update_counter(field.related_model, pks, counter, amount * delta)
+
+    if is_queryset or objects:
+        counters_adjusted.send(sender=model, objects=objects, delta=delta)
+
+
+def move_counters(instance, validated_data):
+    """
+    Move the counts of `instance` from its current parents to the ones it is
+    being reassigned to in `validated_data`.
+    """
+    move_many_counters([(instance, validated_data)])
+
+
+def move_many_counters(pairs):
+    """
+    `move_counters()` for `(instance, validated_data)` pairs of one model,
+    with one `UPDATE` per parent model and distinct amount.
+    """
+    if not pairs:
+        return
+
+    model = type(pairs[0][0])
+    for fk_name, counter in getattr(model, "PARENT_COUNTERS", {}).items():
+        field = model._meta.get_field(fk_name)
+        amounts = Counter()
+        for instance, validated_data in pairs:
+            new_parent = validated_data.get(fk_name)
+            old_pk = getattr(instance, field.attname)
+            if instance.deleted_at is not None:
+                continue
+            if new_parent is None or new_parent.pk == old_pk:
+                continue
+            amounts[old_pk] -= 1
+            amounts[new_parent.pk] += 1
+
+        pks_by_amount = defaultdict(list)
+        for pk, amount in amounts.items():
+            if amount:
+                pks_by_amount[amount].append(pk)
+        for amount, pks in pks_by_amount.items():
+            update_counter(field.related_model, pks, counter, amount)
+
+
+def rebuild_counter(parent_model, counter, child_model, fk_name):
+    """
+    Recount `counter` on every `parent_model` row from the active
+    `child_model` rows pointing to it. Returns the number of rows fixed.
+    """
+    active_children = (
+        child_model._base_manager.filter(
+            **{fk_name: OuterRef("pk"), "deleted_at__isnull": True}
+        )
+        .order_by()
+        .values(fk_name)
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    expected = Coalesce(Subquery(active_children), 0)
+    return (
+        parent_model._base_manager.annotate(expected=expected)
+        .exclude(**{counter: F("expected")})
+        .update(**{counter: expected})
+    )
+
+
+def count_on_create(sender, instance, created, raw=False, **kwargs):
+    if created and not raw and instance.deleted_at is None:
+        adjust_counters(sender, [instance], 1)
+
+
+def count_on_delete(sender, instance, **kwargs):
+    if instance.deleted_at is None:
+        adjust_counters(sender, [instance], -1)
@@ -0,0 +1,75 @@
+import csv
+
+from rest_framework import serializers
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class Echo:
+    """File-like object whose `write` returns the value instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+def get_export_columns(serializer, prefix=""):
+    """
+    Return the CSV columns of `serializer`: one per readable field, with the
+    fields of nested serializers flattened to `parent.child`.
+    """
+    columns = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if isinstance(field, serializers.Serializer):
+            columns.extend(get_export_columns(field, f"{prefix}{name}."))
+        else:
+            columns.append(prefix + name)
+    return columns
+
+
+def flatten_row(row, prefix=""):
+    flat = {}
+    for name, value in row.items():
+        if isinstance(value, dict):
+            flat.update(flatten_row(value, f"{prefix}{name}."))
+        else:
+            flat[prefix + name] = value
+    return flat
+
+
+def render_ndjson(rows):
+    encoder = JSONEncoder(ensure_ascii=False)
+    for row in rows:
+        yield encoder.encode(row) + "\n"
+
+
+# Spreadsheets evaluate cells starting with these as formulas.
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def escape_cell(value):
+    """Prefix text that a spreadsheet would run as a formula with `'`."""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def render_csv(rows, columns):
+    writer = csv.DictWriter(Echo(), fieldnames=columns, extrasaction="ignore")
+    yield writer.writerow(dict(zip(columns, columns)))
+    for row in rows:
+        yield writer.writerow(
+            {name: escape_cell(value) for name, value in flatten_row(row).items()}
+        )
+
+
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv", "csv"),
+}
+
+
+def render_export(export_format, rows, serializer):
+    if export_format == "csv":
+        return render_csv(rows, get_export_columns(serializer))
+    return render_ndjson(rows)
@@ -1,12 +1,123 @@
+import operator
+from datetime import date, datetime, time, timedelta
+from functools import reduce
+
+from django import forms
+from django.db.models import DateTimeField, Q
+from django.utils import timezone
 from django_filters import rest_framework as filters
+from django_filters.constants import EMPTY_VALUES
+from django_filters.utils import get_model_field
+from rest_framework.filters import SearchFilter
+
+from core.search import get_search_backend
+
+
+class PeriodFilterMixin:
+    """
+    Match the rows whose `field_name` falls in a period (`exact`), from it
+    (`gte`) or up to it (`lte`) with half-open range predicates on the bare
+    column, so indexes on it apply.
+
+    The bounds of datetime columns are the local midnights of `TIME_ZONE`.
+    """
+
+    def get_period(self, value):
+        """Return the first day of the period of `value` and of the next one."""
+        raise NotImplementedError
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+        if self.distinct:
+            qs = qs.distinct()
+
+        field = get_model_field(qs.model, self.field_name)
+        start, end = self.get_period(value)
+        start = self.to_bound(field, start)
+        if end is not None:
+            end = self.to_bound(field, end)
+
+        predicate = Q()
+        if self.lookup_expr in ("exact", "gte"):
+            predicate &= Q(**{f"{self.field_name}__gte": start})
+        if self.lookup_expr in ("exact", "lte") and end is not None:
+            predicate &= Q(**{f"{self.field_name}__lt": end})
+        return self.get_method(qs)(predicate)
+
+    @staticmethod
+    def to_bound(field, day):
+        if isinstance(field, DateTimeField):
+            return timezone.make_aware(datetime.combine(day, time.min))
+        return day
+
+
+class DayFilter(PeriodFilterMixin, filters.DateFilter):
+    def get_period(self, value):
+        if value == date.max:
+            return value, None
+        return value, value + timedelta(days=1)
+
+
+class YearFilter(PeriodFilterMixin, filters.NumberFilter):
+    field_class = forms.IntegerField
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("min_value", date.min.year)
+        kwargs.setdefault("max_value", date.max.year)
+        super().__init__(*args, **kwargs)
+
+    def get_period(self, value):
+        if value == date.max.year:
+            return date(value, 1, 1), None
+        return date(value, 1, 1), date(value + 1, 1, 1)
 
 
 class BaseFilterSet(filters.FilterSet):
-    created_at_date = filters.DateFilter(field_name="created_at", lookup_expr="date")
-    created_at_year = filters.NumberFilter(field_name="created_at", lookup_expr="year")
-    created_at_year_gte = filters.NumberFilter(
-        field_name="created_at", lookup_expr="year__gte"
-    )
-    created_at_year_lte = filters.NumberFilter(
-        field_name="created_at", lookup_expr="year__lte"
-    )
+    created_at_date = DayFilter(field_name="created_at")
+    created_at_year = YearFilter(field_name="created_at")
+    created_at_year_gte = YearFilter(field_name="created_at", lookup_expr="gte")
+    created_at_year_lte = YearFilter(field_name="created_at", lookup_expr="lte")
+
+
+class IndexedCharFilter(filters.CharFilter):
+    """
+    `icontains` filter served by the configured search backend.
+    """
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+        if self.distinct:
+            qs = qs.distinct()
+        return qs.filter(get_search_backend().build_q(qs.model, self.field_name, value))
+
+
+class IndexedSearchFilter(SearchFilter):
+    """
+    `SearchFilter` whose plain (unprefixed) search fields are matched by the
+    configured search backend instead of `icontains`.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+
+        if not search_fields or not search_terms:
+            return queryset
+
+        if any(field[0] in self.lookup_prefixes for field in search_fields):
+            return super().filter_queryset(request, queryset, view)
+
+        backend = get_search_backend()
+        conditions = (
+            reduce(
+                operator.or_,
+                (
+                    backend.build_q(queryset.model, field, term)
+                    for field in search_fields
+                ),
+            )
+            for term in search_terms
+        )
+        return queryset.filter(reduce(operator.and_, conditions, Q()))
@@ -0,0 +1,149 @@
+import bisect
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+from django.conf import settings
+
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class Histogram:
+    """Non-cumulative histogram: a value counts in the first bucket `>=` it."""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0
+        self.max = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def as_dict(self):
+        labels = [str(bound) for bound in self.bounds] + ["+Inf"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "sum": round(self.sum, 3),
+            "max": round(self.max, 3),
+        }
+
+
+class RequestMetrics:
+    """
+    Metrics of one request. Installed as a database execute wrapper, so every
+    query run while handling the request is counted and timed.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.started = perf_counter()
+        self.view_started = None
+        self.view_db_time = 0.0
+        self.view_cpu_time = 0.0
+        self.total_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += perf_counter() - started
+
+    def start_view(self):
+        self.view_started = perf_counter()
+        self.view_db_time = self.db_time
+
+    def finish(self):
+        finished = perf_counter()
+        self.total_time = finished - self.started
+        if self.view_started is not None:
+            # Time in the view and renderer spent outside of the database:
+            # permission checks, filtering and pagination as well as
+            # serialization and rendering, so not serialization alone.
+            view_time = finished - self.view_started
+            self.view_cpu_time = view_time - (self.db_time - self.view_db_time)
+
+    def server_timing(self):
+        return ", ".join(
+            [
+                f'db;dur={self.db_time * 1000:.2f};desc="{self.queries} queries"',
+                f"view_cpu;dur={self.view_cpu_time * 1000:.2f}",
+                f"total;dur={self.total_time * 1000:.2f}",
+            ]
+        )
+
+
+class MetricsRegistry:
+    """Per-process histograms of the request metrics, keyed by URL name."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def record(self, view_name, metrics):
+        with self._lock:
+            endpoint = self._endpoints.get(view_name)
+            if endpoint is None:
+                endpoint = self._endpoints[view_name] = {
+                    "requests": 0,
+                    "queries": Histogram(QUERY_BUCKETS),
+                    "db_ms": Histogram(LATENCY_BUCKETS_MS),
+                    "view_cpu_ms": Histogram(LATENCY_BUCKETS_MS),
+                    "total_ms": Histogram(LATENCY_BUCKETS_MS),
+                }
+            endpoint["requests"] += 1
+            endpoint["queries"].observe(metrics.queries)
+            endpoint["db_ms"].observe(metrics.db_time * 1000)
+            endpoint["view_cpu_ms"].observe(metrics.view_cpu_time * 1000)
+            endpoint["total_ms"].observe(metrics.total_time * 1000)
+
+    def dump(self):
+        with self._lock:
+            return {
+                view_name: {
+                    name: value if name == "requests" else value.as_dict()
+                    for name, value in endpoint.items()
+                }
+                for view_name, endpoint in sorted(self._endpoints.items())
+            }
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+request_metrics = MetricsRegistry()
+
+_query_budgets = ContextVar("query_budgets", default={})
+
+
+@contextmanager
+def query_budget(budgets):
+    """
+    Fail requests to the URL names in `budgets` (`{"team-list": 4}`) that run
+    more queries than allowed by raising `QueryBudgetExceeded`. A key prefixed
+    with a method (`"POST team-list"`) overrides the budget of that method.
+
+    Budgets declared here take precedence over `settings.QUERY_BUDGETS`.
+    """
+    token = _query_budgets.set({**_query_budgets.get(), **budgets})
+    try:
+        yield
+    finally:
+        _query_budgets.reset(token)
+
+
+def get_query_budget(view_name, method=None):
+    budgets = {**getattr(settings, "QUERY_BUDGETS", {}), **_query_budgets.get()}
+    return budgets.get(f"{method} {view_name}", budgets.get(view_name))
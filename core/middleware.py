@@ -0,0 +1,84 @@
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+
+from core.instrumentation import (
+    QueryBudgetExceeded,
+    RequestMetrics,
+    get_query_budget,
+    request_metrics,
+)
+
+
+class InstrumentationMiddleware:
+    """
+    Record the query count, database time, view time outside the database
+    (`view_cpu`) and total time of every request under its URL name
+    (`team-list`, `me_comments`, ...) in `core.instrumentation.request_metrics`,
+    and report them in a `Server-Timing` header when `SERVER_TIMING_HEADER`
+    is on.
+
+    Requests running more queries than their budget (`QUERY_BUDGETS` or
+    `core.instrumentation.query_budget`) raise `QueryBudgetExceeded`.
+
+    Queries run while a `StreamingHttpResponse` streams (e.g. `export`) happen
+    after the middleware returns and are not recorded.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        metrics = request._metrics = RequestMetrics()
+        with self.instrument(metrics):
+            response = self.get_response(request)
+        return self.process_metrics(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics = request._metrics = RequestMetrics()
+        # Connections are per thread: the async ORM queries from the sync
+        # thread of the request, not from the event loop.
+        stack = await sync_to_async(self.instrument)(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self.process_metrics(request, response, metrics)
+
+    def instrument(self, metrics):
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(metrics))
+        return stack
+
+    def process_metrics(self, request, response, metrics):
+        metrics.finish()
+
+        match = request.resolver_match
+        if match is None:
+            return response
+
+        request_metrics.record(match.view_name, metrics)
+        if getattr(settings, "SERVER_TIMING_HEADER", False):
+            response["Server-Timing"] = metrics.server_timing()
+
+        budget = get_query_budget(match.view_name, request.method)
+        if budget is not None and metrics.queries > budget:
+            raise QueryBudgetExceeded(
+                f"{request.method} {request.path} ({match.view_name}) ran "
+                f"{metrics.queries} queries, over its budget of {budget}"
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._metrics.start_view()
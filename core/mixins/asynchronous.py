@@ -0,0 +1,136 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.core.exceptions import ValidationError
+from django.http import Http404
+from django.shortcuts import aget_object_or_404
+from django.utils.decorators import classonlymethod
+from rest_framework.response import Response
+
+from core.cache import cache_response
+from core.conditional import DETAIL_ACTIONS, conditional_response
+from core.mixins.caching import CachedResponseMixin
+from core.mixins.conditional import ConditionalResponseMixin
+
+
+class AsyncReadMixin:
+    """
+    Read-only variant of a generic view or viewset with an async `dispatch`,
+    so that under ASGI the event loop keeps serving other requests while one
+    waits on the database.
+
+    `list`, `retrieve` and the `async def` extra actions count and fetch their
+    rows with the async ORM; give them the parent row with `aget_object()` and
+    render their rows with `alist_queryset()`. Authentication, permissions
+    and throttles are sync in DRF and run together in one worker thread, as do
+    the sync actions (e.g. `batch`).
+
+    `export` is left out: under ASGI Django buffers the sync iterator of a
+    `StreamingHttpResponse` in full, so it would not stream.
+
+    `list` and `retrieve` are cached and conditional like with
+    `CachedResponseMixin` and `ConditionalResponseMixin` when the view uses
+    them.
+    """
+
+    http_method_names = ["get"]
+    export = None
+
+    @classonlymethod
+    def as_view(cls, *args, **initkwargs):
+        view = super().as_view(*args, **initkwargs)
+        # Viewsets bind their handlers per request, so Django cannot tell.
+        markcoroutinefunction(view)
+        return view
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def aget_object(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        filter_kwargs = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        try:
+            obj = await aget_object_or_404(queryset, **filter_kwargs)
+        except (TypeError, ValueError, ValidationError):
+            raise Http404
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+    async def aget_validator_queryset(self):
+        if self.action == "list" or self.action in DETAIL_ACTIONS:
+            return self.get_validator_queryset()
+        parent = await self.aget_object()
+        return getattr(self, f"get_{self.action}_queryset")(parent)
+
+    async def apaginate_queryset(self, queryset):
+        if self.paginator is None:
+            return None
+        return await self.paginator.apaginate_queryset(
+            queryset, self.request, view=self
+        )
+
+    async def alist_queryset(self, queryset, serializer_class=None):
+        """
+        Return the response of `ListModelMixin.list` for `queryset`, rendered
+        by `serializer_class` (`get_serializer()` by default).
+        """
+        get_serializer = serializer_class or self.get_serializer
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            serializer = get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = get_serializer(
+            [row async for row in queryset.aiterator()], many=True
+        )
+        return Response(serializer.data)
+
+    def get_read_decorators(self):
+        decorators = []
+        if isinstance(self, ConditionalResponseMixin):
+            decorators.append(conditional_response)
+        if isinstance(self, CachedResponseMixin):
+            decorators.append(cache_response)
+        return decorators
+
+    async def aread(self, method, request, *args, **kwargs):
+        for decorator in self.get_read_decorators():
+            method = decorator(method)
+        return await method(self, request, *args, **kwargs)
+
+    async def list(self, request, *args, **kwargs):
+        return await self.aread(AsyncReadMixin._list, request, *args, **kwargs)
+
+    async def retrieve(self, request, *args, **kwargs):
+        return await self.aread(AsyncReadMixin._retrieve, request, *args, **kwargs)
+
+    async def _list(self, request, *args, **kwargs):
+        return await self.alist_queryset(self.filter_queryset(self.get_queryset()))
+
+    async def _retrieve(self, request, *args, **kwargs):
+        serializer = self.get_serializer(await self.aget_object())
+        return Response(serializer.data)
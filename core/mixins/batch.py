@@ -0,0 +1,57 @@
+from uuid import UUID
+
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from core.cache import cache_response
+
+
+class BatchRetrieveMixin:
+    """
+    `GET <list url>/batch/?ids=<id>,<id>,...` retrieves several rows in a
+    single query, rendered by the retrieve serializer of the request's role.
+
+    The response maps each requested ID, in request order, to its row, or to
+    `null` when the row does not exist or is hidden from the role (e.g.
+    soft-deleted rows for general users). The list's query parameters
+    (`search`, filters, ordering) do not apply.
+    """
+
+    batch_retrieve_max_ids = 100
+
+    @action(detail=False, methods=["get"], url_path="batch", url_name="batch")
+    @cache_response
+    def batch(self, request, *args, **kwargs):
+        ids = self.get_batch_ids()
+        # Only the role's scoping of `get_queryset()` applies: the list's
+        # search, filters and ordering must not hide the requested rows.
+        queryset = self.optimize_queryset(self.get_queryset().filter(pk__in=ids))
+        serializer = self.get_serializer()
+        rows = {str(row.pk): row for row in queryset}
+        return Response(
+            {
+                pk: serializer.to_representation(rows[pk]) if pk in rows else None
+                for pk in ids
+            }
+        )
+
+    def get_batch_ids(self):
+        """Return the distinct IDs of `?ids=` in request order."""
+        values = [
+            value.strip()
+            for value in self.request.query_params.get("ids", "").split(",")
+            if value.strip()
+        ]
+        if not values:
+            raise ValidationError({"ids": ["This parameter is required."]})
+
+        try:
+            ids = list(dict.fromkeys(str(UUID(value)) for value in values))
+        except ValueError:
+            raise ValidationError({"ids": ["Enter comma separated UUIDs."]})
+        if len(ids) > self.batch_retrieve_max_ids:
+            raise ValidationError(
+                {"ids": [f"Enter at most {self.batch_retrieve_max_ids} IDs."]}
+            )
+        return ids
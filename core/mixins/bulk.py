@@ -0,0 +1,131 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from core.cache import invalidate_models
+from core.mixins.querysets import get_serializer_query_paths
+from core.soft_delete import soft_delete
+
+
+class BulkCreateMixin:
+    """
+    `POST <list url>/bulk/` with a JSON array creates every item at once.
+
+    The create serializer must use `core.bulk_serializers.BulkCreateListSerializer`
+    as its `list_serializer_class`; items are saved through `perform_create`, so
+    extra values passed to `serializer.save()` apply to each of them.
+    """
+
+    bulk_create_max_items = 1000
+
+    @action(detail=False, methods=["post"], url_path="bulk", url_name="bulk-create")
+    def bulk_create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=self.bulk_create_max_items,
+        )
+        serializer.is_valid(raise_exception=True)
+        self.perform_bulk_create(serializer)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def perform_bulk_create(self, serializer):
+        self.perform_create(serializer)
+        # `bulk_create` sends no `post_save` signals.
+        invalidate_models(serializer.child.Meta.model)
+
+
+class BulkUpdateDestroyMixin(BulkCreateMixin):
+    """
+    Adds to `BulkCreateMixin`:
+
+    -   `PATCH <list url>/bulk/` with a JSON array of partial items, each with
+        its `id`, updates every item at once and returns them in order.
+    -   `DELETE <list url>/bulk/` with a JSON array of IDs soft-deletes every
+        row at once and returns the status of each ID (`204`, or `404` when
+        the row is not visible to the user).
+
+    The partial update serializer must use
+    `core.bulk_serializers.BulkUpdateListSerializer` as its
+    `list_serializer_class`. Both run in a single transaction and take the
+    rows from `get_queryset()` with one query.
+    """
+
+    bulk_update_max_items = 1000
+
+    @action(detail=False, methods=["post"], url_path="bulk", url_name="bulk-create")
+    def bulk_create(self, request, *args, **kwargs):
+        return super().bulk_create(request, *args, **kwargs)
+
+    @bulk_create.mapping.patch
+    def bulk_update(self, request, *args, **kwargs):
+        with transaction.atomic():
+            serializer = self.get_serializer(
+                self.get_bulk_instances(request.data),
+                data=request.data,
+                many=True,
+                partial=True,
+                allow_empty=False,
+                max_length=self.bulk_update_max_items,
+            )
+            serializer.is_valid(raise_exception=True)
+            self.perform_bulk_update(serializer)
+        return Response(serializer.data)
+
+    def get_bulk_instances(self, items):
+        """Return the rows of the `id`s of `items`, locked, by primary key."""
+        pk_field = self.get_queryset().model._meta.pk
+        pks = set()
+        for item in items if isinstance(items, list) else ():
+            try:
+                pks.add(pk_field.to_python(item["id"]))
+            except (KeyError, TypeError, ValueError, DjangoValidationError):
+                continue
+
+        serializer_class = self.get_serializer_class()
+        select_related, _ = get_serializer_query_paths(serializer_class)
+        return (
+            self.get_queryset()
+            .select_related(*select_related)
+            .select_for_update(of=("self",))
+            .in_bulk(pks)
+        )
+
+    def perform_bulk_update(self, serializer):
+        serializer.save()
+        # `bulk_update` sends no `post_save` signals.
+        invalidate_models(serializer.child.Meta.model)
+
+    @bulk_create.mapping.delete
+    def bulk_destroy(self, request, *args, **kwargs):
+        field = serializers.ListField(
+            child=serializers.UUIDField(),
+            allow_empty=False,
+            max_length=self.bulk_update_max_items,
+        )
+        pks = list(dict.fromkeys(field.run_validation(request.data)))
+
+        with transaction.atomic():
+            queryset = self.get_queryset().filter(pk__in=pks)
+            found = set(queryset.values_list("pk", flat=True))
+            self.perform_bulk_destroy(queryset)
+
+        return Response(
+            [
+                {
+                    "id": str(pk),
+                    "status": (
+                        status.HTTP_204_NO_CONTENT
+                        if pk in found
+                        else status.HTTP_404_NOT_FOUND
+                    ),
+                }
+                for pk in pks
+            ]
+        )
+
+    def perform_bulk_destroy(self, queryset):
+        soft_delete(queryset)
@@ -0,0 +1,21 @@
+from core.cache import cache_response
+
+
+class CachedResponseMixin:
+    """
+    Cache `list` and `retrieve` responses per role and query parameters.
+
+    `cache_models` lists every model whose rows the responses are built from;
+    writing any of them invalidates the cached responses of the viewset.
+    Decorate extra read actions with `core.cache.cache_response`.
+    """
+
+    cache_models = ()
+
+    @cache_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cache_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
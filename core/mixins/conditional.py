@@ -0,0 +1,45 @@
+from django.core.exceptions import ValidationError
+
+from core.conditional import DETAIL_ACTIONS, conditional_response, conditional_update
+
+
+class ConditionalResponseMixin:
+    """
+    Answer conditional `list` and `retrieve` requests with `304 Not Modified`
+    and guard `partial_update` with `If-Match`.
+
+    Decorate extra read actions with `core.conditional.conditional_response`
+    and give them a `get_<action>_queryset(parent)` method returning the rows
+    they render.
+
+    List ETags come from the generations of `cache_models` (see
+    `CachedResponseMixin`); the rows are only aggregated for detail
+    responses, or for lists when the cache does not keep generations.
+    """
+
+    def get_validator_queryset(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action == "list":
+            return queryset
+        if self.action in DETAIL_ACTIONS:
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            try:
+                return queryset.filter(
+                    **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+                )
+            except (TypeError, ValueError, ValidationError):
+                # Malformed lookups are left to `get_object` to answer with 404.
+                return queryset.none()
+        return getattr(self, f"get_{self.action}_queryset")(self.get_object())
+
+    @conditional_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @conditional_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    @conditional_update
+    def partial_update(self, request, *args, **kwargs):
+        return super().partial_update(request, *args, **kwargs)
@@ -0,0 +1,50 @@
+from django.http import StreamingHttpResponse
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+
+from core.export import EXPORT_FORMATS, render_export
+
+
+class ExportMixin:
+    """
+    `GET <list url>/export/` streams every row matching the list filters,
+    rendered by the list serializer of the request's role, as NDJSON
+    (default) or CSV (`?export_format=csv`).
+
+    Rows are read through a server-side cursor and rendered one at a time, so
+    memory stays constant whatever the number of rows. This only holds under
+    WSGI, which is why `AsyncReadMixin` views do not offer it.
+
+    The rows are read while the response streams, after
+    `InstrumentationMiddleware` has returned, so the query is not counted in
+    the request metrics nor checked against the query budget.
+
+    An export skips pagination, so views restrict it to authenticated users
+    in `get_permissions()` rather than opening it like `list`.
+    """
+
+    export_chunk_size = 2000
+
+    @action(detail=False, methods=["get"], url_path="export", url_name="export")
+    def export(self, request, *args, **kwargs):
+        export_format = request.query_params.get("export_format", "ndjson")
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError(
+                {"export_format": [f"Choose one of {', '.join(EXPORT_FORMATS)}."]}
+            )
+
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer()
+        rows = (
+            serializer.to_representation(instance)
+            for instance in queryset.iterator(chunk_size=self.export_chunk_size)
+        )
+
+        content_type, extension = EXPORT_FORMATS[export_format]
+        response = StreamingHttpResponse(
+            render_export(export_format, rows, serializer), content_type=content_type
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.basename}s.{extension}"'
+        )
+        return response
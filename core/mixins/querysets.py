@@ -0,0 +1,113 @@
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import permissions, serializers
+
+from core.sparse_fields import get_sparse_serializer, parse_sparse_params
+from core.values_serializers import ValuesModelSerializer
+
+
+# Bounded: sparse serializer classes come and go with the client's paths.
+@lru_cache(maxsize=1024)
+def get_serializer_query_paths(serializer_class):
+    """
+    Return the `select_related` and `only` paths needed to render `serializer_class`.
+
+    Nested model serializers become `select_related` joins and every readable
+    model column (including the ones of nested serializers) is listed for `only`.
+    """
+    select_related = []
+    only = []
+    _collect_query_paths(serializer_class(), "", select_related, only)
+    return tuple(select_related), tuple(only)
+
+
+def _collect_query_paths(serializer, prefix, select_related, only):
+    model = serializer.Meta.model
+
+    for field in serializer.fields.values():
+        if field.write_only or field.source == "*" or "." in field.source:
+            continue
+
+        path = prefix + field.source
+
+        if isinstance(field, serializers.ModelSerializer):
+            select_related.append(path)
+            only.append(path)
+            _collect_query_paths(field, path + "__", select_related, only)
+            continue
+
+        try:
+            model_field = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            continue
+
+        if model_field.concrete:
+            only.append(path)
+
+
+class SparseFieldsMixin:
+    """
+    Let read requests pick the fields of the response with `?fields=` and the
+    nested objects to embed with `?expand=` (see `get_sparse_serializer()`).
+
+    `get_serializer()` applies them; extra actions that pick their serializer
+    class themselves pass it through `get_sparse_serializer_class()`.
+    """
+
+    def get_sparse_serializer_class(self, serializer_class):
+        request = getattr(self, "request", None)
+        if request is None or request.method not in permissions.SAFE_METHODS:
+            return serializer_class
+        return get_sparse_serializer(
+            serializer_class, *parse_sparse_params(request.query_params)
+        )
+
+    def get_serializer(self, *args, **kwargs):
+        serializer_class = self.get_sparse_serializer_class(self.get_serializer_class())
+        kwargs.setdefault("context", self.get_serializer_context())
+        return serializer_class(*args, **kwargs)
+
+
+class SerializerQuerySetMixin(SparseFieldsMixin):
+    """
+    Fetch exactly the rows and columns that the serializer of a read action needs.
+
+    Serializers deriving from `ValuesModelSerializer` are fed `values_list()`
+    rows instead of model instances by the `values_actions` and by the extra
+    actions that call `optimize_queryset` themselves.
+    """
+
+    values_actions = ("list", "retrieve", "batch", "export")
+
+    def optimize_queryset(self, queryset, serializer_class=None, values=True):
+        if serializer_class is None:
+            serializer_class = self.get_serializer_class()
+            # The sparse fields of a detail extra action, e.g.
+            # `/players/{id}/comments/`, pick the fields of the nested list
+            # rather than those of the object `get_object()` looks up.
+            action = getattr(self, getattr(self, "action", None) or "", None)
+            if not getattr(action, "detail", False) or not hasattr(action, "mapping"):
+                serializer_class = self.get_sparse_serializer_class(serializer_class)
+
+        if values and issubclass(serializer_class, ValuesModelSerializer):
+            # Keyset pagination reads the ordering fields and `pk` off the rows.
+            ordering = [
+                field.lstrip("-")
+                for field in queryset.query.order_by
+                if isinstance(field, str)
+            ]
+            return serializer_class.get_values_queryset(queryset, [*ordering, "pk"])
+
+        select_related, only = get_serializer_query_paths(serializer_class)
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        return queryset.only(*only)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.request.method in permissions.SAFE_METHODS:
+            queryset = self.optimize_queryset(
+                queryset, values=getattr(self, "action", None) in self.values_actions
+            )
+        return queryset
@@ -1,11 +1,18 @@
+from rest_framework.throttling import AnonRateThrottle as BaseAnonRateThrottle
 from rest_framework.throttling import UserRateThrottle
 
+from core.throttling import SlidingWindowRateThrottle
 
-class AdminUserRateThrottle(UserRateThrottle):
+
+class AnonRateThrottle(SlidingWindowRateThrottle, BaseAnonRateThrottle):
+    pass
+
+
+class AdminUserRateThrottle(SlidingWindowRateThrottle, UserRateThrottle):
     scope = "admin"
 
 
-class GeneralUserRateThrottle(UserRateThrottle):
+class GeneralUserRateThrottle(SlidingWindowRateThrottle, UserRateThrottle):
     scope = "general"
 
 
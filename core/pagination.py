@@ -0,0 +1,449 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date, datetime
+from hashlib import md5
+from uuid import UUID
+
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.core.paginator import (
+    EmptyPage,
+    InvalidPage,
+    Page,
+    PageNotAnInteger,
+    Paginator,
+)
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .cache import get_response_cache
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination keyed on the full ordering of the queryset plus `pk`.
+
+    The ordering set by `OrderingFilter` (or the view itself) is extended with
+    `pk` as a tie-breaker, and each page is fetched with a `WHERE` predicate on
+    the last seen values instead of an `OFFSET`, so every page costs the same.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self.get_page_queryset(queryset, request, view)
+        if queryset is None:
+            return None
+        return self.set_page(list(queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        queryset = self.get_page_queryset(queryset, request, view)
+        if queryset is None:
+            return None
+        return self.set_page([row async for row in queryset])
+
+    def get_page_queryset(self, queryset, request, view=None):
+        """
+        Return the unevaluated query of the requested page plus one row, which
+        tells whether another page follows.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.model = queryset.model
+        self.cursor = self.decode_cursor(request)
+
+        reverse = self.cursor is not None and self.cursor["reverse"]
+        ordering = self.ordering
+        if reverse:
+            ordering = [self._flip(field) for field in ordering]
+
+        queryset = queryset.order_by(*ordering)
+        if self.cursor is not None:
+            queryset = queryset.filter(
+                self._build_position_filter(ordering, self.cursor["position"])
+            )
+
+        return queryset[: self.page_size + 1]
+
+    def set_page(self, results):
+        reverse = self.cursor is not None and self.cursor["reverse"]
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.cursor is not None
+
+        if self.page:
+            self.first_position = self._get_position(self.page[0])
+            self.last_position = self._get_position(self.page[-1])
+
+        return self.page
+
+    def get_ordering(self, request, queryset, view):
+        ordering = [
+            field for field in queryset.query.order_by if isinstance(field, str)
+        ] or ["-created_at"]
+
+        if not any(field.lstrip("-") in ("pk", "id") for field in ordering):
+            ordering.append("-pk" if ordering[-1].startswith("-") else "pk")
+
+        return ordering
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor({"position": self.last_position, "reverse": False})
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor({"position": self.first_position, "reverse": True})
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            cursor = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+            position = cursor["p"]
+            reverse = bool(cursor.get("r", False))
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        try:
+            position = [
+                self._to_python(field, value)
+                for field, value in zip(self.ordering, position)
+            ]
+        except (ValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return {"position": position, "reverse": reverse}
+
+    def _to_python(self, field, value):
+        """Convert a position value with the model field it is ordered by."""
+        if value is None:
+            raise ValueError("Positions are never null.")
+        model = self.model
+        *relations, name = field.lstrip("-").split("__")
+        for relation in relations:
+            model = model._meta.get_field(relation).related_model
+        model_field = model._meta.pk if name == "pk" else model._meta.get_field(name)
+        return model_field.to_python(value)
+
+    def encode_cursor(self, cursor):
+        tokens = {"p": cursor["position"]}
+        if cursor["reverse"]:
+            tokens["r"] = 1
+
+        encoded = urlsafe_b64encode(json.dumps(tokens).encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def _get_position(self, instance):
+        position = []
+        for field in self.ordering:
+            name = field.lstrip("-")
+            if isinstance(instance, tuple):
+                # Named `values_list()` row of a `ValuesModelSerializer`.
+                value = getattr(instance, name)
+            else:
+                value = instance
+                for attr in name.split("__"):
+                    value = getattr(value, attr)
+            position.append(self._to_primitive(value))
+        return position
+
+    def _build_position_filter(self, ordering, position):
+        """
+        Expand `(a, b, pk) > (x, y, z)` into
+        `a > x OR (a = x AND b > y) OR (a = x AND b = y AND pk > z)`,
+        honouring the direction of every ordering field.
+        """
+        predicate = Q()
+        equal = {}
+        for field, value in zip(ordering, position):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            predicate |= Q(**equal, **{f"{name}__{lookup}": value})
+            equal[name] = value
+        return predicate
+
+    @staticmethod
+    def _flip(field):
+        return field[1:] if field.startswith("-") else "-" + field
+
+    @staticmethod
+    def _to_primitive(value):
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, UUID):
+            return str(value)
+        return value
+
+
+def get_count_cache_key(queryset):
+    sql, params = queryset.query.sql_with_params()
+    digest = md5(repr((sql, params)).encode(), usedforsecurity=False).hexdigest()
+    return f"pagination-count:{digest}"
+
+
+def get_exact_count_threshold():
+    return getattr(settings, "PAGINATION_EXACT_COUNT_THRESHOLD", 10000)
+
+
+def get_count_cache_timeout():
+    return getattr(settings, "PAGINATION_COUNT_CACHE_TIMEOUT", 30)
+
+
+def parse_estimate(plan):
+    return json.loads(plan)[0]["Plan"]["Plan Rows"]
+
+
+def can_estimate(queryset):
+    return connections[queryset.db].vendor == "postgresql"
+
+
+def get_count(queryset):
+    """
+    Return the number of rows of `queryset` and whether it is approximate.
+
+    Below `PAGINATION_EXACT_COUNT_THRESHOLD` rows the count is exact. Past it,
+    the count is the row estimate of the PostgreSQL planner or, on the other
+    databases, the exact count cached for `PAGINATION_COUNT_CACHE_TIMEOUT`
+    seconds.
+    """
+    if not isinstance(queryset, QuerySet):
+        return len(queryset), False
+    queryset = queryset.order_by()
+    try:
+        cache_key = get_count_cache_key(queryset)
+    except EmptyResultSet:
+        return 0, False
+
+    cache = get_response_cache()
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached, True
+
+    threshold = get_exact_count_threshold()
+    if can_estimate(queryset):
+        estimate = parse_estimate(queryset.explain(format="json"))
+        if estimate >= threshold:
+            return estimate, True
+
+    count = queryset.count()
+    if count >= threshold:
+        cache.set(cache_key, count, get_count_cache_timeout())
+    return count, False
+
+
+async def aget_count(queryset):
+    """`get_count()` with the async ORM and cache API."""
+    if not isinstance(queryset, QuerySet):
+        return len(queryset), False
+    queryset = queryset.order_by()
+    try:
+        cache_key = get_count_cache_key(queryset)
+    except EmptyResultSet:
+        return 0, False
+
+    cache = get_response_cache()
+    cached = await cache.aget(cache_key)
+    if cached is not None:
+        return cached, True
+
+    threshold = get_exact_count_threshold()
+    if can_estimate(queryset):
+        estimate = parse_estimate(await queryset.aexplain(format="json"))
+        if estimate >= threshold:
+            return estimate, True
+
+    count = await queryset.acount()
+    if count >= threshold:
+        await cache.aset(cache_key, count, get_count_cache_timeout())
+    return count, False
+
+
+class ApproximateCountPage(Page):
+    def has_next(self):
+        if not self.paginator.is_approximate:
+            return super().has_next()
+        # The estimate may be off either way; a full page may have a next one.
+        return len(self) == self.paginator.per_page
+
+
+class ApproximateCountPaginator(Paginator):
+    """
+    `Paginator` whose `count` comes from `get_count()`. When it is
+    approximate, any page number past the first is served, empty past the
+    last row, and a full page links to the next one.
+    """
+
+    is_approximate = False
+
+    @cached_property
+    def count(self):
+        count, self.is_approximate = get_count(self.object_list)
+        return count
+
+    def validate_number(self, number):
+        # Reading `count` sets `is_approximate`.
+        if not self.count or not self.is_approximate:
+            return super().validate_number(number)
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.is_approximate:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        return self._get_page(
+            self.object_list[bottom : bottom + self.per_page], number, self
+        )
+
+    def _get_page(self, *args, **kwargs):
+        return ApproximateCountPage(*args, **kwargs)
+
+
+class ApproximateCountPagination(PageNumberPagination):
+    """
+    Page number pagination that counts large lists approximately (see
+    `get_count()`) and says so in `count_is_approximate`.
+    """
+
+    django_paginator_class = ApproximateCountPaginator
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        response.data = {
+            "count": response.data["count"],
+            "count_is_approximate": self.page.paginator.is_approximate,
+            **response.data,
+        }
+        return response
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count_is_approximate"] = {
+            "type": "boolean",
+            "example": False,
+        }
+        return response_schema
+
+
+class PageNumberOrKeysetPagination(ApproximateCountPagination):
+    """
+    Page number pagination by default, keyset pagination when the client asks
+    for it with `?pagination=cursor` (or follows a `cursor` link).
+    """
+
+    pagination_query_param = "pagination"
+    keyset_pagination_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if self.use_keyset(request):
+            self.keyset = self.keyset_pagination_class()
+            self.keyset.page_size = self.page_size
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        `paginate_queryset()` counting and fetching the rows with the async
+        ORM.
+        """
+        self.keyset = None
+        if self.use_keyset(request):
+            self.keyset = self.keyset_pagination_class()
+            self.keyset.page_size = self.page_size
+            return await self.keyset.apaginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        # Set before `Paginator.count` would run `get_count()`.
+        paginator.count, paginator.is_approximate = await aget_count(queryset)
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(
+                self.invalid_page_message.format(
+                    page_number=page_number, message=str(exc)
+                )
+            )
+        self.page.object_list = [row async for row in self.page.object_list]
+
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+        return list(self.page)
+
+    def use_keyset(self, request):
+        return (
+            request.query_params.get(self.pagination_query_param) == "cursor"
+            or self.keyset_pagination_class.cursor_query_param in request.query_params
+        )
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["required"] = ["results"]
+        return response_schema
+
+    def get_html_context(self):
+        if self.keyset is not None:
+            return self.keyset.get_html_context()
+        return super().get_html_context()
+
+    def to_html(self):
+        if self.keyset is not None:
+            return self.keyset.to_html()
+        return super().to_html()
+
+    def get_schema_operation_parameters(self, view):
+        keyset = self.keyset_pagination_class()
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "name": self.pagination_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Set to `cursor` to use keyset pagination.",
+                "schema": {"type": "string", "enum": ["cursor"]},
+            },
+            *keyset.get_schema_operation_parameters(view),
+        ]
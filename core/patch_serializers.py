@@ -0,0 +1,57 @@
+from rest_framework import serializers
+from rest_framework.serializers import raise_errors_on_nested_writes
+from rest_framework.utils import model_meta
+
+
+def get_changed_fields(instance, validated_data):
+    """
+    Return the names of the concrete fields of `validated_data` whose value
+    differs from the one of `instance`, comparing foreign keys by primary key
+    so that no related row is fetched.
+    """
+    changed = []
+    for name, value in validated_data.items():
+        field = instance._meta.get_field(name)
+        if not field.concrete or field.many_to_many:
+            continue
+        if field.is_relation and value is not None:
+            value = value.pk
+        if field.value_from_object(instance) != value:
+            changed.append(name)
+    return changed
+
+
+class PatchModelSerializer(serializers.ModelSerializer):
+    """
+    `ModelSerializer` whose `update()` saves only the columns that change,
+    along with the `auto_now` ones (e.g. `updated_at`), with
+    `save(update_fields=...)`, and skips the `UPDATE` when nothing changes.
+
+    `ModelSerializer.update()` saves every column, which rewrites the ones
+    the request did not touch (e.g. `password`) from the values read earlier.
+    """
+
+    def update(self, instance, validated_data):
+        raise_errors_on_nested_writes("update", self, validated_data)
+        info = model_meta.get_field_info(instance)
+
+        changed = get_changed_fields(instance, validated_data)
+        m2m_fields = []
+        for attr, value in validated_data.items():
+            if attr in info.relations and info.relations[attr].to_many:
+                m2m_fields.append((attr, value))
+            else:
+                setattr(instance, attr, value)
+
+        if changed:
+            auto_now = [
+                field.name
+                for field in instance._meta.concrete_fields
+                if getattr(field, "auto_now", False)
+            ]
+            instance.save(update_fields=[*changed, *auto_now])
+
+        for attr, value in m2m_fields:
+            getattr(instance, attr).set(value)
+
+        return instance
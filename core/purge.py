@@ -0,0 +1,129 @@
+import gzip
+import json
+import os
+from datetime import datetime
+
+from django.core import serializers
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+
+
+def is_soft_deletable(model):
+    return any(field.name == "deleted_at" for field in model._meta.concrete_fields)
+
+
+def get_purgeable(model, cutoff):
+    """
+    Return the rows of `model` soft-deleted before `cutoff`, in keyset order.
+
+    Rows still pointed to by a soft-deletable row (e.g. a player with
+    comments left) are kept, so the `CASCADE` of their deletion never drops
+    rows that were not archived. Derived rows, like the statistics rollups,
+    are deleted along with them.
+    """
+    queryset = model._base_manager.filter(deleted_at__lt=cutoff)
+    for relation in model._meta.related_objects:
+        if relation.one_to_many and is_soft_deletable(relation.related_model):
+            children = relation.related_model._base_manager.filter(
+                **{relation.field.name: OuterRef("pk")}
+            )
+            queryset = queryset.exclude(Exists(children))
+    return queryset.order_by("deleted_at", "pk")
+
+
+def get_archive_path(archive_dir, model, first):
+    # Named after the first row, so a batch retried after a failure replaces
+    # its own file and never the one of a batch already deleted.
+    stamp = first.deleted_at.strftime("%Y%m%dT%H%M%S%f")
+    return os.path.join(
+        archive_dir, f"{model._meta.label_lower}-{stamp}-{first.pk}.jsonl.gz"
+    )
+
+
+def write_archive(objects, path):
+    """
+    Write `objects` to `path` as gzipped JSON Lines, in the fixture format
+    `manage.py loaddata` reads back.
+    """
+    partial = f"{path}.partial"
+    with gzip.open(partial, "wt", encoding="utf-8") as stream:
+        serializers.serialize("jsonl", objects, stream=stream)
+    os.replace(partial, path)
+
+
+def purge_batch(model, cutoff, archive_dir, batch_size, after=None):
+    """
+    Archive then delete the next `batch_size` purgeable rows of `model`
+    following the keyset position `after`, a `(deleted_at, pk)` pair, in one
+    transaction.
+
+    Returns the number of rows purged and the position of the last one, or
+    `(0, after)` when no row is left.
+    """
+    queryset = get_purgeable(model, cutoff).prefetch_related(
+        *[field.name for field in model._meta.many_to_many]
+    )
+    if after is not None:
+        deleted_at, pk = after
+        queryset = queryset.filter(
+            Q(deleted_at__gt=deleted_at) | Q(deleted_at=deleted_at, pk__gt=pk)
+        )
+
+    with transaction.atomic():
+        objects = list(queryset.select_for_update(of=("self",))[:batch_size])
+        if not objects:
+            return 0, after
+
+        write_archive(objects, get_archive_path(archive_dir, model, objects[0]))
+        model._base_manager.filter(
+            pk__in=[obj.pk for obj in objects], deleted_at__lt=cutoff
+        ).delete()
+    return len(objects), (objects[-1].deleted_at, objects[-1].pk)
+
+
+class Checkpoint:
+    """
+    Progress of a purge run kept in a JSON file: its cutoff and the keyset
+    position reached on each model, so an interrupted run resumes where it
+    stopped with the same cutoff.
+    """
+
+    def __init__(self, path, cutoff, positions=None):
+        self.path = path
+        self.cutoff = cutoff
+        self.positions = positions or {}
+
+    @classmethod
+    def load(cls, path, cutoff):
+        """Return the checkpoint saved at `path`, or a new one from `cutoff`."""
+        try:
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return cls(path, cutoff)
+        positions = {
+            label: (datetime.fromisoformat(deleted_at), pk)
+            for label, (deleted_at, pk) in data["positions"].items()
+        }
+        return cls(path, datetime.fromisoformat(data["cutoff"]), positions)
+
+    def get_position(self, model):
+        return self.positions.get(model._meta.label_lower)
+
+    def save(self, model, position):
+        self.positions[model._meta.label_lower] = position
+        data = {
+            "cutoff": self.cutoff.isoformat(),
+            "positions": {
+                label: (deleted_at.isoformat(), str(pk))
+                for label, (deleted_at, pk) in self.positions.items()
+            },
+        }
+        partial = f"{self.path}.partial"
+        with open(partial, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(partial, self.path)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,44 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# `orjson` renders UUIDs, dates and datetimes natively, formatted like DRF's
+# encoder (`Z` for UTC), and leaves the other types to DRF's encoder.
+ORJSON_OPTIONS = orjson.OPT_UTC_Z if orjson else 0
+
+_default = JSONEncoder().default
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    `JSONRenderer` that encodes with `orjson` in a single pass when it is
+    installed, falling back to `JSONRenderer` (the standard library encoder)
+    when it is not, and for indented, ASCII-only or non-strict output.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        if orjson is None or not self.compact or self.ensure_ascii or not self.strict:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # E.g. non-string dict keys, which the standard library coerces.
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Escape U+2028 / U+2029 like `JSONRenderer`.
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028")
+            ret = ret.replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
@@ -0,0 +1,112 @@
+from django.conf import settings
+from django.db import connection, connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+
+class SearchBackend:
+    """
+    Plain `icontains` search, which is what `SearchFilter` does out of the box.
+
+    On Postgres `icontains` compiles to `UPPER(col::text) LIKE UPPER(%s)`,
+    which the `pg_trgm` GIN indexes of the search migrations serve.
+    """
+
+    def build_q(self, model, field_path, term):
+        return Q(**{f"{field_path}__icontains": term})
+
+
+class SQLiteFTSSearchBackend(SearchBackend):
+    """
+    Match `SEARCH_FIELDS` columns through the FTS5 trigram shadow tables created
+    by the search migrations, falling back to `icontains` for terms the trigram
+    tokenizer cannot match (shorter than three characters) and other columns.
+    """
+
+    min_term_length = 3
+
+    def build_q(self, model, field_path, term):
+        *relations, column = field_path.split("__")
+
+        target = model
+        for name in relations:
+            target = target._meta.get_field(name).related_model
+
+        search_fields = getattr(target, "SEARCH_FIELDS", ())
+        if len(term) < self.min_term_length or column not in search_fields:
+            return super().build_q(model, field_path, term)
+
+        table = target._meta.db_table
+        quoted = '"' + term.replace('"', '""') + '"'
+        sql = (
+            f'SELECT object_id FROM "{table}_search_map" WHERE rowid IN '
+            f'(SELECT rowid FROM "{table}_search" WHERE "{table}_search" MATCH %s)'
+        )
+        lookup = "__".join([*relations, "pk", "in"])
+        return Q(**{lookup: RawSQL(sql, [f"{column} : {quoted}"])})
+
+
+def get_search_backend():
+    backend_path = getattr(settings, "SEARCH_BACKEND", None)
+    if backend_path:
+        return import_string(backend_path)()
+    if connection.vendor == "sqlite":
+        return SQLiteFTSSearchBackend()
+    return SearchBackend()
+
+
+# ==================================================
+# Schema
+# ==================================================
+def install_search_triggers(db, model, fields):
+    """
+    Keep the SQLite shadow table in sync with inserts, updates of the searched
+    columns and deletes of `model`. Soft-deleted rows stay indexed; the views
+    hide them from the public with their `deleted_at` filters as before.
+
+    SQLite drops triggers when Django rebuilds a table during a migration, so
+    this also runs on `post_migrate`; the shadow tables themselves survive.
+    """
+    table = model._meta.db_table
+    columns = [model._meta.get_field(name).column for name in fields]
+    column_list = ", ".join(f'"{column}"' for column in columns)
+    new_values = ", ".join(f'new."{column}"' for column in columns)
+    assignments = ", ".join(f'"{column}" = new."{column}"' for column in columns)
+    map_rowid = f'(SELECT rowid FROM "{table}_search_map" WHERE object_id = {{}}.id)'
+
+    with db.cursor() as cursor:
+        cursor.execute(
+            f'CREATE TRIGGER IF NOT EXISTS "{table}_search_insert" '
+            f'AFTER INSERT ON "{table}" BEGIN '
+            f'INSERT INTO "{table}_search_map" (object_id) VALUES (new.id); '
+            f'INSERT INTO "{table}_search" (rowid, {column_list}) '
+            f"VALUES (last_insert_rowid(), {new_values}); "
+            f"END"
+        )
+        cursor.execute(
+            f'CREATE TRIGGER IF NOT EXISTS "{table}_search_update" '
+            f'AFTER UPDATE OF {column_list} ON "{table}" BEGIN '
+            f'UPDATE "{table}_search" SET {assignments} '
+            f"WHERE rowid = {map_rowid.format('new')}; "
+            f"END"
+        )
+        cursor.execute(
+            f'CREATE TRIGGER IF NOT EXISTS "{table}_search_delete" '
+            f'AFTER DELETE ON "{table}" BEGIN '
+            f'DELETE FROM "{table}_search" WHERE rowid = {map_rowid.format("old")}; '
+            f'DELETE FROM "{table}_search_map" WHERE object_id = old.id; '
+            f"END"
+        )
+
+
+def install_search_triggers_on_migrate(sender, using, **kwargs):
+    db = connections[using]
+    if db.vendor != "sqlite":
+        return
+
+    tables = set(db.introspection.table_names())
+    for model in sender.get_models():
+        search_fields = getattr(model, "SEARCH_FIELDS", None)
+        if search_fields and f"{model._meta.db_table}_search" in tables:
+            install_search_triggers(db, model, search_fields)
@@ -0,0 +1,105 @@
+from collections import defaultdict
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from .authentication import invalidate_users
+from .cache import invalidate_on_write
+from .counters import adjust_counters
+
+
+def get_cascade(model):
+    """
+    Yield the `(child model, lookup to the parent)` pairs of the
+    `SOFT_DELETE_CASCADE` paths of `model`, e.g. `(Comment, "player__team")`
+    for the `"players__comments"` path of `Team`.
+    """
+    for path in getattr(model, "SOFT_DELETE_CASCADE", ()):
+        child, lookups = model, []
+        for name in path.split("__"):
+            relation = child._meta.get_field(name)
+            lookups.insert(0, relation.field.name)
+            child = relation.related_model
+        yield child, "__".join(lookups)
+
+
+def stamp(queryset, deleted_at, delta):
+    """
+    Set `deleted_at` on every row of `queryset` with one `UPDATE`, after
+    adding `delta` to the counters and rollups the rows are part of.
+    """
+    # The counts are aggregated from the rows before they change state.
+    adjust_counters(queryset.model, queryset, delta)
+    updated = queryset.update(deleted_at=deleted_at, updated_at=timezone.now())
+
+    # `QuerySet.update()` sends no signals.
+    invalidate_on_write(queryset.model)
+    return updated
+
+
+def invalidate_user_rows(model, pks):
+    if model is get_user_model() and pks:
+        invalidate_users(*pks)
+        transaction.on_commit(lambda: invalidate_users(*pks))
+
+
+def soft_delete(queryset):
+    """
+    Soft-delete the active rows of `queryset` and, following the
+    `SOFT_DELETE_CASCADE` of its model, their active descendants, all stamped
+    with the same `deleted_at` in one transaction.
+
+    Runs one `UPDATE ... WHERE deleted_at IS NULL` per model, plus the
+    aggregated counter updates. Returns the `deleted_at` stamped.
+    """
+    model = queryset.model
+    deleted_at = timezone.now()
+    with transaction.atomic():
+        pks = list(
+            queryset.filter(deleted_at__isnull=True).values_list("pk", flat=True)
+        )
+        if not pks:
+            return deleted_at
+
+        for child_model, lookup in get_cascade(model):
+            children = child_model._base_manager.filter(
+                **{f"{lookup}__in": pks, "deleted_at__isnull": True}
+            )
+            stamp(children, deleted_at, -1)
+        stamp(
+            model._base_manager.filter(pk__in=pks, deleted_at__isnull=True),
+            deleted_at,
+            -1,
+        )
+        invalidate_user_rows(model, pks)
+    return deleted_at
+
+
+def restore(queryset):
+    """
+    Undo `soft_delete()` for the soft-deleted rows of `queryset` and the
+    descendants that were stamped with the same `deleted_at`, leaving the
+    ones deleted on their own before or after. Returns the number of
+    `queryset` rows restored.
+    """
+    model = queryset.model
+    restored = 0
+    with transaction.atomic():
+        pks_by_stamp = defaultdict(list)
+        for pk, deleted_at in queryset.filter(deleted_at__isnull=False).values_list(
+            "pk", "deleted_at"
+        ):
+            pks_by_stamp[deleted_at].append(pk)
+
+        for deleted_at, pks in pks_by_stamp.items():
+            for child_model, lookup in get_cascade(model):
+                children = child_model._base_manager.filter(
+                    **{f"{lookup}__in": pks, "deleted_at": deleted_at}
+                )
+                stamp(children, None, 1)
+            restored += stamp(
+                model._base_manager.filter(pk__in=pks, deleted_at=deleted_at), None, 1
+            )
+            invalidate_user_rows(model, pks)
+    return restored
@@ -0,0 +1,166 @@
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+FIELDS_PARAM = "fields"
+EXPAND_PARAM = "expand"
+
+
+def parse_paths(value):
+    """
+    Parse a comma separated list of dotted paths, e.g. `id,player.team.name`,
+    into a tree of nested `(name, subtree)` pairs sorted by name, usable as a
+    cache key.
+    """
+    tree = {}
+    for path in value.split(","):
+        node = tree
+        for name in filter(None, path.strip().split(".")):
+            node = node.setdefault(name, {})
+    return freeze(tree)
+
+
+def freeze(tree):
+    return tuple(sorted((name, freeze(subtree)) for name, subtree in tree.items()))
+
+
+def parse_sparse_params(query_params):
+    """
+    Return the `fields` and `expand` trees of the query parameters, `None`
+    when a parameter is absent. An empty `expand` expands nothing, while an
+    empty `fields` is rejected by `get_sparse_serializer()`.
+    """
+    fields = query_params.get(FIELDS_PARAM)
+    expand = query_params.get(EXPAND_PARAM)
+    return (
+        None if fields is None else parse_paths(fields),
+        None if expand is None else parse_paths(expand),
+    )
+
+
+def get_id_field(field, model):
+    """
+    Return a field rendering the primary key of the object `field` nests
+    from the foreign key column, or `None` when `field` is not a foreign key.
+    """
+    try:
+        model_field = model._meta.get_field(field.source)
+    except FieldDoesNotExist:
+        return None
+    if not (model_field.many_to_one and model_field.concrete):
+        return None
+
+    field_class = serializers.ModelSerializer.serializer_field_mapping.get(
+        type(model_field.target_field), serializers.ReadOnlyField
+    )
+    return field_class(source=model_field.attname, read_only=True)
+
+
+class InvalidPaths(Exception):
+    def __init__(self, errors):
+        # `(query parameter, dotted path, message)` triples.
+        self.errors = errors
+
+    def prefixed(self, name):
+        return InvalidPaths(
+            [(param, f"{name}.{path}", message) for param, path, message in self.errors]
+        )
+
+
+def get_sparse_serializer(serializer_class, fields=None, expand=None):
+    """
+    Return a subclass of `serializer_class` rendering only the `fields` tree
+    and embedding only the nested serializers of the `expand` tree, the
+    others being collapsed to the primary key of their object.
+
+    A `None` tree leaves the fields, or the nested serializers, as they are.
+    Only the readable fields of `serializer_class` can be picked, so a role's
+    serializer never renders more than it does in full. The subclasses are
+    cached, and so are the queries `SerializerQuerySetMixin` derives from
+    them.
+
+    Raises `ValidationError` for an empty `fields` tree and for the paths
+    that cannot be picked or expanded.
+    """
+    if fields == ():
+        raise serializers.ValidationError(
+            {FIELDS_PARAM: ["Pick at least one field."]}, code="invalid"
+        )
+    try:
+        return build_sparse_serializer(serializer_class, fields, expand)
+    except InvalidPaths as exc:
+        errors = {}
+        for param, path, message in exc.errors:
+            errors.setdefault(param, []).append(f"`{path}`: {message}")
+        raise serializers.ValidationError(errors, code="invalid")
+
+
+# Clients pick the paths, so the classes built for them are bounded.
+@lru_cache(maxsize=256)
+def build_sparse_serializer(serializer_class, fields, expand):
+    if fields is None and expand is None:
+        return serializer_class
+
+    serializer = serializer_class()
+    model = getattr(getattr(serializer_class, "Meta", None), "model", None)
+    readable = {
+        name: field for name, field in serializer.fields.items() if not field.write_only
+    }
+    fields = None if fields is None else dict(fields)
+    expand = None if expand is None else dict(expand)
+
+    errors = [
+        (param, name, "Unknown field.")
+        for param, tree in [(FIELDS_PARAM, fields), (EXPAND_PARAM, expand)]
+        for name in tree or ()
+        if name not in readable
+    ]
+    attrs = {}
+    kept = []
+    for name, field in readable.items():
+        if fields is not None and name not in fields:
+            if name in serializer_class._declared_fields:
+                attrs[name] = None
+            continue
+        kept.append(name)
+
+        nested_fields = (fields[name] or None) if fields is not None else None
+        if not isinstance(field, serializers.ModelSerializer):
+            if nested_fields:
+                errors.append((FIELDS_PARAM, name, "Has no fields to pick."))
+            if expand and name in expand:
+                errors.append((EXPAND_PARAM, name, "Has no fields to expand."))
+            continue
+
+        id_field = get_id_field(field, model) if model is not None else None
+        if expand is None or name in expand or id_field is None:
+            nested_expand = None if expand is None else expand.get(name, ())
+            try:
+                nested_class = build_sparse_serializer(
+                    type(field), nested_fields, nested_expand
+                )
+            except InvalidPaths as exc:
+                errors += exc.prefixed(name).errors
+                continue
+            if nested_class is not type(field):
+                kwargs = {} if field.source == name else {"source": field.source}
+                attrs[name] = nested_class(read_only=True, **kwargs)
+        elif nested_fields:
+            errors.append(
+                (FIELDS_PARAM, name, "Add it to `expand` to pick its fields.")
+            )
+        else:
+            attrs[name] = id_field
+
+    if errors:
+        raise InvalidPaths(errors)
+
+    if model is not None:
+        write_only = [
+            name for name, field in serializer.fields.items() if field.write_only
+        ]
+        attrs["Meta"] = type(
+            "Meta", (serializer_class.Meta,), {"fields": [*kept, *write_only]}
+        )
+    return type(serializer_class.__name__, (serializer_class,), attrs)
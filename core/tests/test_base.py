@@ -10,3 +10,7 @@ class TestBase:
             assert (
                 field not in output
             ), f"Unexpected field '{field}' found. Output fields: {list(output.keys())}"
+
+    def get_streamed_lines(self, response):
+        content = b"".join(response.streaming_content).decode()
+        return content.splitlines()
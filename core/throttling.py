@@ -0,0 +1,85 @@
+import math
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.throttling import SimpleRateThrottle
+
+
+def get_throttle_cache():
+    return caches[getattr(settings, "THROTTLE_CACHE_ALIAS", "default")]
+
+
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    `SimpleRateThrottle` counting the requests in `buckets` fixed-size
+    counters per key instead of a list of timestamps, so a request costs one
+    atomic `incr()` and one `get_many()` whatever the rate.
+
+    The requests of the sliding window are estimated as the counters of the
+    buckets it covers, the oldest bucket weighted by the part of it still in
+    the window. Every request is counted before being checked and a rejected
+    one is uncounted, so concurrent workers sharing the cache never let more
+    than `num_requests` through.
+    """
+
+    buckets = 10
+
+    def __init__(self):
+        super().__init__()
+        self.cache = get_throttle_cache()
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        bucket_size = self.duration / self.buckets
+        current = int(self.now // bucket_size)
+        # The oldest bucket is only partly in the window.
+        self.elapsed = self.now / bucket_size - current
+        keys = [
+            f"{self.key}:{index}"
+            for index in range(current - self.buckets, current + 1)
+        ]
+
+        count = self.increment(keys[-1], math.ceil(self.duration + bucket_size))
+        previous = self.cache.get_many(keys[:-1])
+        self.counts = [previous.get(key, 0) for key in keys[:-1]] + [count]
+
+        if self.estimate(self.counts, 1 - self.elapsed) > self.num_requests:
+            self.cache.decr(keys[-1])
+            self.counts[-1] -= 1
+            return self.throttle_failure()
+        return True
+
+    def increment(self, key, timeout):
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            if self.cache.add(key, 1, timeout):
+                return 1
+            return self.cache.incr(key)
+
+    def estimate(self, counts, weight):
+        # Rounded, so float errors don't reject a request at the exact `wait()`.
+        return round(counts[0] * weight + sum(counts[1:]), 6)
+
+    def wait(self):
+        """
+        Return the seconds until the window, sliding over the counted
+        requests, leaves room for one more.
+        """
+        bucket_size = self.duration / self.buckets
+        for shift in range(len(self.counts)):
+            counts = self.counts[shift:] + [0] * shift
+            room = self.num_requests - 1 - sum(counts[1:])
+            if room < 0:
+                continue
+            # The oldest bucket weighs 1 at its start down to 0 at its end.
+            weight = min(1, room / counts[0]) if counts[0] else 1
+            return max(0, (shift - self.elapsed + 1 - weight) * bucket_size)
+        return self.duration
@@ -0,0 +1,125 @@
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db.models.query import BaseIterable, NamedValuesListIterable
+from rest_framework import serializers
+
+# Fields whose `to_representation` is a plain type conversion.
+_CONVERTERS = {
+    serializers.CharField: str,
+    serializers.IntegerField: int,
+}
+
+
+def _get_converter(field):
+    if type(field) is serializers.UUIDField and field.uuid_format == "hex_verbose":
+        return str
+    return _CONVERTERS.get(type(field), field.to_representation)
+
+
+# Bounded: sparse serializer classes come and go with the client's paths.
+@lru_cache(maxsize=1024)
+def compile_values_serializer(serializer_class):
+    """
+    Return the `values_list()` paths read by `serializer_class` and a function
+    rendering one row of them exactly like `serializer_class.to_representation`
+    renders the model instance, nested serializers included.
+    """
+    paths = []
+    render = _compile(serializer_class(), "", paths)
+    return tuple(paths), render
+
+
+def _compile(serializer, prefix, paths):
+    model = serializer.Meta.model
+    steps = []
+
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+        try:
+            model_field = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            model_field = None
+        if model_field is None or not model_field.concrete:
+            raise ImproperlyConfigured(
+                f"{type(serializer).__name__}.{field.field_name} is not a model "
+                "column and cannot be rendered from `values_list()`."
+            )
+
+        path = prefix + field.source
+        if isinstance(field, serializers.ModelSerializer):
+            # A null foreign key renders the nested serializer as `None`.
+            null_index = None
+            if model_field.null:
+                paths.append(path)
+                null_index = len(paths) - 1
+            render = _compile(field, path + "__", paths)
+            steps.append((field.field_name, null_index, render, True))
+        else:
+            paths.append(path)
+            steps.append(
+                (field.field_name, len(paths) - 1, _get_converter(field), False)
+            )
+
+    def render_row(row):
+        data = {}
+        for name, index, convert, nested in steps:
+            value = row if nested else row[index]
+            if nested and index is not None and row[index] is None:
+                value = None
+            data[name] = None if value is None else convert(value)
+        return data
+
+    return render_row
+
+
+class ValuesRowIterable(BaseIterable):
+    """
+    Yield named `values_list(*paths)` rows for a model queryset.
+
+    The columns are only selected when the queryset is evaluated, so `count()`
+    and `aggregate()` still run without the joins they need.
+    """
+
+    paths = ()
+
+    def __iter__(self):
+        rows = self.queryset.values_list(*self.paths, named=True)
+        yield from NamedValuesListIterable(
+            rows, chunked_fetch=self.chunked_fetch, chunk_size=self.chunk_size
+        )
+
+
+@lru_cache(maxsize=1024)
+def get_row_iterable_class(paths):
+    return type("ValuesRowIterable", (ValuesRowIterable,), {"paths": paths})
+
+
+class ValuesModelSerializer(serializers.ModelSerializer):
+    """
+    Read-only `ModelSerializer` that can also render the rows of
+    `get_values_queryset()` without instantiating any model, which
+    `SerializerQuerySetMixin` uses on list and retrieve requests.
+
+    Every field, nested serializers included, must map to a model column.
+    """
+
+    @classmethod
+    def get_values_queryset(cls, queryset, extra_paths=()):
+        """
+        Return `queryset` evaluating to named `values_list()` rows holding the
+        columns of the serializer, followed by `extra_paths` (e.g. the ordering
+        fields).
+        """
+        paths, _ = compile_values_serializer(cls)
+        extra = [path for path in dict.fromkeys(extra_paths) if path not in paths]
+        queryset = queryset.all()
+        queryset._iterable_class = get_row_iterable_class((*paths, *extra))
+        return queryset
+
+    def to_representation(self, instance):
+        if isinstance(instance, tuple):
+            _, render = compile_values_serializer(type(self))
+            return render(instance)
+        return super().to_representation(instance)
@@ -54,6 +54,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.middleware.InstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -151,17 +152,24 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.DjangoModelPermissionsOrAnonReadOnly",
     ),
-    "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+    "DEFAULT_AUTHENTICATION_CLASSES": ("core.authentication.CachedJWTAuthentication",),
+    "DEFAULT_RENDERER_CLASSES": (
+        "core.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
     ),
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PARSER_CLASSES": (
+        "core.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+    "DEFAULT_PAGINATION_CLASS": "core.pagination.PageNumberOrKeysetPagination",
     "PAGE_SIZE": 10,
     "DEFAULT_FILTER_BACKENDS": (
         "django_filters.rest_framework.DjangoFilterBackend",
-        "rest_framework.filters.SearchFilter",
+        "core.filters.IndexedSearchFilter",
         "rest_framework.filters.OrderingFilter",
     ),
-    "DEFAULT_THROTTLE_CLASSES": ("rest_framework.throttling.AnonRateThrottle",),
+    "DEFAULT_THROTTLE_CLASSES": ("core.mixins.throttles.AnonRateThrottle",),
     "DEFAULT_THROTTLE_RATES": {
         "anon": "100/hour",
         "general": "1000/hour",
@@ -190,3 +198,30 @@ SPECTACULAR_SETTINGS = {
     "VERSION": "1.0.0",
     "SERVE_INCLUDE_SCHEMA": False,
 }
+
+# Response cache
+RESPONSE_CACHE_ALIAS = "default"
+RESPONSE_CACHE_TIMEOUT = 60
+# Model generations (list ETags) expire after this, in case a write skipped
+# the invalidation.
+RESPONSE_CACHE_VERSION_TIMEOUT = 300
+
+# Authenticated user snapshots
+AUTH_USER_CACHE_ALIAS = "default"
+AUTH_USER_CACHE_TIMEOUT = 60
+
+# Throttle counters. Point it to a cache shared by the workers, e.g.
+# "core.cache_backends.SQLiteCounterCache" on a single host.
+THROTTLE_CACHE_ALIAS = "default"
+
+# Page number pagination: lists past the threshold get an approximate count
+PAGINATION_EXACT_COUNT_THRESHOLD = 10000
+PAGINATION_COUNT_CACHE_TIMEOUT = 30
+
+# Purge of soft-deleted rows (`manage.py purge_deleted`)
+PURGE_RETENTION_DAYS = 90
+PURGE_ARCHIVE_DIR = BASE_DIR / "archive"
+
+# Request instrumentation
+SERVER_TIMING_HEADER = DEBUG
+QUERY_BUDGETS = {}
@@ -1,6 +1,26 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_migrate, post_save
 
 
 class RosterConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'roster'
+
+    def ready(self):
+        from core.cache import invalidate_on_write
+        from core.counters import count_on_create, count_on_delete, counters_adjusted
+        from core.search import install_search_triggers_on_migrate
+
+        from .models import Comment, Player, Team
+        from .stats import count_on_adjust
+
+        post_migrate.connect(install_search_triggers_on_migrate, sender=self)
+
+        for model in (Comment, Player, Team):
+            post_save.connect(invalidate_on_write, sender=model)
+            post_delete.connect(invalidate_on_write, sender=model)
+
+        for model in (Comment, Player):
+            post_save.connect(count_on_create, sender=model)
+            post_delete.connect(count_on_delete, sender=model)
+            counters_adjusted.connect(count_on_adjust, sender=model)
@@ -1,13 +1,20 @@
 from django_filters import rest_framework as filters
 
-from core.filters import BaseFilterSet
+from core.filters import BaseFilterSet, IndexedCharFilter, YearFilter
 
-from .models import Comment, Player, Team
+from .models import (
+    Comment,
+    Player,
+    PlayerCommentStat,
+    SportCommenterStat,
+    Team,
+    TeamPlayerStat,
+)
 
 
 class TeamFilter(BaseFilterSet):
     sport = filters.ChoiceFilter(field_name="sport", choices=Team.SportChoice)
-    name = filters.CharFilter(field_name="name", lookup_expr="icontains")
+    name = IndexedCharFilter(field_name="name")
 
     class Meta:
         model = Team
@@ -15,9 +22,9 @@ class TeamFilter(BaseFilterSet):
 
 
 class PlayerFilter(BaseFilterSet):
-    team_name = filters.CharFilter(field_name="team__name", lookup_expr="icontains")
-    first_name = filters.CharFilter(field_name="first_name", lookup_expr="icontains")
-    last_name = filters.CharFilter(field_name="last_name", lookup_expr="icontains")
+    team_name = IndexedCharFilter(field_name="team__name")
+    first_name = IndexedCharFilter(field_name="first_name")
+    last_name = IndexedCharFilter(field_name="last_name")
 
     class Meta:
         model = Player
@@ -25,16 +32,43 @@ class PlayerFilter(BaseFilterSet):
 
 
 class CommentFilter(BaseFilterSet):
-    user_username = filters.CharFilter(
-        field_name="user__username", lookup_expr="icontains"
-    )
-    player_first_name = filters.CharFilter(
-        field_name="player__first_name", lookup_expr="icontains"
-    )
-    player_last_name = filters.CharFilter(
-        field_name="player__last_name", lookup_expr="icontains"
-    )
+    user_username = IndexedCharFilter(field_name="user__username")
+    player_first_name = IndexedCharFilter(field_name="player__first_name")
+    player_last_name = IndexedCharFilter(field_name="player__last_name")
 
     class Meta:
         model = Comment
         fields = []
+
+
+# The rollups take the year filters of `BaseFilterSet` on their day or month.
+class PlayerCommentStatFilter(filters.FilterSet):
+    created_at_year_gte = YearFilter(field_name="day", lookup_expr="gte")
+    created_at_year_lte = YearFilter(field_name="day", lookup_expr="lte")
+    player = filters.UUIDFilter(field_name="player_id")
+    team = filters.UUIDFilter(field_name="player__team_id")
+
+    class Meta:
+        model = PlayerCommentStat
+        fields = []
+
+
+class TeamPlayerStatFilter(filters.FilterSet):
+    created_at_year_gte = YearFilter(field_name="month", lookup_expr="gte")
+    created_at_year_lte = YearFilter(field_name="month", lookup_expr="lte")
+    team = filters.UUIDFilter(field_name="team_id")
+    sport = filters.ChoiceFilter(field_name="team__sport", choices=Team.SportChoice)
+
+    class Meta:
+        model = TeamPlayerStat
+        fields = []
+
+
+class SportCommenterStatFilter(filters.FilterSet):
+    created_at_year_gte = YearFilter(field_name="month", lookup_expr="gte")
+    created_at_year_lte = YearFilter(field_name="month", lookup_expr="lte")
+    sport = filters.ChoiceFilter(field_name="sport", choices=Team.SportChoice)
+
+    class Meta:
+        model = SportCommenterStat
+        fields = []
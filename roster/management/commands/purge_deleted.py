@@ -0,0 +1,94 @@
+import os
+import time
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.purge import Checkpoint, purge_batch
+
+# Children first: a parent is only purged once no soft-deletable row points to it.
+PURGE_MODELS = (
+    "roster.Comment",
+    "roster.Player",
+    "roster.Team",
+    "user_account.UserAccount",
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Archive the rows soft-deleted longer ago than the retention to gzipped "
+        "JSON Lines files (readable by `loaddata`), then delete them, in "
+        "batches. An interrupted run resumes from its checkpoint."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=settings.PURGE_RETENTION_DAYS,
+            help="Purge rows soft-deleted more than this many days ago.",
+        )
+        parser.add_argument(
+            "--archive-dir",
+            default=settings.PURGE_ARCHIVE_DIR,
+            help="Directory of the archive files and the checkpoint.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows archived and deleted per transaction.",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.1,
+            help="Seconds to wait between batches, to leave room for requests.",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore the checkpoint of an interrupted run.",
+        )
+
+    def handle(self, *args, **options):
+        archive_dir = options["archive_dir"]
+        os.makedirs(archive_dir, exist_ok=True)
+
+        path = os.path.join(archive_dir, "checkpoint.json")
+        if options["restart"]:
+            Checkpoint(path, None).clear()
+        cutoff = timezone.now() - timedelta(days=options["retention_days"])
+        checkpoint = Checkpoint.load(path, cutoff)
+        self.stdout.write(f"Purging rows deleted before {checkpoint.cutoff}")
+
+        for label in PURGE_MODELS:
+            model = apps.get_model(label)
+            position = checkpoint.get_position(model)
+            purged = 0
+            started = time.monotonic()
+            while True:
+                count, position = purge_batch(
+                    model,
+                    checkpoint.cutoff,
+                    archive_dir,
+                    options["batch_size"],
+                    after=position,
+                )
+                if not count:
+                    break
+                purged += count
+                checkpoint.save(model, position)
+                time.sleep(options["sleep"])
+
+            elapsed = time.monotonic() - started
+            rate = purged / elapsed if elapsed else 0
+            self.stdout.write(
+                f"{model._meta.label}: {purged} row(s) purged ({rate:.1f} row(s)/s)"
+            )
+
+        checkpoint.clear()
@@ -0,0 +1,27 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.cache import invalidate_models
+from core.counters import rebuild_counter
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount the denormalized counters (`Team.player_count`, "
+        "`Player.comment_count`, `UserAccount.comment_count`) from the rows "
+        "that are not soft-deleted."
+    )
+
+    def handle(self, *args, **options):
+        for model in apps.get_models():
+            for fk_name, counter in getattr(model, "PARENT_COUNTERS", {}).items():
+                parent_model = model._meta.get_field(fk_name).related_model
+                with transaction.atomic():
+                    fixed = rebuild_counter(parent_model, counter, model, fk_name)
+                if fixed:
+                    # `QuerySet.update()` sends no signals.
+                    invalidate_models(parent_model)
+
+                label = f"{parent_model._meta.label}.{counter}"
+                self.stdout.write(f"{label}: {fixed} row(s) fixed")
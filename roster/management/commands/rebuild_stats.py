@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.cache import invalidate_models
+from roster.stats import rebuild_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the statistics rollups (`PlayerCommentStat`, "
+        "`TeamPlayerStat`, `SportCommenterStat`) from the rows that are not "
+        "soft-deleted."
+    )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            rows = rebuild_stats()
+        # The rollups are replaced with `bulk_create`, which sends no signals.
+        invalidate_models(*rows)
+
+        for model, count in rows.items():
+            self.stdout.write(f"{model._meta.label}: {count} row(s)")
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:25
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def rebuild_counter(parent_model, counter, child_model, fk_name):
+    active_children = (
+        child_model._base_manager.filter(
+            **{fk_name: models.OuterRef("pk"), "deleted_at__isnull": True}
+        )
+        .order_by()
+        .values(fk_name)
+        .annotate(count=models.Count("pk"))
+        .values("count")
+    )
+    parent_model._base_manager.update(
+        **{counter: Coalesce(models.Subquery(active_children), 0)}
+    )
+
+
+def rebuild_counters(apps, schema_editor):
+    Team = apps.get_model("roster", "Team")
+    Player = apps.get_model("roster", "Player")
+    Comment = apps.get_model("roster", "Comment")
+
+    rebuild_counter(Team, "player_count", Player, "team")
+    rebuild_counter(Player, "comment_count", Comment, "player")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("roster", "0006_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="player",
+            name="comment_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of comments on the player that are not deleted",
+                verbose_name="comment count",
+            ),
+        ),
+        migrations.AddField(
+            model_name="team",
+            name="player_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of players of the team that are not deleted",
+                verbose_name="player count",
+            ),
+        ),
+        migrations.RunPython(rebuild_counters, migrations.RunPython.noop),
+    ]
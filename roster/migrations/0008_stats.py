@@ -0,0 +1,210 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:07
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import TruncDate, TruncMonth
+
+BATCH_SIZE = 1000
+
+
+def insert_rows(model, rows):
+    batch = []
+    for row in rows.iterator(chunk_size=BATCH_SIZE):
+        batch.append(model(**row))
+        if len(batch) == BATCH_SIZE:
+            model._base_manager.bulk_create(batch)
+            batch = []
+    if batch:
+        model._base_manager.bulk_create(batch)
+
+
+def rebuild_rollups(apps, schema_editor):
+    Comment = apps.get_model("roster", "Comment")
+    Player = apps.get_model("roster", "Player")
+    month = TruncMonth("created_at", output_field=models.DateField())
+
+    comments = Comment._base_manager.filter(deleted_at__isnull=True).order_by()
+    players = Player._base_manager.filter(deleted_at__isnull=True).order_by()
+
+    insert_rows(
+        apps.get_model("roster", "PlayerCommentStat"),
+        comments.annotate(day=TruncDate("created_at"))
+        .values("player_id", "day")
+        .annotate(comment_count=models.Count("pk")),
+    )
+    insert_rows(
+        apps.get_model("roster", "TeamPlayerStat"),
+        players.annotate(month=month)
+        .values("team_id", "month")
+        .annotate(player_count=models.Count("pk")),
+    )
+    insert_rows(
+        apps.get_model("roster", "SportCommenterStat"),
+        comments.annotate(sport=models.F("player__team__sport"), month=month)
+        .values("user_id", "sport", "month")
+        .annotate(comment_count=models.Count("pk")),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("roster", "0007_counters"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PlayerCommentStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField(verbose_name="day")),
+                (
+                    "comment_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of comments posted that day that are not deleted",
+                        verbose_name="comment count",
+                    ),
+                ),
+                (
+                    "player",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="comment_stats",
+                        to="roster.player",
+                        verbose_name="player_id",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["day"], name="player_comment_stat_day_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("player", "day"), name="player_comment_stat_unique"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="SportCommenterStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "sport",
+                    models.CharField(
+                        choices=[
+                            ("baseball", "Baseball"),
+                            ("football", "Football"),
+                            ("basketball", "Basketball"),
+                        ],
+                        max_length=50,
+                        verbose_name="sport_name",
+                    ),
+                ),
+                (
+                    "month",
+                    models.DateField(
+                        help_text="First day of the month", verbose_name="month"
+                    ),
+                ),
+                (
+                    "comment_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of comments posted that month that are not deleted",
+                        verbose_name="comment count",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="sport_stats",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="user_id",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["month", "sport"], name="sport_commenter_stat_month_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("sport", "month", "user"),
+                        name="sport_commenter_stat_unique",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="TeamPlayerStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "month",
+                    models.DateField(
+                        help_text="First day of the month", verbose_name="month"
+                    ),
+                ),
+                (
+                    "player_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of players added that month that are not deleted",
+                        verbose_name="player count",
+                    ),
+                ),
+                (
+                    "team",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="player_stats",
+                        to="roster.team",
+                        verbose_name="team_id",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["month"], name="team_player_stat_month_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("team", "month"), name="team_player_stat_unique"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(rebuild_rollups, migrations.RunPython.noop),
+    ]
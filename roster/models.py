@@ -1,9 +1,9 @@
 from uuid import uuid4
 
 from django.db import models
-from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from core.soft_delete import restore, soft_delete
 from core.validators import only_letters_numerics_validator, only_letters_validator
 
 
@@ -43,13 +43,41 @@ class Player(models.Model):
         blank=True,
         help_text=_("Timestamp of when the player was deleted"),
     )
+    comment_count = models.PositiveIntegerField(
+        _("comment count"),
+        default=0,
+        editable=False,
+        help_text=_("Number of comments on the player that are not deleted"),
+    )
+
+    SEARCH_FIELDS = ["first_name", "last_name"]
+    # Counter field of each parent kept equal to its number of active players.
+    PARENT_COUNTERS = {"team": "player_count"}
+    # Descendants soft-deleted and restored along with the player.
+    SOFT_DELETE_CASCADE = ("comments",)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="player_active_created_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            models.Index(fields=["team", "created_at"], name="player_team_created_idx"),
+        ]
 
     def __str__(self):
         return self.first_name + self.last_name
 
     def soft_delete(self):
-        self.deleted_at = timezone.now()
-        self.save(update_fields=["deleted_at"])
+        """Soft-delete the player and its `SOFT_DELETE_CASCADE` descendants."""
+        soft_delete(type(self)._base_manager.filter(pk=self.pk))
+        self.refresh_from_db(fields=["deleted_at", "updated_at"])
+
+    def restore(self):
+        """Restore the player and the descendants soft-deleted along with it."""
+        restore(type(self)._base_manager.filter(pk=self.pk))
+        self.refresh_from_db(fields=["deleted_at", "updated_at"])
 
     @property
     def is_deleted(self):
@@ -89,13 +117,38 @@ class Team(models.Model):
         blank=True,
         help_text=_("Timestamp of when the team was deleted"),
     )
+    player_count = models.PositiveIntegerField(
+        _("player count"),
+        default=0,
+        editable=False,
+        help_text=_("Number of players of the team that are not deleted"),
+    )
+
+    SEARCH_FIELDS = ["name"]
+    # Descendants soft-deleted and restored along with the team.
+    SOFT_DELETE_CASCADE = ("players", "players__comments")
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="team_active_created_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
     def soft_delete(self):
-        self.deleted_at = timezone.now()
-        self.save(update_fields=["deleted_at"])
+        """Soft-delete the team and its `SOFT_DELETE_CASCADE` descendants."""
+        soft_delete(type(self)._base_manager.filter(pk=self.pk))
+        self.refresh_from_db(fields=["deleted_at", "updated_at"])
+
+    def restore(self):
+        """Restore the team and the descendants soft-deleted along with it."""
+        restore(type(self)._base_manager.filter(pk=self.pk))
+        self.refresh_from_db(fields=["deleted_at", "updated_at"])
 
     @property
     def is_deleted(self):
@@ -135,14 +188,124 @@ class Comment(models.Model):
         help_text=_("Timestamp of when the comment was deleted"),
     )
 
+    SEARCH_FIELDS = ["body"]
+    # Counter field of each parent kept equal to its number of active comments.
+    PARENT_COUNTERS = {"player": "comment_count", "user": "comment_count"}
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="comment_active_created_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            models.Index(
+                fields=["player", "created_at"], name="comment_player_created_idx"
+            ),
+            models.Index(
+                fields=["user", "created_at"], name="comment_user_created_idx"
+            ),
+        ]
+
     def __str__(self):
         return self.body[:100] + "..." if len(self.body) > 100 else self.body
 
     def soft_delete(self):
-        self.deleted_at = timezone.now()
-        self.save(update_fields=["deleted_at"])
+        """Soft-delete the comment, unless it already is."""
+        soft_delete(type(self)._base_manager.filter(pk=self.pk))
+        self.refresh_from_db(fields=["deleted_at", "updated_at"])
+
+    def restore(self):
+        """Restore the comment."""
+        restore(type(self)._base_manager.filter(pk=self.pk))
+        self.refresh_from_db(fields=["deleted_at", "updated_at"])
 
     @property
     def is_deleted(self):
         """Whether the comment is logically deleted."""
         return self.deleted_at is not None
+
+
+class PlayerCommentStat(models.Model):
+    """Comments posted on a player per day, kept up to date by `roster.stats`."""
+
+    player = models.ForeignKey(
+        "Player",
+        on_delete=models.CASCADE,
+        related_name="comment_stats",
+        verbose_name=_("player_id"),
+    )
+    day = models.DateField(_("day"))
+    comment_count = models.PositiveIntegerField(
+        _("comment count"),
+        default=0,
+        help_text=_("Number of comments posted that day that are not deleted"),
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["player", "day"], name="player_comment_stat_unique"
+            ),
+        ]
+        indexes = [models.Index(fields=["day"], name="player_comment_stat_day_idx")]
+
+
+class TeamPlayerStat(models.Model):
+    """Players added to a team per month, kept up to date by `roster.stats`."""
+
+    team = models.ForeignKey(
+        "Team",
+        on_delete=models.CASCADE,
+        related_name="player_stats",
+        verbose_name=_("team_id"),
+    )
+    month = models.DateField(_("month"), help_text=_("First day of the month"))
+    player_count = models.PositiveIntegerField(
+        _("player count"),
+        default=0,
+        help_text=_("Number of players added that month that are not deleted"),
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["team", "month"], name="team_player_stat_unique"
+            ),
+        ]
+        indexes = [models.Index(fields=["month"], name="team_player_stat_month_idx")]
+
+
+class SportCommenterStat(models.Model):
+    """
+    Comments posted by a user on the players of a sport per month, kept up to
+    date by `roster.stats`. The users with comments are the active commenters.
+    """
+
+    sport = models.CharField(
+        _("sport_name"), max_length=50, choices=Team.SportChoice.choices
+    )
+    month = models.DateField(_("month"), help_text=_("First day of the month"))
+    user = models.ForeignKey(
+        "user_account.UserAccount",
+        on_delete=models.CASCADE,
+        related_name="sport_stats",
+        verbose_name=_("user_id"),
+    )
+    comment_count = models.PositiveIntegerField(
+        _("comment count"),
+        default=0,
+        help_text=_("Number of comments posted that month that are not deleted"),
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["sport", "month", "user"], name="sport_commenter_stat_unique"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["month", "sport"], name="sport_commenter_stat_month_idx"
+            )
+        ]
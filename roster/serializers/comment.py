@@ -1,16 +1,27 @@
+from django.db import transaction
 from rest_framework import serializers
 
+from core.bulk_serializers import (
+    BulkCreateListSerializer,
+    BulkPrimaryKeyRelatedField,
+    BulkUpdateListSerializer,
+)
+from core.counters import move_counters, move_many_counters
 from core.nested_serializers import PlayerNestedSerializer, UserAccountNestedSerializer
+from core.patch_serializers import PatchModelSerializer
+from core.values_serializers import ValuesModelSerializer
 from roster.models import Comment, Player
+from roster.stats import move_many_stats, move_stats
 
 
 # ==================================================
 # Comment
 # ==================================================
 class CommentCreateSerializer(serializers.ModelSerializer):
-    player_id = serializers.PrimaryKeyRelatedField(
+    player_id = BulkPrimaryKeyRelatedField(
         source="player",  # field name (FK) on Comment model
-        queryset=Player.objects.all(),
+        # The team is rendered by `player` and gives the sport of the stats.
+        queryset=Player.objects.select_related("team"),
         write_only=True,
     )
 
@@ -20,9 +31,10 @@ class CommentCreateSerializer(serializers.ModelSerializer):
         model = Comment
         fields = ["id", "body", "created_at", "player", "player_id"]
         read_only_fields = ["id", "created_at", "player"]
+        list_serializer_class = BulkCreateListSerializer
 
 
-class CommentListRetrievePublicSerializer(serializers.ModelSerializer):
+class CommentListRetrievePublicSerializer(ValuesModelSerializer):
     player = PlayerNestedSerializer(read_only=True)
     user = UserAccountNestedSerializer(read_only=True)
 
@@ -32,7 +44,7 @@ class CommentListRetrievePublicSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "body", "created_at", "updated_at", "player", "user"]
 
 
-class CommentListRetrieveAdminSerializer(serializers.ModelSerializer):
+class CommentListRetrieveAdminSerializer(ValuesModelSerializer):
     player = PlayerNestedSerializer(read_only=True)
     user = UserAccountNestedSerializer(read_only=True)
 
@@ -58,8 +70,8 @@ class CommentListRetrieveAdminSerializer(serializers.ModelSerializer):
         ]
 
 
-class CommentPatchSerializer(serializers.ModelSerializer):
-    player_id = serializers.PrimaryKeyRelatedField(
+class CommentPatchSerializer(PatchModelSerializer):
+    player_id = BulkPrimaryKeyRelatedField(
         source="player",  # field name (FK) on Comment model
         queryset=Player.objects.all(),
         write_only=True,
@@ -71,3 +83,14 @@ class CommentPatchSerializer(serializers.ModelSerializer):
         model = Comment
         fields = ["id", "body", "created_at", "updated_at", "player", "player_id"]
         read_only_fields = ["id", "created_at", "updated_at", "player"]
+        list_serializer_class = BulkUpdateListSerializer
+
+    def update(self, instance, validated_data):
+        with transaction.atomic():
+            move_counters(instance, validated_data)
+            move_stats(instance, validated_data)
+            return super().update(instance, validated_data)
+
+    def move_many(self, pairs):
+        move_many_counters(pairs)
+        move_many_stats(pairs)
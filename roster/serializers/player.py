@@ -1,14 +1,24 @@
+from django.db import transaction
 from rest_framework import serializers
 
+from core.bulk_serializers import (
+    BulkCreateListSerializer,
+    BulkPrimaryKeyRelatedField,
+    BulkUpdateListSerializer,
+)
+from core.counters import move_counters, move_many_counters
 from core.nested_serializers import TeamNestedSerializer, UserAccountNestedSerializer
+from core.patch_serializers import PatchModelSerializer
+from core.values_serializers import ValuesModelSerializer
 from roster.models import Comment, Player, Team
+from roster.stats import move_many_stats, move_stats
 
 
 # ==================================================
 # Player
 # ==================================================
 class PlayerCreateSerializer(serializers.ModelSerializer):
-    team_id = serializers.PrimaryKeyRelatedField(
+    team_id = BulkPrimaryKeyRelatedField(
         source="team",  # field name (FK) on Player model
         queryset=Team.objects.all(),
         write_only=True,
@@ -20,18 +30,33 @@ class PlayerCreateSerializer(serializers.ModelSerializer):
         model = Player
         fields = ["id", "first_name", "last_name", "created_at", "team", "team_id"]
         read_only_fields = ["id", "created_at", "team"]
+        list_serializer_class = BulkCreateListSerializer
 
 
-class PlayerListRetrievePublicSerializer(serializers.ModelSerializer):
+class PlayerListRetrievePublicSerializer(ValuesModelSerializer):
     team = TeamNestedSerializer(read_only=True)
 
     class Meta:
         model = Player
-        fields = ["id", "first_name", "last_name", "created_at", "team"]
-        read_only_fields = ["id", "first_name", "last_name", "created_at", "team"]
+        fields = [
+            "id",
+            "first_name",
+            "last_name",
+            "created_at",
+            "comment_count",
+            "team",
+        ]
+        read_only_fields = [
+            "id",
+            "first_name",
+            "last_name",
+            "created_at",
+            "comment_count",
+            "team",
+        ]
 
 
-class PlayerListRetrieveAdminSerializer(serializers.ModelSerializer):
+class PlayerListRetrieveAdminSerializer(ValuesModelSerializer):
     team = TeamNestedSerializer(read_only=True)
 
     class Meta:
@@ -41,6 +66,7 @@ class PlayerListRetrieveAdminSerializer(serializers.ModelSerializer):
             "first_name",
             "last_name",
             "created_at",
+            "comment_count",
             "updated_at",
             "deleted_at",
             "team",
@@ -50,14 +76,15 @@ class PlayerListRetrieveAdminSerializer(serializers.ModelSerializer):
             "first_name",
             "last_name",
             "created_at",
+            "comment_count",
             "updated_at",
             "deleted_at",
             "team",
         ]
 
 
-class PlayerPatchSerializer(serializers.ModelSerializer):
-    team_id = serializers.PrimaryKeyRelatedField(
+class PlayerPatchSerializer(PatchModelSerializer):
+    team_id = BulkPrimaryKeyRelatedField(
         source="team",  # field name (FK) on Player model
         queryset=Team.objects.all(),
         write_only=True,
@@ -77,12 +104,23 @@ class PlayerPatchSerializer(serializers.ModelSerializer):
             "team_id",
         ]
         read_only_fields = read_only_fields = ["id", "created_at", "updated_at", "team"]
+        list_serializer_class = BulkUpdateListSerializer
+
+    def update(self, instance, validated_data):
+        with transaction.atomic():
+            move_counters(instance, validated_data)
+            move_stats(instance, validated_data)
+            return super().update(instance, validated_data)
+
+    def move_many(self, pairs):
+        move_many_counters(pairs)
+        move_many_stats(pairs)
 
 
 # ==================================================
 # PlayerComment
 # ==================================================
-class PlayerCommentListPublicSerializer(serializers.ModelSerializer):
+class PlayerCommentListPublicSerializer(ValuesModelSerializer):
     user = UserAccountNestedSerializer(read_only=True)
 
     class Meta:
@@ -91,7 +129,7 @@ class PlayerCommentListPublicSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "body", "created_at", "updated_at", "user"]
 
 
-class PlayerCommentListAdminSerializer(serializers.ModelSerializer):
+class PlayerCommentListAdminSerializer(ValuesModelSerializer):
     user = UserAccountNestedSerializer(read_only=True)
 
     class Meta:
@@ -0,0 +1,35 @@
+from rest_framework import serializers
+
+from roster.models import PlayerCommentStat, Team, TeamPlayerStat
+
+
+# ==================================================
+# PlayerCommentStat
+# ==================================================
+class PlayerCommentStatSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = PlayerCommentStat
+        fields = ["player", "day", "comment_count"]
+        read_only_fields = ["player", "day", "comment_count"]
+
+
+# ==================================================
+# TeamPlayerStat
+# ==================================================
+class TeamPlayerStatSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = TeamPlayerStat
+        fields = ["team", "month", "player_count"]
+        read_only_fields = ["team", "month", "player_count"]
+
+
+# ==================================================
+# SportCommenterStat
+# ==================================================
+class SportCommenterStatSerializer(serializers.Serializer):
+    """Active commenters of a sport in a month, aggregated over the users."""
+
+    sport = serializers.ChoiceField(choices=Team.SportChoice.choices, read_only=True)
+    month = serializers.DateField(read_only=True)
+    active_commenters = serializers.IntegerField(read_only=True)
+    comment_count = serializers.IntegerField(source="total_comments", read_only=True)
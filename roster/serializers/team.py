@@ -1,6 +1,11 @@
+from django.db import transaction
 from rest_framework import serializers
 
+from core.bulk_serializers import BulkCreateListSerializer, BulkUpdateListSerializer
+from core.patch_serializers import PatchModelSerializer
+from core.values_serializers import ValuesModelSerializer
 from roster.models import Player, Team
+from roster.stats import move_many_stats, move_stats
 
 
 # ==================================================
@@ -11,47 +16,66 @@ class TeamCreateSerializer(serializers.ModelSerializer):
         model = Team
         fields = ["id", "name", "sport", "created_at"]
         read_only_fields = ["id", "created_at"]
+        list_serializer_class = BulkCreateListSerializer
 
 
-class TeamListRetrievePublicSerializer(serializers.ModelSerializer):
+class TeamListRetrievePublicSerializer(ValuesModelSerializer):
     class Meta:
         model = Team
-        fields = ["id", "name", "sport", "created_at"]
-        read_only_fields = ["id", "name", "sport", "created_at"]
+        fields = ["id", "name", "sport", "created_at", "player_count"]
+        read_only_fields = ["id", "name", "sport", "created_at", "player_count"]
 
 
-class TeamListRetrieveAdminSerializer(serializers.ModelSerializer):
+class TeamListRetrieveAdminSerializer(ValuesModelSerializer):
     class Meta:
         model = Team
-        fields = ["id", "name", "sport", "created_at", "updated_at", "deleted_at"]
+        fields = [
+            "id",
+            "name",
+            "sport",
+            "created_at",
+            "player_count",
+            "updated_at",
+            "deleted_at",
+        ]
         read_only_fields = [
             "id",
             "name",
             "sport",
             "created_at",
+            "player_count",
             "updated_at",
             "deleted_at",
         ]
 
 
-class TeamPatchSerializer(serializers.ModelSerializer):
+class TeamPatchSerializer(PatchModelSerializer):
     class Meta:
         model = Team
         fields = ["id", "name", "sport", "created_at", "updated_at"]
         read_only_fields = ["id", "created_at", "updated_at"]
+        list_serializer_class = BulkUpdateListSerializer
+
+    def update(self, instance, validated_data):
+        with transaction.atomic():
+            move_stats(instance, validated_data)
+            return super().update(instance, validated_data)
+
+    def move_many(self, pairs):
+        move_many_stats(pairs)
 
 
 # ==================================================
 # TeamPlayer
 # ==================================================
-class TeamPlayerListPublicSerializer(serializers.ModelSerializer):
+class TeamPlayerListPublicSerializer(ValuesModelSerializer):
     class Meta:
         model = Player
         fields = ["id", "first_name", "last_name", "created_at"]
         read_only_fields = ["id", "first_name", "last_name", "created_at"]
 
 
-class TeamPlayerListAdminSerializer(serializers.ModelSerializer):
+class TeamPlayerListAdminSerializer(ValuesModelSerializer):
     class Meta:
         model = Player
         fields = [
@@ -0,0 +1,335 @@
+from collections import Counter, defaultdict
+from copy import copy
+
+from django.db import connection
+from django.db.models import Count, DateField, F, QuerySet, Value
+from django.db.models.functions import Greatest, TruncDate, TruncMonth
+from django.utils import timezone
+
+from core.cache import invalidate_on_write
+
+from .models import (
+    Comment,
+    Player,
+    PlayerCommentStat,
+    SportCommenterStat,
+    TeamPlayerStat,
+)
+
+BATCH_SIZE = 1000
+
+# Key fields of every rollup, the one with the most distinct values first.
+PLAYER_COMMENT_KEY = ("player_id", "day")
+TEAM_PLAYER_KEY = ("team_id", "month")
+SPORT_COMMENTER_KEY = ("user_id", "sport", "month")
+
+
+def get_month(value):
+    return timezone.localdate(value).replace(day=1)
+
+
+def adjust_rollup(model, key_fields, counter, counts):
+    """
+    Add every amount of `counts`, keyed by tuples of `key_fields` values, to
+    `counter` on the matching `model` row, inserting the missing rows.
+
+    Counters never go below zero, so removing rows that were never counted
+    is a no-op.
+    """
+    added = {key: amount for key, amount in counts.items() if amount > 0}
+    removed = {key: amount for key, amount in counts.items() if amount < 0}
+    if not added and not removed:
+        return
+
+    if added:
+        if connection.vendor in ("postgresql", "sqlite"):
+            upsert_rollup(model, key_fields, counter, added)
+        else:
+            model._base_manager.bulk_create(
+                [model(**dict(zip(key_fields, key))) for key in added],
+                batch_size=BATCH_SIZE,
+                ignore_conflicts=True,
+            )
+            update_rollup(model, key_fields, counter, added)
+    update_rollup(model, key_fields, counter, removed)
+
+    # Raw SQL and `QuerySet.update()` send no signals.
+    invalidate_on_write(model)
+
+
+def upsert_rollup(model, key_fields, counter, counts):
+    """
+    Add the positive amounts of `counts` with one `INSERT ... ON CONFLICT DO
+    UPDATE` per batch, which PostgreSQL and SQLite both support.
+    """
+    quote = connection.ops.quote_name
+    table = quote(model._meta.db_table)
+    fields = [model._meta.get_field(name) for name in (*key_fields, counter)]
+    columns = [quote(field.column) for field in fields]
+    keys = ", ".join(columns[:-1])
+    placeholders = f"({', '.join(['%s'] * len(fields))})"
+
+    items = list(counts.items())
+    with connection.cursor() as cursor:
+        for start in range(0, len(items), BATCH_SIZE):
+            batch = items[start : start + BATCH_SIZE]
+            params = [
+                field.get_db_prep_save(value, connection)
+                for key, amount in batch
+                for field, value in zip(fields, (*key, amount))
+            ]
+            cursor.execute(
+                f"INSERT INTO {table} ({', '.join(columns)}) "
+                f"VALUES {', '.join([placeholders] * len(batch))} "
+                f"ON CONFLICT ({keys}) DO UPDATE "
+                f"SET {columns[-1]} = {table}.{columns[-1]} + EXCLUDED.{columns[-1]}",
+                params,
+            )
+
+
+def update_rollup(model, key_fields, counter, counts):
+    """
+    Add the amounts of `counts` to the existing rows, with one `UPDATE` per
+    distinct amount and values of the key fields but the first.
+    """
+    grouped = defaultdict(list)
+    for key, amount in counts.items():
+        grouped[amount, key[1:]].append(key[0])
+    for (amount, rest), firsts in grouped.items():
+        model._base_manager.filter(
+            **{f"{key_fields[0]}__in": firsts},
+            **dict(zip(key_fields[1:], rest)),
+        ).update(**{counter: Greatest(F(counter) + amount, Value(0))})
+
+
+def count_comments(comments, delta):
+    """Add `delta` to the rollups of every comment of `comments`."""
+    sports = {}
+    for comment in comments:
+        if Comment.player.is_cached(comment) and Player.team.is_cached(comment.player):
+            sports[comment.player_id] = comment.player.team.sport
+    uncached = {comment.player_id for comment in comments} - sports.keys()
+    if uncached:
+        sports.update(
+            Player._base_manager.filter(pk__in=uncached).values_list(
+                "pk", "team__sport"
+            )
+        )
+
+    per_player = Counter()
+    per_commenter = Counter()
+    for comment in comments:
+        day = timezone.localdate(comment.created_at)
+        per_player[comment.player_id, day] += delta
+        if comment.player_id in sports:
+            sport = sports[comment.player_id]
+            per_commenter[comment.user_id, sport, day.replace(day=1)] += delta
+
+    adjust_rollup(PlayerCommentStat, PLAYER_COMMENT_KEY, "comment_count", per_player)
+    adjust_rollup(
+        SportCommenterStat, SPORT_COMMENTER_KEY, "comment_count", per_commenter
+    )
+
+
+def count_players(players, delta):
+    """Add `delta` to the rollups of every player of `players`."""
+    per_team = Counter()
+    for player in players:
+        per_team[player.team_id, get_month(player.created_at)] += delta
+
+    adjust_rollup(TeamPlayerStat, TEAM_PLAYER_KEY, "player_count", per_team)
+
+
+def aggregate_counts(rows, key_fields, counter, delta):
+    return {
+        tuple(row[name] for name in key_fields): row[counter] * delta for row in rows
+    }
+
+
+def count_comment_rows(comments, delta):
+    """Add `delta` to the rollups of every comment of the `comments` queryset."""
+    adjust_rollup(
+        PlayerCommentStat,
+        PLAYER_COMMENT_KEY,
+        "comment_count",
+        aggregate_counts(
+            player_comment_rows(comments), PLAYER_COMMENT_KEY, "comment_count", delta
+        ),
+    )
+    adjust_rollup(
+        SportCommenterStat,
+        SPORT_COMMENTER_KEY,
+        "comment_count",
+        aggregate_counts(
+            commenter_rows(comments), SPORT_COMMENTER_KEY, "comment_count", delta
+        ),
+    )
+
+
+def count_player_rows(players, delta):
+    """Add `delta` to the rollups of every player of the `players` queryset."""
+    adjust_rollup(
+        TeamPlayerStat,
+        TEAM_PLAYER_KEY,
+        "player_count",
+        aggregate_counts(
+            team_player_rows(players), TEAM_PLAYER_KEY, "player_count", delta
+        ),
+    )
+
+
+def count_on_adjust(sender, objects, delta, **kwargs):
+    is_queryset = isinstance(objects, QuerySet)
+    if sender is Comment:
+        (count_comment_rows if is_queryset else count_comments)(objects, delta)
+    elif sender is Player:
+        (count_player_rows if is_queryset else count_players)(objects, delta)
+
+
+def move_commenters(comments, old_sport, new_sport):
+    """Move the active `comments` from `old_sport` to `new_sport`."""
+    if old_sport == new_sport:
+        return
+
+    counts = Counter()
+    active = comments.filter(deleted_at__isnull=True)
+    for row in commenter_rows(active, sport=Value(old_sport)):
+        user_id, month, amount = row["user_id"], row["month"], row["comment_count"]
+        counts[user_id, old_sport, month] -= amount
+        counts[user_id, new_sport, month] += amount
+
+    adjust_rollup(SportCommenterStat, SPORT_COMMENTER_KEY, "comment_count", counts)
+
+
+def move_stats(instance, validated_data):
+    """
+    Move the rollups of `instance` to the player, team or sport it is being
+    reassigned to in `validated_data`.
+    """
+    move_many_stats([(instance, validated_data)])
+
+
+def move_many_stats(pairs):
+    """
+    `move_stats()` for `(instance, validated_data)` pairs of one model, with
+    the rollups of all the moves adjusted together.
+    """
+    if not pairs:
+        return
+
+    instance = pairs[0][0]
+    if isinstance(instance, Comment):
+        moves = get_moves(pairs, "player")
+        count_comments([comment for comment, _ in moves], -1)
+        count_comments([moved for _, moved in moves], 1)
+
+    elif isinstance(instance, Player):
+        moves = get_moves(pairs, "team")
+        count_players([player for player, _ in moves], -1)
+        count_players([moved for _, moved in moves], 1)
+
+        pks_by_sports = defaultdict(list)
+        for player, data in pairs:
+            new_team = data.get("team")
+            if new_team is not None and new_team.pk != player.team_id:
+                pks_by_sports[player.team.sport, new_team.sport].append(player.pk)
+        for (old_sport, new_sport), pks in pks_by_sports.items():
+            move_commenters(
+                Comment._base_manager.filter(player__in=pks), old_sport, new_sport
+            )
+
+    else:
+        pks_by_sports = defaultdict(list)
+        for team, data in pairs:
+            if "sport" in data:
+                pks_by_sports[team.sport, data["sport"]].append(team.pk)
+        for (old_sport, new_sport), pks in pks_by_sports.items():
+            move_commenters(
+                Comment._base_manager.filter(player__team__in=pks),
+                old_sport,
+                new_sport,
+            )
+
+
+def get_moves(pairs, fk_name):
+    """
+    Return `(instance, moved copy)` pairs for the active instances reassigned
+    to another `fk_name` parent.
+    """
+    moves = []
+    for instance, data in pairs:
+        parent = data.get(fk_name)
+        if parent is None or parent.pk == getattr(instance, f"{fk_name}_id"):
+            continue
+        if instance.deleted_at is None:
+            moved = copy(instance)
+            setattr(moved, fk_name, parent)
+            moves.append((instance, moved))
+    return moves
+
+
+def player_comment_rows(comments):
+    return (
+        comments.annotate(day=TruncDate("created_at"))
+        .order_by()
+        .values(*PLAYER_COMMENT_KEY)
+        .annotate(comment_count=Count("pk"))
+    )
+
+
+def team_player_rows(players):
+    return (
+        players.annotate(month=TruncMonth("created_at", output_field=DateField()))
+        .order_by()
+        .values(*TEAM_PLAYER_KEY)
+        .annotate(player_count=Count("pk"))
+    )
+
+
+def commenter_rows(comments, sport=F("player__team__sport")):
+    return (
+        comments.annotate(
+            sport=sport,
+            month=TruncMonth("created_at", output_field=DateField()),
+        )
+        .order_by()
+        .values(*SPORT_COMMENTER_KEY)
+        .annotate(comment_count=Count("pk"))
+    )
+
+
+def rebuild_rollup(model, rows):
+    """
+    Replace every row of `model` with `rows`, dicts of its field values.
+    Returns the number of rows inserted.
+    """
+    model._base_manager.all().delete()
+
+    inserted = 0
+    batch = []
+    for row in rows.iterator(chunk_size=BATCH_SIZE):
+        batch.append(model(**row))
+        if len(batch) == BATCH_SIZE:
+            inserted += len(model._base_manager.bulk_create(batch))
+            batch = []
+    if batch:
+        inserted += len(model._base_manager.bulk_create(batch))
+    return inserted
+
+
+def rebuild_stats():
+    """
+    Recompute every rollup from the rows that are not soft-deleted, and
+    return the number of rows of each rollup model.
+    """
+    comments = Comment._base_manager.filter(deleted_at__isnull=True)
+    players = Player._base_manager.filter(deleted_at__isnull=True)
+    return {
+        PlayerCommentStat: rebuild_rollup(
+            PlayerCommentStat, player_comment_rows(comments)
+        ),
+        TeamPlayerStat: rebuild_rollup(TeamPlayerStat, team_player_rows(players)),
+        SportCommenterStat: rebuild_rollup(
+            SportCommenterStat, commenter_rows(comments)
+        ),
+    }
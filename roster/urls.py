@@ -1,13 +1,43 @@
 from django.urls import include, path
 from rest_framework.routers import SimpleRouter
 
-from roster.views import CommentViewSet, PlayerViewSet, TeamViewSet
+from roster.views import (
+    AsyncCommentViewSet,
+    AsyncPlayerViewSet,
+    AsyncTeamViewSet,
+    CommentViewSet,
+    PlayerCommentStatViewSet,
+    PlayerViewSet,
+    SportCommenterStatViewSet,
+    TeamPlayerStatViewSet,
+    TeamViewSet,
+)
 
 router = SimpleRouter()
 router.register(r"teams", TeamViewSet, basename="team")
 router.register(r"players", PlayerViewSet, basename="player")
 router.register(r"comments", CommentViewSet, basename="comment")
+router.register(
+    r"stats/player-comments",
+    PlayerCommentStatViewSet,
+    basename="player_comment_stat",
+)
+router.register(
+    r"stats/team-players", TeamPlayerStatViewSet, basename="team_player_stat"
+)
+router.register(
+    r"stats/sport-commenters",
+    SportCommenterStatViewSet,
+    basename="sport_commenter_stat",
+)
+
+# Read-only variants of the viewsets above, for ASGI servers.
+async_router = SimpleRouter()
+async_router.register(r"teams", AsyncTeamViewSet, basename="async-team")
+async_router.register(r"players", AsyncPlayerViewSet, basename="async-player")
+async_router.register(r"comments", AsyncCommentViewSet, basename="async-comment")
 
 urlpatterns = [
     path("", include(router.urls)),
+    path("async/", include(async_router.urls)),
 ]
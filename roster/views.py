@@ -1,14 +1,41 @@
+from django.db.models import Count, Sum
 from django_filters import rest_framework as django_filters
-from rest_framework import filters, viewsets
+from rest_framework import filters, mixins, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 
+from core.cache import cache_response
+from core.conditional import conditional_response
+from core.filters import IndexedSearchFilter
+from core.mixins.asynchronous import AsyncReadMixin
+from core.mixins.batch import BatchRetrieveMixin
+from core.mixins.bulk import BulkUpdateDestroyMixin
+from core.mixins.caching import CachedResponseMixin
+from core.mixins.conditional import ConditionalResponseMixin
+from core.mixins.export import ExportMixin
+from core.mixins.querysets import SerializerQuerySetMixin, SparseFieldsMixin
 from core.mixins.throttles import UserRoleBasedThrottleMixin
+from core.pagination import ApproximateCountPagination
 from core.permissions import IsAuthenticatedOwner, IsSuperUser
-
-from .filters import CommentFilter, PlayerFilter, TeamFilter
-from .models import Comment, Player, Team
+from user_account.models import UserAccount
+
+from .filters import (
+    CommentFilter,
+    PlayerCommentStatFilter,
+    PlayerFilter,
+    SportCommenterStatFilter,
+    TeamFilter,
+    TeamPlayerStatFilter,
+)
+from .models import (
+    Comment,
+    Player,
+    PlayerCommentStat,
+    SportCommenterStat,
+    Team,
+    TeamPlayerStat,
+)
 from .serializers.comment import (
     CommentCreateSerializer,
     CommentListRetrieveAdminSerializer,
@@ -23,6 +50,11 @@ from .serializers.player import (
     PlayerListRetrievePublicSerializer,
     PlayerPatchSerializer,
 )
+from .serializers.stats import (
+    PlayerCommentStatSerializer,
+    SportCommenterStatSerializer,
+    TeamPlayerStatSerializer,
+)
 from .serializers.team import (
     TeamCreateSerializer,
     TeamListRetrieveAdminSerializer,
@@ -33,16 +65,25 @@ from .serializers.team import (
 )
 
 
-class TeamViewSet(UserRoleBasedThrottleMixin, viewsets.ModelViewSet):
+class TeamViewSet(
+    UserRoleBasedThrottleMixin,
+    CachedResponseMixin,
+    ConditionalResponseMixin,
+    SerializerQuerySetMixin,
+    BulkUpdateDestroyMixin,
+    BatchRetrieveMixin,
+    viewsets.ModelViewSet,
+):
     http_method_names = ["get", "post", "patch", "delete"]
     filter_backends = (
         django_filters.DjangoFilterBackend,
-        filters.SearchFilter,
+        IndexedSearchFilter,
         filters.OrderingFilter,
     )
     filterset_class = TeamFilter
+    cache_models = (Team, Player)
     search_fields = ["name"]
-    ordering_fields = ["name", "created_at"]
+    ordering_fields = ["name", "created_at", "player_count"]
 
     def get_queryset(self):
         if self.request.user.is_staff:
@@ -52,31 +93,40 @@ class TeamViewSet(UserRoleBasedThrottleMixin, viewsets.ModelViewSet):
         return qs.order_by("-created_at")
 
     def get_permissions(self):
-        if self.action in ["create", "partial_update"]:
+        if self.action in ["create", "bulk_create", "partial_update", "bulk_update"]:
             permission_class = [IsAdminUser]
-        elif self.action in ["list", "retrieve", "players"]:
+        elif self.action in ["list", "retrieve", "batch", "players"]:
             permission_class = [AllowAny]
-        elif self.action == "destroy":
+        elif self.action in ["destroy", "bulk_destroy"]:
             permission_class = [IsSuperUser]
         else:
             permission_class = [IsAuthenticated]
         return [permission() for permission in permission_class]
 
     def get_serializer_class(self):
-        if self.action == "create":
+        if self.action in ["create", "bulk_create"]:
             return TeamCreateSerializer
-        elif self.action in ["list", "retrieve"]:
+        elif self.action in ["list", "retrieve", "batch"]:
             if self.request.user.is_staff:
                 return TeamListRetrieveAdminSerializer
             return TeamListRetrievePublicSerializer
-        elif self.action == "partial_update":
+        elif self.action in ["partial_update", "bulk_update"]:
             return TeamPatchSerializer
         return TeamListRetrievePublicSerializer
 
     def perform_destroy(self, instance):
         instance.soft_delete()
 
+    def get_players_queryset(self, team):
+        if self.request.user.is_staff:
+            player_qs = Player.objects.filter(team=team)
+        else:
+            player_qs = Player.objects.filter(team=team, deleted_at__isnull=True)
+        return player_qs.order_by("-created_at")
+
     @action(detail=True, methods=["get"], url_name="players")
+    @cache_response
+    @conditional_response
     def players(self, request, pk=None):
         target_team = self.get_object()
 
@@ -84,12 +134,13 @@ class TeamViewSet(UserRoleBasedThrottleMixin, viewsets.ModelViewSet):
 
         if is_admin:
             serializer_class = TeamPlayerListAdminSerializer
-            player_qs = Player.objects.filter(team=target_team)
         else:
             serializer_class = TeamPlayerListPublicSerializer
-            player_qs = Player.objects.filter(team=target_team, deleted_at__isnull=True)
 
-        players = player_qs.order_by("-created_at")
+        serializer_class = self.get_sparse_serializer_class(serializer_class)
+        players = self.optimize_queryset(
+            self.get_players_queryset(target_team), serializer_class
+        )
 
         page = self.paginate_queryset(players)
         if page is not None:
@@ -101,16 +152,32 @@ class TeamViewSet(UserRoleBasedThrottleMixin, viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class PlayerViewSet(UserRoleBasedThrottleMixin, viewsets.ModelViewSet):
+class PlayerViewSet(
+    UserRoleBasedThrottleMixin,
+    CachedResponseMixin,
+    ConditionalResponseMixin,
+    SerializerQuerySetMixin,
+    BulkUpdateDestroyMixin,
+    BatchRetrieveMixin,
+    ExportMixin,
+    viewsets.ModelViewSet,
+):
     http_method_names = ["get", "post", "patch", "delete"]
     filter_backends = (
         django_filters.DjangoFilterBackend,
-        filters.SearchFilter,
+        IndexedSearchFilter,
         filters.OrderingFilter,
     )
     filterset_class = PlayerFilter
+    cache_models = (Player, Team, Comment, UserAccount)
     search_fields = ["first_name", "last_name", "team__name"]
-    ordering_fields = ["team__name", "first_name", "last_name", "created_at"]
+    ordering_fields = [
+        "team__name",
+        "first_name",
+        "last_name",
+        "created_at",
+        "comment_count",
+    ]
 
     def get_queryset(self):
         if self.request.user.is_staff:
@@ -120,31 +187,40 @@ class PlayerViewSet(UserRoleBasedThrottleMixin, viewsets.ModelViewSet):
         return qs.order_by("-created_at")
 
     def get_permissions(self):
-        if self.action in ["create", "partial_update"]:
+        if self.action in ["create", "bulk_create", "partial_update", "bulk_update"]:
             permission_class = [IsAdminUser]
-        elif self.action in ["list", "retrieve", "comments"]:
+        elif self.action in ["list", "retrieve", "batch", "comments"]:
             permission_class = [AllowAny]
-        elif self.action == "destroy":
+        elif self.action in ["destroy", "bulk_destroy"]:
             permission_class = [IsSuperUser]
         else:
             permission_class = [IsAuthenticated]
         return [permission() for permission in permission_class]
 
     def get_serializer_class(self):
-        if self.action == "create":
+        if self.action in ["create", "bulk_create"]:
             return PlayerCreateSerializer
-        elif self.action in ["list", "retrieve"]:
+        elif self.action in ["list", "retrieve", "batch", "export"]:
             if self.request.user.is_staff:
                 return PlayerListRetrieveAdminSerializer
             return PlayerListRetrievePublicSerializer
-        elif self.action == "partial_update":
+        elif self.action in ["partial_update", "bulk_update"]:
             return PlayerPatchSerializer
         return PlayerListRetrievePublicSerializer
 
     def perform_destroy(self, instance):
         instance.soft_delete()
 
+    def get_comments_queryset(self, player):
+        if self.request.user.is_staff:
+            comment_qs = Comment.objects.filter(player=player)
+        else:
+            comment_qs = Comment.objects.filter(player=player, deleted_at__isnull=True)
+        return comment_qs.order_by("-created_at")
+
     @action(detail=True, url_name="comments")
+    @cache_response
+    @conditional_response
     def comments(self, request, pk=None):
         target_player = self.get_object()
 
@@ -152,14 +228,13 @@ class PlayerViewSet(UserRoleBasedThrottleMixin, viewsets.ModelViewSet):
 
         if is_admin:
             serializer_class = PlayerCommentListAdminSerializer
-            comment_qs = Comment.objects.filter(player=target_player)
         else:
             serializer_class = PlayerCommentListPublicSerializer
-            comment_qs = Comment.objects.filter(
-                player=target_player, deleted_at__isnull=True
-            )
 
-        comments = comment_qs.order_by("-created_at")
+        serializer_class = self.get_sparse_serializer_class(serializer_class)
+        comments = self.optimize_queryset(
+            self.get_comments_queryset(target_player), serializer_class
+        )
 
         page = self.paginate_queryset(comments)
         if page is not None:
@@ -171,14 +246,24 @@ class PlayerViewSet(UserRoleBasedThrottleMixin, viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class CommentViewSet(UserRoleBasedThrottleMixin, viewsets.ModelViewSet):
+class CommentViewSet(
+    UserRoleBasedThrottleMixin,
+    CachedResponseMixin,
+    ConditionalResponseMixin,
+    SerializerQuerySetMixin,
+    BulkUpdateDestroyMixin,
+    BatchRetrieveMixin,
+    ExportMixin,
+    viewsets.ModelViewSet,
+):
     http_method_names = ["get", "post", "patch", "delete"]
     filter_backends = (
         django_filters.DjangoFilterBackend,
-        filters.SearchFilter,
+        IndexedSearchFilter,
         filters.OrderingFilter,
     )
     filterset_class = CommentFilter
+    cache_models = (Comment, Player, Team, UserAccount)
     search_fields = [
         "body",
         "user__username",
@@ -201,26 +286,30 @@ class CommentViewSet(UserRoleBasedThrottleMixin, viewsets.ModelViewSet):
         return qs.order_by("-created_at")
 
     def get_permissions(self):
-        if self.action == "create":
+        if self.action in ["create", "bulk_create"]:
             permission_class = [IsAuthenticated]
-        elif self.action in ["list", "retrieve"]:
+        elif self.action in ["list", "retrieve", "batch"]:
             permission_class = [AllowAny]
         elif self.action == "partial_update":
             permission_class = [IsAdminUser | IsAuthenticatedOwner]
+        elif self.action == "bulk_update":
+            permission_class = [IsAdminUser]
         elif self.action == "destroy":
             permission_class = [IsSuperUser | IsAuthenticatedOwner]
+        elif self.action == "bulk_destroy":
+            permission_class = [IsSuperUser]
         else:
             permission_class = [IsAuthenticated]
         return [permission() for permission in permission_class]
 
     def get_serializer_class(self):
-        if self.action == "create":
+        if self.action in ["create", "bulk_create"]:
             return CommentCreateSerializer
-        elif self.action in ["list", "retrieve"]:
+        elif self.action in ["list", "retrieve", "batch", "export"]:
             if self.request.user.is_staff:
                 return CommentListRetrieveAdminSerializer
             return CommentListRetrievePublicSerializer
-        elif self.action == "partial_update":
+        elif self.action in ["partial_update", "bulk_update"]:
             return CommentPatchSerializer
         return CommentListRetrievePublicSerializer
 
@@ -229,3 +318,106 @@ class CommentViewSet(UserRoleBasedThrottleMixin, viewsets.ModelViewSet):
 
     def perform_destroy(self, instance):
         instance.soft_delete()
+
+
+class AsyncTeamViewSet(AsyncReadMixin, TeamViewSet):
+    @action(detail=True, methods=["get"], url_name="players")
+    @cache_response
+    @conditional_response
+    async def players(self, request, pk=None):
+        target_team = await self.aget_object()
+
+        if request.user.is_staff:
+            serializer_class = TeamPlayerListAdminSerializer
+        else:
+            serializer_class = TeamPlayerListPublicSerializer
+
+        serializer_class = self.get_sparse_serializer_class(serializer_class)
+        players = self.optimize_queryset(
+            self.get_players_queryset(target_team), serializer_class
+        )
+        return await self.alist_queryset(players, serializer_class)
+
+
+class AsyncPlayerViewSet(AsyncReadMixin, PlayerViewSet):
+    @action(detail=True, url_name="comments")
+    @cache_response
+    @conditional_response
+    async def comments(self, request, pk=None):
+        target_player = await self.aget_object()
+
+        if request.user.is_staff:
+            serializer_class = PlayerCommentListAdminSerializer
+        else:
+            serializer_class = PlayerCommentListPublicSerializer
+
+        serializer_class = self.get_sparse_serializer_class(serializer_class)
+        comments = self.optimize_queryset(
+            self.get_comments_queryset(target_player), serializer_class
+        )
+        return await self.alist_queryset(comments, serializer_class)
+
+
+class AsyncCommentViewSet(AsyncReadMixin, CommentViewSet):
+    pass
+
+
+class StatViewSet(
+    UserRoleBasedThrottleMixin,
+    SparseFieldsMixin,
+    mixins.ListModelMixin,
+    viewsets.GenericViewSet,
+):
+    # Subclasses list a rollup of `roster.stats` and set `cache_models` to it.
+    permission_classes = [IsAdminUser]
+    filter_backends = (django_filters.DjangoFilterBackend,)
+    # The rollup rows have no `created_at` for keyset pagination to order on.
+    pagination_class = ApproximateCountPagination
+
+    @cache_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+
+class PlayerCommentStatViewSet(StatViewSet):
+    """Comments per player per day, most recent day first."""
+
+    serializer_class = PlayerCommentStatSerializer
+    filterset_class = PlayerCommentStatFilter
+    cache_models = (PlayerCommentStat,)
+
+    def get_queryset(self):
+        return PlayerCommentStat.objects.filter(comment_count__gt=0).order_by(
+            "-day", "player_id"
+        )
+
+
+class TeamPlayerStatViewSet(StatViewSet):
+    """New players per team per month, most recent month first."""
+
+    serializer_class = TeamPlayerStatSerializer
+    filterset_class = TeamPlayerStatFilter
+    cache_models = (TeamPlayerStat,)
+
+    def get_queryset(self):
+        return TeamPlayerStat.objects.filter(player_count__gt=0).order_by(
+            "-month", "team_id"
+        )
+
+
+class SportCommenterStatViewSet(StatViewSet):
+    """Users with comments on the players of each sport per month."""
+
+    serializer_class = SportCommenterStatSerializer
+    filterset_class = SportCommenterStatFilter
+    cache_models = (SportCommenterStat,)
+
+    def get_queryset(self):
+        return (
+            SportCommenterStat.objects.filter(comment_count__gt=0)
+            .values("sport", "month")
+            .annotate(
+                active_commenters=Count("user_id"), total_comments=Sum("comment_count")
+            )
+            .order_by("-month", "sport")
+        )
@@ -9,6 +9,25 @@ from rest_framework.test import APIClient
 from roster.models import Comment, Player, Team
 from user_account.models import UserAccount
 
+# Queries allowed per request on the read endpoints, whatever the page size.
+QUERY_BUDGETS = {
+    "team-list": 3,
+    "team-players": 5,
+    "player-list": 3,
+    "player-comments": 5,
+    "comment-list": 5,
+    "user_account-list": 3,
+    "user_account-comments": 5,
+    "me_comments": 2,
+    "team-batch": 1,
+    "player-batch": 1,
+    "comment-batch": 1,
+    "user_account-batch": 1,
+    # Creates also add to the `roster.stats` rollups.
+    "POST player-list": 4,
+    "POST comment-list": 6,
+}
+
 
 @pytest.fixture
 def api_client():
@@ -24,6 +43,11 @@ def test_throttle_settings(settings):
     cache.clear()
 
 
+@pytest.fixture(autouse=True)
+def query_budgets(settings):
+    settings.QUERY_BUDGETS = QUERY_BUDGETS
+
+
 @pytest.fixture
 def general_user_data():
     return {
@@ -556,6 +580,16 @@ def user_account_list_url():
     return reverse("user_account-list")
 
 
+@pytest.fixture
+def user_account_export_url():
+    return reverse("user_account-export")
+
+
+@pytest.fixture
+def user_account_batch_url():
+    return reverse("user_account-batch")
+
+
 @pytest.fixture
 def user_account_detail_url():
     def build_url(pk):
@@ -587,6 +621,16 @@ def team_list_url():
     return reverse("team-list")
 
 
+@pytest.fixture
+def team_bulk_create_url():
+    return reverse("team-bulk-create")
+
+
+@pytest.fixture
+def team_batch_url():
+    return reverse("team-batch")
+
+
 @pytest.fixture
 def team_detail_url():
     def build_url(pk):
@@ -608,6 +652,21 @@ def player_list_url():
     return reverse("player-list")
 
 
+@pytest.fixture
+def player_export_url():
+    return reverse("player-export")
+
+
+@pytest.fixture
+def player_bulk_create_url():
+    return reverse("player-bulk-create")
+
+
+@pytest.fixture
+def player_batch_url():
+    return reverse("player-batch")
+
+
 @pytest.fixture
 def player_detail_url():
     def build_url(pk):
@@ -629,9 +688,39 @@ def comment_list_url():
     return reverse("comment-list")
 
 
+@pytest.fixture
+def comment_export_url():
+    return reverse("comment-export")
+
+
+@pytest.fixture
+def comment_batch_url():
+    return reverse("comment-batch")
+
+
+@pytest.fixture
+def comment_bulk_create_url():
+    return reverse("comment-bulk-create")
+
+
 @pytest.fixture
 def comment_detail_url():
     def build_url(pk):
         return reverse("comment-detail", args=[pk])
 
     return build_url
+
+
+@pytest.fixture
+def player_comment_stat_list_url():
+    return reverse("player_comment_stat-list")
+
+
+@pytest.fixture
+def team_player_stat_list_url():
+    return reverse("team_player_stat-list")
+
+
+@pytest.fixture
+def sport_commenter_stat_list_url():
+    return reverse("sport_commenter_stat-list")
@@ -0,0 +1,160 @@
+from uuid import uuid4
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+from django.urls import NoReverseMatch, resolve, reverse
+
+from roster.models import Comment
+
+ENDPOINTS = [
+    ("team-list", None),
+    ("team-detail", "team"),
+    ("team-players", "team"),
+    ("player-list", None),
+    ("player-detail", "player"),
+    ("player-comments", "player"),
+    ("comment-list", None),
+    ("comment-detail", "comment"),
+    ("user_account-list", None),
+    ("user_account-detail", "user"),
+    ("user_account-comments", "user"),
+]
+
+
+def get_parents(comments):
+    comments[1].soft_delete()
+    comment = comments[0]
+    return {
+        "team": comment.player.team,
+        "player": comment.player,
+        "comment": comment,
+        "user": comment.user,
+    }
+
+
+def get_with_queries(client, url, **extra):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url, **extra)
+    return response, len(queries)
+
+
+@pytest.mark.django_db
+class TestAsyncReadViews:
+    @pytest.mark.parametrize("url_name, parent", ENDPOINTS)
+    @pytest.mark.parametrize("is_admin", [False, True])
+    def test_renders_like_the_sync_view(
+        self, api_client, admin_user, comments, url_name, parent, is_admin
+    ):
+        args = [get_parents(comments)[parent].pk] if parent else []
+        if is_admin:
+            api_client.force_authenticate(user=admin_user)
+
+        sync, sync_queries = get_with_queries(api_client, reverse(url_name, args=args))
+        response, queries = get_with_queries(
+            api_client, reverse(f"async-{url_name}", args=args)
+        )
+
+        assert response.status_code == 200
+        assert response.json() == sync.json()
+        assert queries == sync_queries
+
+    def test_me_comments_renders_like_the_sync_view(
+        self, api_client, general_user, comments
+    ):
+        comments[1].soft_delete()
+        api_client.force_authenticate(user=general_user)
+
+        sync = api_client.get(reverse("me_comments"))
+        response = api_client.get(reverse("async-me_comments"))
+
+        assert response.status_code == 200
+        assert response.json() == sync.json()
+        assert response.json()["count"] == len(comments) - 1
+
+    @pytest.mark.parametrize("url_name, parent", ENDPOINTS + [("me_comments", None)])
+    def test_views_are_async(self, url_name, parent):
+        args = [uuid4()] if parent else []
+
+        assert iscoroutinefunction(
+            resolve(reverse(f"async-{url_name}", args=args)).func
+        )
+
+    def test_keyset_pagination(self, api_client, comments):
+        query = "?pagination=cursor"
+
+        sync = api_client.get(reverse("comment-list") + query)
+        response = api_client.get(reverse("async-comment-list") + query)
+
+        assert response.status_code == 200
+        assert response.json()["results"] == sync.json()["results"]
+
+    def test_served_under_asgi(self, settings, comments):
+        settings.SERVER_TIMING_HEADER = True
+        client = AsyncClient()
+
+        response = async_to_sync(client.get)(reverse("async-comment-list"))
+
+        assert response.status_code == 200
+        assert response.json()["count"] == Comment.objects.count()
+        # Count and page, recorded by the instrumentation.
+        assert '"2 queries"' in response["Server-Timing"]
+
+    def test_if_none_match_returns_304(self, api_client, teams):
+        url = reverse("async-team-list")
+        etag = api_client.get(url)["ETag"]
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+
+    def test_second_request_is_served_from_cache(self, api_client, players):
+        url = reverse("async-player-comments", args=[players[0].pk])
+        first = api_client.get(url)
+
+        second, queries = get_with_queries(api_client, url)
+
+        assert (first["X-Cache"], second["X-Cache"]) == ("MISS", "HIT")
+        assert second.json() == first.json()
+        assert queries == 0
+
+    def test_requests_are_throttled(self, api_client, teams):
+        url = reverse("async-team-list")
+        api_client.get(url)
+        api_client.get(url)
+
+        response = api_client.get(url)
+
+        assert response.status_code == 429
+        assert "Retry-After" in response
+
+    def test_me_comments_requires_authentication(self, api_client):
+        response = api_client.get(reverse("async-me_comments"))
+
+        assert response.status_code == 401
+
+    @pytest.mark.parametrize("pk", [uuid4(), "not-a-uuid"])
+    def test_missing_row_returns_404(self, api_client, teams, pk):
+        response = api_client.get(reverse("async-team-players", args=[pk]))
+
+        assert response.status_code == 404
+
+    def test_page_out_of_range_returns_404(self, api_client, teams):
+        response = api_client.get(reverse("async-team-list") + "?page=5")
+
+        assert response.status_code == 404
+
+    def test_writes_are_not_allowed(self, api_client, admin_user, team_data):
+        api_client.force_authenticate(user=admin_user)
+
+        response = api_client.post(reverse("async-team-list"), team_data)
+
+        assert response.status_code == 405
+
+    @pytest.mark.parametrize("basename", ["player", "comment", "user_account"])
+    def test_export_is_not_routed(self, basename):
+        with pytest.raises(NoReverseMatch):
+            reverse(f"async-{basename}-export")
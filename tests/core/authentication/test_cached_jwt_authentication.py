@@ -0,0 +1,150 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.authentication import CachedJWTAuthentication, invalidate_users
+from roster.models import Comment
+from user_account.models import UserAccount
+
+factory = APIRequestFactory()
+
+
+def authenticate(user):
+    request = factory.get(
+        "/", HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}"
+    )
+    authenticated_user, _ = CachedJWTAuthentication().authenticate(request)
+    return authenticated_user
+
+
+def bearer(user):
+    return {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(user)}"}
+
+
+@pytest.mark.django_db
+class TestCachedJWTAuthentication:
+    def test_second_authentication_runs_no_query(self, general_user):
+        with CaptureQueriesContext(connection) as first:
+            authenticate(general_user)
+        with CaptureQueriesContext(connection) as second:
+            user = authenticate(general_user)
+
+        assert len(first) == 1
+        assert len(second) == 0
+        assert user == general_user
+
+    def test_user_holds_snapshot_fields_and_defers_the_others(self, admin_user):
+        user = authenticate(admin_user)
+
+        assert isinstance(user, UserAccount)
+        assert (user.username, user.is_staff, user.is_superuser, user.is_active) == (
+            admin_user.username,
+            True,
+            False,
+            True,
+        )
+        assert user.deleted_at is None
+        assert {"email", "password", "created_at"} <= user.get_deferred_fields()
+
+    def test_snapshot_is_invalidated_when_user_is_saved(self, general_user):
+        authenticate(general_user)
+
+        general_user.is_staff = True
+        general_user.save()
+
+        assert authenticate(general_user).is_staff is True
+
+    def test_snapshot_is_invalidated_when_user_is_soft_deleted(self, general_user):
+        authenticate(general_user)
+
+        general_user.soft_delete()
+
+        assert authenticate(general_user).deleted_at == general_user.deleted_at
+
+    def test_invalidate_users_drops_snapshots_after_queryset_updates(
+        self, general_user
+    ):
+        authenticate(general_user)
+
+        UserAccount.objects.filter(pk=general_user.pk).update(username="renamed")
+        invalidate_users(general_user.pk)
+
+        assert authenticate(general_user).username == "renamed"
+
+    def test_me_renders_the_whole_account(self, api_client, me_url, general_user):
+        response = api_client.get(me_url, **bearer(general_user))
+
+        assert response.status_code == 200
+        assert response.data["email"] == general_user.email
+
+    def test_me_patch_saves_the_account_without_clobbering_deferred_fields(
+        self, api_client, me_url, general_user
+    ):
+        authenticate(general_user)
+        response = api_client.patch(
+            me_url, {"email": "renamed@example.com"}, **bearer(general_user)
+        )
+
+        general_user.refresh_from_db()
+
+        assert response.status_code == 200
+        assert response.data["username"] == general_user.username
+        assert general_user.email == "renamed@example.com"
+        assert general_user.check_password("generalUser123")
+
+    def test_create_comment_for_the_token_user(
+        self, api_client, comment_list_url, comment_data_from_view, general_user
+    ):
+        # Served from the cached snapshot, as the query budgets assume.
+        authenticate(general_user)
+        response = api_client.post(
+            comment_list_url, comment_data_from_view, **bearer(general_user)
+        )
+
+        comment = Comment.objects.get(id=response.data["id"])
+        general_user.refresh_from_db()
+
+        assert response.status_code == 201
+        assert comment.user_id == general_user.id
+        assert general_user.comment_count == 1
+
+    def test_bulk_create_comments_for_the_token_user(
+        self, api_client, comment_bulk_create_url, general_user, players
+    ):
+        data = [
+            {"body": "Bulk Comment 1", "player_id": str(players[0].id)},
+            {"body": "Bulk Comment 2", "player_id": str(players[1].id)},
+        ]
+        authenticate(general_user)
+        response = api_client.post(
+            comment_bulk_create_url, data, format="json", **bearer(general_user)
+        )
+
+        general_user.refresh_from_db()
+
+        assert response.status_code == 201
+        assert Comment.objects.filter(user=general_user).count() == 2
+        assert general_user.comment_count == 2
+
+
+@pytest.mark.django_db
+class TestCachedJWTAuthenticationNegative:
+    def test_fails_for_inactive_user(self, general_user):
+        authenticate(general_user)
+
+        general_user.is_active = False
+        general_user.save()
+
+        with pytest.raises(AuthenticationFailed):
+            authenticate(general_user)
+
+    def test_fails_for_deleted_user(self, general_user):
+        authenticate(general_user)
+
+        UserAccount.objects.filter(pk=general_user.pk).delete()
+
+        with pytest.raises(AuthenticationFailed):
+            authenticate(general_user)
@@ -0,0 +1,115 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core.mixins.batch import BatchRetrieveMixin
+
+MISSING_ID = "00000000-0000-0000-0000-000000000000"
+
+
+def get_batch(api_client, url, ids):
+    return api_client.get(url, {"ids": ",".join(str(pk) for pk in ids)})
+
+
+@pytest.mark.django_db
+class TestBatchRetrieve:
+    # ========================================================================
+    # Positive Cases
+    # ========================================================================
+    def test_returns_rows_in_request_order(self, api_client, player_batch_url, players):
+        ids = [str(players[2].pk), str(players[0].pk), str(players[1].pk)]
+
+        response = get_batch(api_client, player_batch_url, ids)
+
+        assert response.status_code == 200
+        assert list(response.data) == ids
+        assert response.data[ids[0]]["first_name"] == players[2].first_name
+
+    def test_runs_a_single_query(self, api_client, comment_batch_url, comments):
+        with CaptureQueriesContext(connection) as captured:
+            get_batch(api_client, comment_batch_url, [c.pk for c in comments])
+
+        assert len(captured.captured_queries) == 1
+
+    def test_renders_rows_like_retrieve(
+        self, api_client, team_batch_url, team_detail_url, teams
+    ):
+        batch = get_batch(api_client, team_batch_url, [teams[0].pk])
+        detail = api_client.get(team_detail_url(teams[0].pk))
+
+        assert batch.data[str(teams[0].pk)] == detail.data
+
+    def test_maps_missing_ids_to_null(self, api_client, team_batch_url, teams):
+        response = get_batch(api_client, team_batch_url, [MISSING_ID, teams[0].pk])
+
+        assert response.data[MISSING_ID] is None
+        assert response.data[str(teams[0].pk)]["name"] == teams[0].name
+
+    def test_admin_sees_soft_deleted_rows(
+        self, api_client, user_account_batch_url, admin_user, general_user
+    ):
+        general_user.soft_delete()
+        api_client.force_authenticate(user=admin_user)
+
+        response = get_batch(api_client, user_account_batch_url, [general_user.pk])
+
+        assert response.data[str(general_user.pk)]["deleted_at"] is not None
+
+    def test_duplicate_ids_are_returned_once(
+        self, api_client, comment_batch_url, comments
+    ):
+        response = get_batch(
+            api_client, comment_batch_url, [comments[0].pk, comments[0].pk]
+        )
+
+        assert list(response.data) == [str(comments[0].pk)]
+
+    def test_supports_sparse_fields(self, api_client, player_batch_url, players):
+        response = api_client.get(
+            player_batch_url, {"ids": str(players[0].pk), "fields": "last_name"}
+        )
+
+        assert response.data == {str(players[0].pk): {"last_name": "LastNameOne"}}
+
+    def test_ignores_list_filters(self, api_client, player_batch_url, players):
+        response = api_client.get(
+            player_batch_url,
+            {"ids": str(players[0].pk), "search": "no-such-player", "ordering": "x"},
+        )
+
+        assert response.data[str(players[0].pk)]["id"] == str(players[0].pk)
+
+    def test_async_viewset_serves_batch(self, api_client, players):
+        response = get_batch(api_client, reverse("async-player-batch"), [players[0].pk])
+
+        assert response.data[str(players[0].pk)]["id"] == str(players[0].pk)
+
+    # ========================================================================
+    # Negative Cases
+    # ========================================================================
+    def test_hides_soft_deleted_rows_from_general_users(
+        self, api_client, comment_batch_url, general_user, comments
+    ):
+        comments[0].soft_delete()
+        api_client.force_authenticate(user=general_user)
+
+        response = get_batch(api_client, comment_batch_url, [comments[0].pk])
+
+        assert response.data == {str(comments[0].pk): None}
+
+    @pytest.mark.parametrize("ids", ["", "not-a-uuid", f"{MISSING_ID},1"])
+    def test_invalid_ids_return_400(self, api_client, team_batch_url, ids):
+        response = api_client.get(team_batch_url, {"ids": ids})
+
+        assert response.status_code == 400
+        assert "ids" in response.data
+
+    def test_too_many_ids_return_400(self, api_client, team_batch_url, monkeypatch):
+        monkeypatch.setattr(BatchRetrieveMixin, "batch_retrieve_max_ids", 1)
+        ids = [MISSING_ID, "11111111-1111-1111-1111-111111111111"]
+
+        response = get_batch(api_client, team_batch_url, ids)
+
+        assert response.status_code == 400
+        assert response.data["ids"] == ["Enter at most 1 IDs."]
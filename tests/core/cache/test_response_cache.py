@@ -0,0 +1,107 @@
+from uuid import uuid4
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core.cache import invalidate_models, response_cache_stats
+from roster.models import Player
+
+
+@pytest.mark.django_db
+class TestResponseCache:
+    def test_second_request_is_served_from_cache_without_queries(
+        self, api_client, team_list_url, teams
+    ):
+        first = api_client.get(team_list_url)
+
+        with CaptureQueriesContext(connection) as queries:
+            second = api_client.get(team_list_url)
+
+        assert first["X-Cache"] == "MISS"
+        assert second["X-Cache"] == "HIT"
+        assert second.data == first.data
+        assert len(queries) == 0
+
+    def test_query_parameter_order_is_normalized(
+        self, api_client, team_list_url, teams
+    ):
+        api_client.get(team_list_url + "?sport=baseball&ordering=name")
+        response = api_client.get(team_list_url + "?ordering=name&sport=baseball")
+
+        assert response["X-Cache"] == "HIT"
+
+    def test_public_and_admin_responses_are_cached_separately(
+        self, api_client, team_list_url, teams, admin_user
+    ):
+        api_client.get(team_list_url)
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get(team_list_url)
+
+        assert response["X-Cache"] == "MISS"
+        assert "deleted_at" in response.data["results"][0]
+
+    def test_soft_delete_invalidates_cached_list(
+        self, api_client, team_list_url, teams
+    ):
+        api_client.get(team_list_url)
+        teams[0].soft_delete()
+        response = api_client.get(team_list_url)
+
+        ids = [item["id"] for item in response.data["results"]]
+
+        assert response["X-Cache"] == "MISS"
+        assert str(teams[0].id) not in ids
+
+    def test_save_of_nested_model_invalidates_cached_detail(
+        self, api_client, player_detail_url, players
+    ):
+        player = players[0]
+        url = player_detail_url(player.id)
+
+        api_client.get(url)
+        player.team.name = "Renamed Team"
+        player.team.save()
+        response = api_client.get(url)
+
+        assert response["X-Cache"] == "MISS"
+        assert response.data["team"]["name"] == "Renamed Team"
+
+    def test_invalidate_models_invalidates_writes_that_bypass_signals(
+        self, api_client, player_list_url, players
+    ):
+        api_client.get(player_list_url)
+        Player.objects.filter(pk=players[0].pk).update(first_name="Updated")
+        invalidate_models(Player)
+        response = api_client.get(player_list_url)
+
+        first_names = [item["first_name"] for item in response.data["results"]]
+
+        assert response["X-Cache"] == "MISS"
+        assert "Updated" in first_names
+
+    def test_nested_action_is_cached(self, api_client, team_players_url, teams):
+        url = team_players_url(teams[0].id)
+
+        api_client.get(url)
+        response = api_client.get(url)
+
+        assert response["X-Cache"] == "HIT"
+
+    def test_counts_hits_and_misses(self, api_client, team_list_url, teams):
+        hits = response_cache_stats[("team-list", "hit")]
+        misses = response_cache_stats[("team-list", "miss")]
+
+        api_client.get(team_list_url)
+        api_client.get(team_list_url)
+
+        assert response_cache_stats[("team-list", "hit")] == hits + 1
+        assert response_cache_stats[("team-list", "miss")] == misses + 1
+
+    def test_error_responses_are_not_cached(self, api_client, team_detail_url):
+        url = team_detail_url(uuid4())
+        api_client.get(url)
+        response = api_client.get(url)
+
+        assert response.status_code == 404
+        assert "X-Cache" not in response
@@ -0,0 +1,66 @@
+import pytest
+
+from core.cache_backends import SQLiteCounterCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SQLiteCounterCache(str(tmp_path / "cache.sqlite3"), {})
+
+
+class TestSQLiteCounterCache:
+    def test_stores_integers_and_other_values(self, cache):
+        cache.set("count", 3)
+        cache.set("data", {"ids": [1, 2]})
+
+        assert cache.get("count") == 3
+        assert cache.get("data") == {"ids": [1, 2]}
+        assert cache.get("missing", "default") == "default"
+        assert cache.get_many(["count", "data", "missing"]) == {
+            "count": 3,
+            "data": {"ids": [1, 2]},
+        }
+
+    def test_incr_and_decr(self, cache):
+        cache.set("count", 1)
+
+        assert cache.incr("count") == 2
+        assert cache.incr("count", 10) == 12
+        assert cache.decr("count") == 11
+
+    def test_incr_fails_for_missing_key(self, cache):
+        with pytest.raises(ValueError):
+            cache.incr("missing")
+
+    def test_add_only_sets_missing_or_expired_keys(self, cache):
+        assert cache.add("live", 1) is True
+        assert cache.add("live", 2) is False
+        cache.set("expired", 1, timeout=0)
+
+        assert cache.add("expired", 2) is True
+        assert cache.get_many(["live", "expired"]) == {"live": 1, "expired": 2}
+
+    def test_expired_keys_are_missing(self, cache):
+        cache.set("expired", 1, timeout=0)
+
+        assert cache.get("expired") is None
+        assert cache.has_key("expired") is False
+        assert cache.touch("expired") is False
+        with pytest.raises(ValueError):
+            cache.incr("expired")
+
+    def test_delete_and_clear(self, cache):
+        cache.set_many({"a": 1, "b": 2, "c": None})
+
+        assert cache.has_key("c") is True
+        assert cache.delete("a") is True
+        assert cache.delete("a") is False
+        cache.clear()
+        assert cache.get_many(["a", "b", "c"]) == {}
+
+    def test_is_shared_between_instances(self, cache, tmp_path):
+        other = SQLiteCounterCache(str(tmp_path / "cache.sqlite3"), {})
+        cache.set("count", 1)
+        other.incr("count")
+
+        assert cache.get("count") == 2
@@ -0,0 +1,277 @@
+import time
+from uuid import uuid4
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils.http import http_date
+
+from core.counters import update_counter
+from roster.models import Comment, Team
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    def test_list_has_weak_etag(self, api_client, team_list_url, teams):
+        response = api_client.get(team_list_url)
+
+        assert response.status_code == 200
+        assert response["ETag"].startswith('W/"')
+        assert "Last-Modified" not in response
+
+    def test_detail_has_strong_etag_and_last_modified(
+        self, api_client, team_detail_url, teams
+    ):
+        team = teams[0]
+        response = api_client.get(team_detail_url(team.id))
+
+        assert response.status_code == 200
+        assert response["ETag"].startswith('"')
+        assert response["Last-Modified"] == http_date(team.updated_at.timestamp())
+
+    def test_if_none_match_returns_304_from_cache_without_queries(
+        self, api_client, team_list_url, teams
+    ):
+        etag = api_client.get(team_list_url)["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(team_list_url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        assert response.content == b""
+        assert len(queries) == 0
+
+    def test_if_none_match_returns_304_without_serializing(
+        self, api_client, settings, player_list_url, players
+    ):
+        settings.RESPONSE_CACHE_TIMEOUT = 0
+        etag = api_client.get(player_list_url)["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(player_list_url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert len(queries) == 0
+
+    def test_list_etag_falls_back_to_rows_without_cache(
+        self, api_client, settings, team_list_url, teams
+    ):
+        settings.CACHES = {
+            **settings.CACHES,
+            "dummy": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+        }
+        settings.RESPONSE_CACHE_ALIAS = "dummy"
+
+        etag = api_client.get(team_list_url)["ETag"]
+        teams[0].soft_delete()
+        response = api_client.get(team_list_url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_cleared_cache_does_not_reuse_list_etag(
+        self, api_client, team_list_url, teams
+    ):
+        etag = api_client.get(team_list_url)["ETag"]
+        cache.clear()
+
+        response = api_client.get(team_list_url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+
+    def test_if_modified_since_returns_304(self, api_client, team_detail_url, teams):
+        url = team_detail_url(teams[0].id)
+        last_modified = api_client.get(url)["Last-Modified"]
+        cache.clear()
+
+        response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        assert response.status_code == 304
+        assert response["Last-Modified"] == last_modified
+
+    def test_update_changes_etag(self, api_client, team_detail_url, teams):
+        team = teams[0]
+        url = team_detail_url(team.id)
+
+        etag = api_client.get(url)["ETag"]
+        team.name = "Renamed Team"
+        team.save()
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+        assert response.data["name"] == "Renamed Team"
+
+    def test_soft_delete_changes_list_etag(self, api_client, team_list_url, teams):
+        etag = api_client.get(team_list_url)["ETag"]
+        teams[0].soft_delete()
+        response = api_client.get(team_list_url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_update_of_nested_row_changes_nested_action_etag(
+        self, api_client, player_comments_url, comments, general_user
+    ):
+        url = player_comments_url(comments[0].player_id)
+
+        etag = api_client.get(url)["ETag"]
+        general_user.username = "renamed_user"
+        general_user.save()
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_new_child_changes_parent_etag_but_not_updated_at(
+        self, api_client, player_detail_url, comments, general_user
+    ):
+        player = comments[0].player
+        url = player_detail_url(player.id)
+
+        etag = api_client.get(url)["ETag"]
+        Comment.objects.create(player=player, user=general_user, body="New Body")
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+        assert response["Last-Modified"] == http_date(player.updated_at.timestamp())
+
+    def test_list_etag_changes_once_generations_expire(
+        self, api_client, team_list_url, teams, monkeypatch
+    ):
+        etag = api_client.get(team_list_url)["ETag"]
+        # `QuerySet.update()` skips the invalidation.
+        Team.objects.filter(id=teams[0].id).update(name="Silently Renamed")
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 301)
+        response = api_client.get(team_list_url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert "Silently Renamed" in {team["name"] for team in response.data["results"]}
+
+    def test_counter_update_changes_parent_list_etag(
+        self, api_client, team_list_url, teams
+    ):
+        etag = api_client.get(team_list_url)["ETag"]
+        update_counter(Team, [teams[0].id], "player_count", 1)
+        response = api_client.get(team_list_url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+
+    def test_sparse_fields_change_detail_etag(self, api_client, team_detail_url, teams):
+        url = team_detail_url(teams[0].id)
+
+        full = api_client.get(url)
+        sparse = api_client.get(url, {"fields": "name"})
+
+        assert full["ETag"] != sparse["ETag"]
+
+    def test_query_parameters_change_list_etag(self, api_client, team_list_url, teams):
+        first = api_client.get(team_list_url)
+        second = api_client.get(team_list_url + "?page_size=1")
+
+        assert first["ETag"] != second["ETag"]
+
+    def test_public_and_admin_etags_differ(
+        self, api_client, team_detail_url, teams, admin_user
+    ):
+        url = team_detail_url(teams[0].id)
+
+        public = api_client.get(url)
+        api_client.force_authenticate(user=admin_user)
+        admin = api_client.get(url)
+
+        assert public["ETag"] != admin["ETag"]
+
+    def test_missing_detail_ignores_preconditions(self, api_client, team_detail_url):
+        response = api_client.get(team_detail_url(uuid4()), HTTP_IF_NONE_MATCH="*")
+
+        assert response.status_code == 404
+        assert "ETag" not in response
+
+
+@pytest.mark.django_db
+class TestConditionalUpdate:
+    def test_patch_with_current_etag_succeeds(
+        self, api_client, team_detail_url, teams, admin_user, super_user
+    ):
+        url = team_detail_url(teams[0].id)
+        api_client.force_authenticate(user=admin_user)
+
+        etag = api_client.get(url)["ETag"]
+        response = api_client.patch(
+            url, {"name": "Updated Team"}, format="json", HTTP_IF_MATCH=etag
+        )
+
+        api_client.force_authenticate(user=super_user)
+        current = api_client.get(url)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+        assert response["ETag"] == current["ETag"]
+
+    def test_patch_without_if_match_returns_etag(
+        self, api_client, team_detail_url, teams, admin_user
+    ):
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.patch(
+            team_detail_url(teams[0].id), {"name": "Updated Team"}, format="json"
+        )
+
+        assert response.status_code == 200
+        assert "ETag" in response
+
+
+@pytest.mark.django_db
+class TestConditionalUpdateNegative:
+    def test_patch_with_stale_etag_returns_412(
+        self, api_client, team_detail_url, teams, admin_user
+    ):
+        team = teams[0]
+        api_client.force_authenticate(user=admin_user)
+
+        etag = api_client.get(team_detail_url(team.id))["ETag"]
+        team.name = "Concurrent Update"
+        team.save()
+        response = api_client.patch(
+            team_detail_url(team.id),
+            {"name": "Lost Update"},
+            format="json",
+            HTTP_IF_MATCH=etag,
+        )
+
+        team.refresh_from_db()
+
+        assert response.status_code == 412
+        assert team.name == "Concurrent Update"
+
+    def test_patch_with_weak_etag_returns_412(
+        self, api_client, team_list_url, team_detail_url, teams, admin_user
+    ):
+        api_client.force_authenticate(user=admin_user)
+
+        etag = api_client.get(team_list_url)["ETag"]
+        response = api_client.patch(
+            team_detail_url(teams[0].id),
+            {"name": "Updated Team"},
+            format="json",
+            HTTP_IF_MATCH=etag,
+        )
+
+        assert response.status_code == 412
+
+    def test_object_permissions_are_checked_before_if_match(
+        self, api_client, comment_detail_url, comments, general_user_2
+    ):
+        api_client.force_authenticate(user=general_user_2)
+        response = api_client.patch(
+            comment_detail_url(comments[0].id),
+            {"body": "Updated"},
+            format="json",
+            HTTP_IF_MATCH='"stale"',
+        )
+
+        assert response.status_code == 403
@@ -0,0 +1,125 @@
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+from django.db import connection
+
+from roster.filters import TeamFilter, TeamPlayerStatFilter
+from roster.models import Team, TeamPlayerStat
+
+TOKYO = ZoneInfo("Asia/Tokyo")
+
+
+@pytest.fixture
+def tokyo_teams(db, settings):
+    """Teams created around the new year of 2024 in Tokyo (UTC+9)."""
+    settings.TIME_ZONE = "Asia/Tokyo"
+    created_at = {
+        "Last Of 2023": datetime(2023, 12, 31, 23, 59, 59, 999999, tzinfo=TOKYO),
+        "First Of 2024": datetime(2024, 1, 1, 0, 0, tzinfo=TOKYO),
+        "Late On New Year": datetime(2024, 1, 1, 23, 30, tzinfo=TOKYO),
+        "Second Day": datetime(2024, 1, 2, 0, 0, tzinfo=TOKYO),
+    }
+    for name, value in created_at.items():
+        team = Team.objects.create(name=name, sport="baseball")
+        Team.objects.filter(pk=team.pk).update(created_at=value)
+    return created_at
+
+
+def filtered_names(data, queryset=None):
+    queryset = Team.objects.all() if queryset is None else queryset
+    return set(TeamFilter(data, queryset=queryset).qs.values_list("name", flat=True))
+
+
+def explain(queryset):
+    if connection.vendor == "postgresql":
+        # The planner scans tables this small; make it show the usable index.
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+    return queryset.explain()
+
+
+@pytest.mark.django_db
+class TestDateFilters:
+    def test_date_matches_the_local_day(self, tokyo_teams):
+        names = filtered_names({"created_at_date": "2024-01-01"})
+
+        assert names == {"First Of 2024", "Late On New Year"}
+
+    def test_year_matches_the_local_year(self, tokyo_teams):
+        names = filtered_names({"created_at_year": 2023})
+
+        assert names == {"Last Of 2023"}
+
+    def test_year_gte_starts_at_local_midnight(self, tokyo_teams):
+        names = filtered_names({"created_at_year_gte": 2024})
+
+        assert names == {"First Of 2024", "Late On New Year", "Second Day"}
+
+    def test_year_lte_ends_before_next_local_year(self, tokyo_teams):
+        names = filtered_names({"created_at_year_lte": 2023})
+
+        assert names == {"Last Of 2023"}
+
+    def test_filters_combine_into_a_range(self, team_filter_data):
+        names = filtered_names(
+            {"created_at_year_gte": 2023, "created_at_year_lte": 2023}
+        )
+
+        assert names == {"Team B"}
+
+    def test_year_filters_on_date_column_compare_dates(self, teams):
+        TeamPlayerStat.objects.create(team=teams[0], month=date(2023, 12, 1))
+        TeamPlayerStat.objects.create(team=teams[0], month=date(2024, 1, 1))
+
+        queryset = TeamPlayerStatFilter(
+            {"created_at_year_lte": 2023}, queryset=TeamPlayerStat.objects.all()
+        ).qs
+
+        assert list(queryset.values_list("month", flat=True)) == [date(2023, 12, 1)]
+
+    def test_predicates_are_ranges_on_the_column(self, db):
+        queryset = TeamFilter(
+            {"created_at_date": "2024-01-01"}, queryset=Team.objects.all()
+        ).qs
+        sql = str(queryset.query)
+
+        assert '"roster_team"."created_at" >=' in sql
+        assert '"roster_team"."created_at" <' in sql
+        assert "django_datetime_cast_date" not in sql
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"created_at_date": "2024-01-01"},
+            {"created_at_year": 2024},
+            {"created_at_year_gte": 2024},
+            {"created_at_year_lte": 2024},
+        ],
+    )
+    def test_filters_use_the_created_at_index(self, data, teams):
+        if connection.vendor not in ("sqlite", "postgresql"):
+            pytest.skip("EXPLAIN output is only checked on SQLite and PostgreSQL")
+
+        queryset = TeamFilter(
+            data, queryset=Team.objects.filter(deleted_at__isnull=True)
+        ).qs
+        plan = explain(queryset)
+
+        assert "team_active_created_idx" in plan
+        if connection.vendor == "sqlite":
+            assert "SEARCH" in plan
+
+    # ========================================================================
+    # Negative Cases
+    # ========================================================================
+    def test_date_excludes_next_local_midnight(self, tokyo_teams):
+        names = filtered_names({"created_at_date": "2024-01-01"})
+
+        assert "Second Day" not in names
+
+    @pytest.mark.parametrize("year", ["0", "10000", "2024.5"])
+    def test_invalid_year_returns_400(self, year, api_client, team_list_url):
+        response = api_client.get(team_list_url, {"created_at_year": year})
+
+        assert response.status_code == 400
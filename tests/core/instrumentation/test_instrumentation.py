@@ -0,0 +1,97 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core.instrumentation import (
+    Histogram,
+    QueryBudgetExceeded,
+    query_budget,
+    request_metrics,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_request_metrics():
+    request_metrics.reset()
+
+
+@pytest.mark.django_db
+class TestInstrumentationMiddleware:
+    def test_adds_server_timing_header(self, api_client, team_list_url, settings):
+        settings.SERVER_TIMING_HEADER = True
+        response = api_client.get(team_list_url)
+
+        names = [
+            metric.split(";")[0] for metric in response["Server-Timing"].split(", ")
+        ]
+
+        assert names == ["db", "view_cpu", "total"]
+
+    def test_omits_server_timing_header_when_disabled(
+        self, api_client, team_list_url, settings
+    ):
+        settings.SERVER_TIMING_HEADER = False
+        response = api_client.get(team_list_url)
+
+        assert "Server-Timing" not in response
+
+    def test_records_query_count_per_url_name(
+        self, api_client, player_list_url, players
+    ):
+        with CaptureQueriesContext(connection) as queries:
+            api_client.get(player_list_url)
+
+        metrics = request_metrics.dump()["player-list"]
+
+        assert metrics["requests"] == 1
+        assert metrics["queries"]["max"] == len(queries)
+        assert sum(metrics["total_ms"]["buckets"].values()) == 1
+
+    def test_records_nested_actions_and_api_views_under_their_url_names(
+        self, api_client, team_players_url, me_comments_url, teams, general_user
+    ):
+        api_client.get(team_players_url(teams[0].id))
+        api_client.force_authenticate(user=general_user)
+        api_client.get(me_comments_url)
+
+        assert {"team-players", "me_comments"} <= set(request_metrics.dump())
+
+    def test_request_within_query_budget_passes(self, api_client, team_list_url, teams):
+        with query_budget({"team-list": 3}):
+            response = api_client.get(team_list_url)
+
+        assert response.status_code == 200
+
+    def test_method_budget_overrides_url_name_budget(
+        self, api_client, team_list_url, teams
+    ):
+        with query_budget({"team-list": 0, "GET team-list": 3}):
+            response = api_client.get(team_list_url)
+
+        assert response.status_code == 200
+
+
+@pytest.mark.django_db
+class TestInstrumentationMiddlewareNegative:
+    def test_request_over_query_budget_fails(self, api_client, team_list_url, teams):
+        with pytest.raises(QueryBudgetExceeded, match="team-list"):
+            with query_budget({"team-list": 0}):
+                api_client.get(team_list_url)
+
+    def test_unresolved_urls_are_not_recorded(self, api_client):
+        api_client.get("/api/v1/unknown/")
+
+        assert request_metrics.dump() == {}
+
+
+class TestHistogram:
+    def test_counts_values_in_first_bucket_not_below_them(self):
+        histogram = Histogram((1, 5))
+        for value in (0, 1, 3, 5, 6):
+            histogram.observe(value)
+
+        assert histogram.as_dict() == {
+            "buckets": {"1": 2, "5": 2, "+Inf": 1},
+            "sum": 15,
+            "max": 6,
+        }
@@ -0,0 +1,126 @@
+import pytest
+from django.db.models import QuerySet
+from django.urls import reverse
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core import pagination as pagination_module
+from core.pagination import ApproximateCountPagination, get_count
+from roster.models import Team
+
+factory = APIRequestFactory()
+
+
+def paginate(url, queryset, page_size=2):
+    pagination = ApproximateCountPagination()
+    pagination.page_size = page_size
+    page = pagination.paginate_queryset(queryset, Request(factory.get(url)))
+    return pagination, page
+
+
+@pytest.fixture
+def low_threshold(settings):
+    settings.PAGINATION_EXACT_COUNT_THRESHOLD = 2
+
+
+@pytest.fixture
+def planner_estimate(monkeypatch):
+    """Make `get_count()` read `rows` from a PostgreSQL-like plan."""
+
+    def estimate(rows):
+        plan = f'[{{"Plan": {{"Plan Rows": {rows}}}}}]'
+        monkeypatch.setattr(pagination_module, "can_estimate", lambda queryset: True)
+        monkeypatch.setattr(QuerySet, "explain", lambda queryset, **options: plan)
+
+    return estimate
+
+
+@pytest.mark.django_db
+class TestApproximateCountPagination:
+    # ========================================================================
+    # Positive Cases
+    # ========================================================================
+    def test_small_list_count_is_exact(self, api_client, team_list_url, teams):
+        response = api_client.get(team_list_url)
+
+        assert response.data["count"] == len(teams)
+        assert response.data["count_is_approximate"] is False
+
+    def test_large_list_count_is_cached(
+        self, api_client, team_list_url, low_threshold, teams
+    ):
+        first = api_client.get(team_list_url)
+        Team.objects.create(name="New Team", sport="baseball")
+        second = api_client.get(team_list_url, {"page": 1})
+
+        assert first.data["count_is_approximate"] is False
+        assert second.data["count"] == len(teams)
+        assert second.data["count_is_approximate"] is True
+
+    def test_large_list_count_is_planner_estimate(self, planner_estimate, teams):
+        planner_estimate(50000)
+
+        assert get_count(Team.objects.all()) == (50000, True)
+
+    def test_small_planner_estimate_counts_exactly(self, planner_estimate, teams):
+        planner_estimate(5)
+
+        assert get_count(Team.objects.all()) == (len(teams), False)
+
+    def test_approximate_pages_past_the_estimate_are_served(
+        self, planner_estimate, low_threshold, teams
+    ):
+        planner_estimate(2)
+
+        pagination, page = paginate(
+            "/api/v1/teams/?page=2", Team.objects.order_by("-created_at")
+        )
+
+        assert len(page) == 1
+        assert pagination.get_next_link() is None
+
+    def test_full_approximate_page_links_to_next(
+        self, planner_estimate, low_threshold, teams
+    ):
+        planner_estimate(2)
+
+        pagination, page = paginate(
+            "/api/v1/teams/", Team.objects.order_by("-created_at")
+        )
+
+        assert len(page) == 2
+        assert pagination.get_next_link() is not None
+
+    def test_async_list_uses_cached_count(self, api_client, low_threshold, teams):
+        url = reverse("async-team-list")
+        api_client.get(url)
+        teams[0].soft_delete()
+        response = api_client.get(url, {"page": 1})
+
+        assert response.data["count"] == len(teams)
+        assert response.data["count_is_approximate"] is True
+
+    def test_schema_documents_count_is_approximate(self):
+        schema = ApproximateCountPagination().get_paginated_response_schema({})
+
+        assert schema["properties"]["count_is_approximate"]["type"] == "boolean"
+
+    # ========================================================================
+    # Negative Cases
+    # ========================================================================
+    @pytest.mark.parametrize("number", ["0", "first"])
+    def test_invalid_approximate_page_raises_not_found(
+        self, number, planner_estimate, low_threshold, teams
+    ):
+        planner_estimate(2)
+
+        with pytest.raises(NotFound):
+            paginate(
+                f"/api/v1/teams/?page={number}", Team.objects.order_by("-created_at")
+            )
+
+    def test_empty_queryset_counts_zero(self, planner_estimate):
+        planner_estimate(50000)
+
+        assert get_count(Team.objects.none()) == (0, False)
@@ -0,0 +1,201 @@
+import json
+from base64 import urlsafe_b64encode
+from datetime import datetime
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core.pagination import KeysetPagination, PageNumberOrKeysetPagination
+from roster.models import Comment
+from roster.serializers.comment import CommentListRetrievePublicSerializer
+
+factory = APIRequestFactory()
+
+
+def build_request(url):
+    return Request(factory.get(url))
+
+
+def encode(position):
+    return urlsafe_b64encode(json.dumps({"p": position}).encode()).decode()
+
+
+def paginate(url, queryset, page_size=2):
+    pagination = KeysetPagination()
+    pagination.page_size = page_size
+    page = pagination.paginate_queryset(queryset, build_request(url))
+    return pagination, page
+
+
+@pytest.fixture
+def keyset_comments(db, general_user, players):
+    comment_objects = [
+        Comment.objects.create(user=general_user, player=player, body=f"Body {i}")
+        for i, player in enumerate(players * 2)
+    ]
+
+    # Two comments share each timestamp so the `pk` tie-breaker is exercised.
+    created_at_objects = [
+        timezone.make_aware(datetime(2024, 1, 1 + i // 2))
+        for i in range(len(comment_objects))
+    ]
+
+    for comment, created_at in zip(comment_objects, created_at_objects):
+        comment.created_at = created_at
+
+    Comment.objects.bulk_update(comment_objects, fields=["created_at"])
+
+    return comment_objects
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    def test_walks_every_row_once_in_order(self, keyset_comments):
+        queryset = Comment.objects.order_by("-created_at")
+        url = "/api/v1/comments/"
+        ids = []
+
+        while url:
+            pagination, page = paginate(url, queryset)
+            ids += [comment.id for comment in page]
+            url = pagination.get_next_link()
+
+        expected = [
+            comment.id for comment in Comment.objects.order_by("-created_at", "-pk")
+        ]
+
+        assert ids == expected
+
+    def test_walks_every_row_once_with_related_ordering(self, keyset_comments):
+        queryset = Comment.objects.order_by("player__first_name", "-created_at")
+        url = "/api/v1/comments/"
+        ids = []
+
+        while url:
+            pagination, page = paginate(url, queryset)
+            ids += [comment.id for comment in page]
+            url = pagination.get_next_link()
+
+        expected = [
+            comment.id
+            for comment in Comment.objects.order_by(
+                "player__first_name", "-created_at", "-pk"
+            )
+        ]
+
+        assert ids == expected
+
+    def test_walks_every_row_once_over_values_rows(self, keyset_comments):
+        queryset = CommentListRetrievePublicSerializer.get_values_queryset(
+            Comment.objects.order_by("player__first_name", "-created_at"),
+            ["player__first_name", "created_at", "pk"],
+        )
+        url = "/api/v1/comments/"
+        ids = []
+
+        while url:
+            pagination, page = paginate(url, queryset)
+            ids += [row.id for row in page]
+            url = pagination.get_next_link()
+
+        expected = [
+            comment.id
+            for comment in Comment.objects.order_by(
+                "player__first_name", "-created_at", "-pk"
+            )
+        ]
+
+        assert ids == expected
+
+    def test_previous_link_returns_previous_page(self, keyset_comments):
+        queryset = Comment.objects.order_by("-created_at")
+        first_pagination, first_page = paginate("/api/v1/comments/", queryset)
+        second_pagination, _ = paginate(first_pagination.get_next_link(), queryset)
+
+        previous_pagination, previous_page = paginate(
+            second_pagination.get_previous_link(), queryset
+        )
+
+        assert first_pagination.get_previous_link() is None
+        assert [c.id for c in previous_page] == [c.id for c in first_page]
+
+    def test_next_page_does_not_use_offset_or_count(self, keyset_comments):
+        queryset = Comment.objects.order_by("-created_at")
+        first_pagination, _ = paginate("/api/v1/comments/", queryset)
+
+        with CaptureQueriesContext(connection) as queries:
+            paginate(first_pagination.get_next_link(), queryset)
+
+        assert len(queries) == 1
+        sql = queries[0]["sql"].upper()
+        assert "OFFSET" not in sql
+        assert "COUNT(" not in sql
+
+    def test_last_page_has_no_next_link(self, keyset_comments):
+        queryset = Comment.objects.order_by("-created_at")
+        pagination, page = paginate(
+            "/api/v1/comments/", queryset, page_size=len(keyset_comments)
+        )
+
+        assert len(page) == len(keyset_comments)
+        assert pagination.get_next_link() is None
+
+    def test_invalid_cursor_raises_not_found(self, keyset_comments):
+        queryset = Comment.objects.order_by("-created_at")
+
+        with pytest.raises(NotFound):
+            paginate("/api/v1/comments/?cursor=invalid", queryset)
+
+    @pytest.mark.parametrize(
+        "position",
+        [
+            ["bad", "x"],
+            ["2024-01-01T00:00:00+00:00", "not-a-uuid"],
+            [1, 2],
+            [{"a": 1}, "x"],
+            [None, None],
+        ],
+    )
+    def test_cursor_with_invalid_values_raises_not_found(
+        self, keyset_comments, position
+    ):
+        queryset = Comment.objects.order_by("-created_at")
+
+        with pytest.raises(NotFound):
+            paginate(f"/api/v1/comments/?cursor={encode(position)}", queryset)
+
+    def test_cursor_with_invalid_values_returns_404(self, api_client, player_list_url):
+        response = api_client.get(
+            player_list_url, {"pagination": "cursor", "cursor": encode(["bad", "x"])}
+        )
+
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestPageNumberOrKeysetPagination:
+    def test_uses_page_number_pagination_by_default(self, keyset_comments):
+        pagination = PageNumberOrKeysetPagination()
+        pagination.paginate_queryset(
+            Comment.objects.order_by("-created_at"),
+            build_request("/api/v1/comments/"),
+        )
+        response = pagination.get_paginated_response([])
+
+        assert "count" in response.data
+
+    def test_uses_keyset_pagination_when_requested(self, keyset_comments):
+        pagination = PageNumberOrKeysetPagination()
+        pagination.paginate_queryset(
+            Comment.objects.order_by("-created_at"),
+            build_request("/api/v1/comments/?pagination=cursor"),
+        )
+        response = pagination.get_paginated_response([])
+
+        assert "count" not in response.data
+        assert set(response.data.keys()) == {"next", "previous", "results"}
@@ -0,0 +1,101 @@
+import io
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+import pytest
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core import renderers
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer
+from roster.models import Comment
+from roster.serializers.comment import CommentListRetrieveAdminSerializer
+
+RAW_VALUES = {
+    "uuid": UUID("12345678-1234-5678-1234-567812345678"),
+    "datetime": datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+    "tokyo": datetime(2024, 1, 2, 3, 4, 5, tzinfo=ZoneInfo("Asia/Tokyo")),
+    "naive": datetime(2024, 1, 2, 3, 4, 5),
+    "date": date(2024, 1, 2),
+    "decimal": Decimal("1.50"),
+    "text": "日本語    ",
+    "nested": [{"none": None, "bool": True, "int": 1}],
+}
+
+
+@pytest.mark.django_db
+class TestFastJSONRenderer:
+    def test_renders_serializer_data_like_json_renderer(self, comments):
+        comments[0].soft_delete()
+        data = CommentListRetrieveAdminSerializer(
+            Comment.objects.order_by("-created_at"), many=True
+        ).data
+
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_renders_raw_values_like_json_renderer(self):
+        rendered = FastJSONRenderer().render(RAW_VALUES)
+
+        assert rendered == JSONRenderer().render(RAW_VALUES)
+        assert b'"2024-01-02T03:04:05.678901Z"' in rendered
+        assert b'"2024-01-02T03:04:05+09:00"' in rendered
+        assert b"\\u2028" in rendered
+
+    def test_renders_indented_output_like_json_renderer(self):
+        media_type = "application/json; indent=4"
+
+        assert FastJSONRenderer().render(RAW_VALUES, media_type) == (
+            JSONRenderer().render(RAW_VALUES, media_type)
+        )
+
+    def test_renders_non_string_keys_like_json_renderer(self):
+        data = {1: "one", None: "none"}
+
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_renders_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(renderers, "orjson", None)
+
+        assert FastJSONRenderer().render(RAW_VALUES) == (
+            JSONRenderer().render(RAW_VALUES)
+        )
+
+    def test_renders_none_as_empty_body(self):
+        assert FastJSONRenderer().render(None) == b""
+
+    def test_is_used_by_the_api(self, api_client, team_list_url, teams):
+        response = api_client.get(team_list_url)
+
+        assert isinstance(response.accepted_renderer, FastJSONRenderer)
+        assert response.json()["count"] == len(teams)
+
+
+class TestFastJSONParser:
+    def test_parses_utf8_body(self):
+        body = '{"body": "日本語", "ids": [1, 2]}'.encode()
+
+        assert FastJSONParser().parse(io.BytesIO(body)) == (
+            JSONParser().parse(io.BytesIO(body))
+        )
+
+    def test_parses_other_encodings(self):
+        body = '{"body": "日本語"}'.encode("utf-16")
+        context = {"encoding": "utf-16"}
+
+        assert FastJSONParser().parse(io.BytesIO(body), parser_context=context) == {
+            "body": "日本語"
+        }
+
+    def test_parses_without_orjson(self, monkeypatch):
+        monkeypatch.setattr("core.parsers.orjson", None)
+
+        assert FastJSONParser().parse(io.BytesIO(b'{"a": 1}')) == {"a": 1}
+
+    @pytest.mark.parametrize("body", [b'{"a": 1', b'{"a": NaN}', b'{"a": Infinity}'])
+    def test_fails_to_parse_invalid_json(self, body):
+        with pytest.raises(ParseError):
+            FastJSONParser().parse(io.BytesIO(body))
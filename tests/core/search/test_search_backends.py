@@ -0,0 +1,77 @@
+import pytest
+from django.db import connection
+
+from core.search import SearchBackend, SQLiteFTSSearchBackend, get_search_backend
+from roster.models import Comment, Player, Team
+
+
+def search(model, field_path, term, backend=None):
+    backend = backend or SQLiteFTSSearchBackend()
+    return model.objects.filter(backend.build_q(model, field_path, term))
+
+
+@pytest.mark.django_db
+class TestSearchBackend:
+    def test_build_q_uses_icontains(self, teams):
+        q = SearchBackend().build_q(Team, "name", "name 2")
+
+        assert q.children == [("name__icontains", "name 2")]
+
+    def test_get_search_backend_uses_setting(self, settings):
+        settings.SEARCH_BACKEND = "core.search.SearchBackend"
+
+        assert type(get_search_backend()) is SearchBackend
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite FTS5 backend")
+class TestSQLiteFTSSearchBackend:
+    def test_get_search_backend_defaults_to_fts_on_sqlite(self):
+        assert isinstance(get_search_backend(), SQLiteFTSSearchBackend)
+
+    def test_matches_substring_case_insensitively(self, teams):
+        results = search(Team, "name", "AME 2")
+
+        assert list(results) == [teams[1]]
+
+    def test_queries_shadow_table(self, teams):
+        sql = str(search(Team, "name", "Team").query)
+
+        assert "roster_team_search" in sql
+        assert "LIKE" not in sql
+
+    def test_matches_related_field(self, teams, players):
+        results = search(Player, "team__name", "Team Name")
+
+        assert set(results) == set(players)
+
+    def test_short_term_falls_back_to_icontains(self, teams):
+        sql = str(search(Team, "name", "2").query)
+
+        assert "LIKE" in sql
+        assert list(search(Team, "name", "2")) == [teams[1]]
+
+    def test_index_follows_update(self, teams):
+        team = teams[0]
+        team.name = "Renamed Squad"
+        team.save()
+
+        assert list(search(Team, "name", "squad")) == [team]
+        assert team not in search(Team, "name", "Team Name")
+
+    def test_index_follows_queryset_update(self, players):
+        Player.objects.filter(pk=players[0].pk).update(first_name="Zebulon")
+
+        assert list(search(Player, "first_name", "ebulo")) == [players[0]]
+
+    def test_index_follows_hard_delete(self, comments):
+        comment = comments[0]
+        comment.delete()
+
+        assert comment not in search(Comment, "body", "Comment Body")
+
+    def test_soft_deleted_rows_stay_searchable(self, comments):
+        comment = comments[0]
+        comment.soft_delete()
+
+        assert comment in search(Comment, "body", "Comment Body")
@@ -0,0 +1,130 @@
+import re
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from user_account.models import UserAccount
+
+
+def patch_columns(api_client, url, data, table):
+    """PATCH `url` and return the columns set by each `UPDATE` of `table`."""
+    with CaptureQueriesContext(connection) as captured:
+        response = api_client.patch(url, data=data, format="json")
+    assert response.status_code == 200, response.data
+
+    return [
+        set(re.findall(r'"(\w+)" = ', query["sql"].split(" WHERE ")[0]))
+        for query in captured.captured_queries
+        if query["sql"].startswith(f'UPDATE "{table}" SET')
+    ]
+
+
+@pytest.mark.django_db
+class TestPatchModelSerializer:
+    # ========================================================================
+    # Positive Cases
+    # ========================================================================
+    def test_patch_writes_only_changed_player_columns(
+        self, api_client, player_detail_url, admin_user, players
+    ):
+        api_client.force_authenticate(user=admin_user)
+
+        updates = patch_columns(
+            api_client,
+            player_detail_url(players[0].id),
+            {"first_name": "Renamed", "last_name": players[0].last_name},
+            "roster_player",
+        )
+
+        assert updates == [{"first_name", "updated_at"}]
+
+    def test_patch_writes_foreign_key_column(
+        self, api_client, player_detail_url, admin_user, teams, players
+    ):
+        api_client.force_authenticate(user=admin_user)
+
+        updates = patch_columns(
+            api_client,
+            player_detail_url(players[0].id),
+            {"team_id": str(teams[1].id)},
+            "roster_player",
+        )
+
+        assert updates == [{"team_id", "updated_at"}]
+
+    def test_patch_writes_only_changed_team_columns(
+        self, api_client, team_detail_url, admin_user, teams
+    ):
+        api_client.force_authenticate(user=admin_user)
+
+        updates = patch_columns(
+            api_client,
+            team_detail_url(teams[0].id),
+            {"sport": "football"},
+            "roster_team",
+        )
+
+        assert updates == [{"sport", "updated_at"}]
+
+    def test_patch_writes_only_changed_comment_columns(
+        self, api_client, comment_detail_url, general_user, comments
+    ):
+        api_client.force_authenticate(user=general_user)
+
+        updates = patch_columns(
+            api_client,
+            comment_detail_url(comments[0].id),
+            {"body": "Edited", "player_id": str(comments[0].player_id)},
+            "roster_comment",
+        )
+
+        assert updates == [{"body", "updated_at"}]
+
+    def test_patch_user_account_leaves_password_alone(
+        self, api_client, user_account_detail_url, admin_user, general_user
+    ):
+        api_client.force_authenticate(user=admin_user)
+
+        updates = patch_columns(
+            api_client,
+            user_account_detail_url(general_user.id),
+            {"is_active": False},
+            "user_account_useraccount",
+        )
+
+        assert updates == [{"is_active", "updated_at"}]
+
+    def test_patch_me_writes_only_changed_columns(
+        self, api_client, me_url, general_user
+    ):
+        api_client.force_authenticate(user=general_user)
+
+        updates = patch_columns(
+            api_client, me_url, {"username": "renamed_user"}, "user_account_useraccount"
+        )
+
+        assert updates == [{"username", "updated_at"}]
+        assert UserAccount.objects.get(id=general_user.id).check_password(
+            "generalUser123"
+        )
+
+    # ========================================================================
+    # Negative Cases
+    # ========================================================================
+    def test_patch_without_changes_skips_update(
+        self, api_client, player_detail_url, admin_user, players
+    ):
+        api_client.force_authenticate(user=admin_user)
+        updated_at = players[0].updated_at
+
+        updates = patch_columns(
+            api_client,
+            player_detail_url(players[0].id),
+            {"first_name": players[0].first_name, "team_id": str(players[0].team_id)},
+            "roster_player",
+        )
+
+        players[0].refresh_from_db()
+        assert updates == []
+        assert players[0].updated_at == updated_at
@@ -0,0 +1,200 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core.mixins.querysets import get_serializer_query_paths
+from core.sparse_fields import (
+    build_sparse_serializer,
+    get_sparse_serializer,
+    parse_paths,
+)
+from core.values_serializers import compile_values_serializer, get_row_iterable_class
+from roster.serializers.comment import CommentListRetrievePublicSerializer
+
+
+def get_list(api_client, url, params):
+    """Return the first row of the list and the SQL of the page."""
+    with CaptureQueriesContext(connection) as captured:
+        response = api_client.get(url, params)
+    assert response.status_code == 200, response.data
+    return response.data["results"][0], captured.captured_queries[-1]["sql"]
+
+
+@pytest.mark.django_db
+class TestSparseFields:
+    # ========================================================================
+    # Positive Cases
+    # ========================================================================
+    def test_fields_prune_output_and_columns(
+        self, api_client, comment_list_url, comments
+    ):
+        row, sql = get_list(api_client, comment_list_url, {"fields": "id,body"})
+
+        assert set(row) == {"id", "body"}
+        assert "JOIN" not in sql
+        assert '"updated_at"' not in sql
+
+    def test_dotted_fields_pick_nested_fields(
+        self, api_client, comment_list_url, comments
+    ):
+        row, sql = get_list(
+            api_client, comment_list_url, {"fields": "id,player.first_name"}
+        )
+
+        assert row["player"] == {"first_name": comments[2].player.first_name}
+        assert "roster_team" not in sql
+        assert "user_account_useraccount" not in sql
+
+    def test_empty_expand_collapses_relations_to_ids(
+        self, api_client, comment_list_url, comments
+    ):
+        row, sql = get_list(api_client, comment_list_url, {"expand": ""})
+
+        assert row["player"] == str(comments[2].player_id)
+        assert row["user"] == str(comments[2].user_id)
+        assert "JOIN" not in sql
+
+    def test_expand_embeds_only_listed_relations(
+        self, api_client, comment_list_url, comments
+    ):
+        row, sql = get_list(api_client, comment_list_url, {"expand": "player"})
+
+        assert row["player"]["team"] == str(comments[2].player.team_id)
+        assert row["user"] == str(comments[2].user_id)
+        assert "roster_team" not in sql
+
+    def test_nested_expand_embeds_deeper_relations(
+        self, api_client, comment_list_url, comments
+    ):
+        row, _ = get_list(api_client, comment_list_url, {"expand": "player.team"})
+
+        assert row["player"]["team"]["name"] == comments[2].player.team.name
+
+    def test_admin_can_pick_admin_fields(
+        self, api_client, comment_list_url, admin_user, comments
+    ):
+        api_client.force_authenticate(user=admin_user)
+        row, _ = get_list(api_client, comment_list_url, {"fields": "id,deleted_at"})
+
+        assert set(row) == {"id", "deleted_at"}
+
+    def test_model_serializers_defer_unpicked_columns(
+        self, api_client, user_account_list_url, general_user
+    ):
+        row, sql = get_list(api_client, user_account_list_url, {"fields": "username"})
+
+        assert row == {"username": general_user.username}
+        assert '"comment_count"' not in sql
+
+    def test_nested_actions_support_fields(
+        self, api_client, player_comments_url, players, comments
+    ):
+        row, _ = get_list(
+            api_client, player_comments_url(players[0].id), {"fields": "id,body"}
+        )
+
+        assert set(row) == {"id", "body"}
+
+    def test_me_supports_fields(self, api_client, me_url, general_user):
+        api_client.force_authenticate(user=general_user)
+        response = api_client.get(me_url, {"fields": "username"})
+
+        assert response.data == {"username": general_user.username}
+
+    def test_stats_support_fields(
+        self, api_client, player_comment_stat_list_url, admin_user, comments
+    ):
+        api_client.force_authenticate(user=admin_user)
+        row, _ = get_list(
+            api_client, player_comment_stat_list_url, {"fields": "comment_count"}
+        )
+
+        assert set(row) == {"comment_count"}
+
+    def test_export_supports_fields(
+        self, api_client, comment_export_url, general_user, comments
+    ):
+        api_client.force_authenticate(user=general_user)
+        response = api_client.get(comment_export_url, {"fields": "id", "expand": ""})
+        lines = b"".join(response.streaming_content).decode().splitlines()
+
+        assert lines[0].startswith('{"id":')
+        assert all(line.count(":") == 1 for line in lines)
+
+    def test_same_paths_share_one_serializer_class(self):
+        sparse = get_sparse_serializer(
+            CommentListRetrievePublicSerializer, parse_paths("id,body"), None
+        )
+
+        assert sparse is get_sparse_serializer(
+            CommentListRetrievePublicSerializer, parse_paths(" body, id"), None
+        )
+        assert issubclass(sparse, CommentListRetrievePublicSerializer)
+
+    @pytest.mark.parametrize(
+        "cached",
+        [
+            build_sparse_serializer,
+            get_serializer_query_paths,
+            compile_values_serializer,
+            get_row_iterable_class,
+        ],
+    )
+    def test_caches_keyed_by_client_paths_are_bounded(self, cached):
+        assert cached.cache_info().maxsize is not None
+
+    def test_without_paths_serializer_is_unchanged(self):
+        assert (
+            get_sparse_serializer(CommentListRetrievePublicSerializer)
+            is CommentListRetrievePublicSerializer
+        )
+
+    # ========================================================================
+    # Negative Cases
+    # ========================================================================
+    def test_unknown_field_returns_400(self, api_client, comment_list_url):
+        response = api_client.get(comment_list_url, {"fields": "id,secret"})
+
+        assert response.status_code == 400
+        assert response.data["fields"] == ["`secret`: Unknown field."]
+
+    @pytest.mark.parametrize("fields", ["", " ", ",", ".", " , ."])
+    def test_empty_fields_return_400(self, fields, api_client, comment_list_url):
+        response = api_client.get(comment_list_url, {"fields": fields})
+
+        assert response.status_code == 400
+        assert response.data["fields"] == ["Pick at least one field."]
+
+    def test_public_cannot_pick_admin_fields(self, api_client, team_list_url):
+        response = api_client.get(team_list_url, {"fields": "deleted_at"})
+
+        assert response.status_code == 400
+
+    def test_fields_of_collapsed_relation_return_400(
+        self, api_client, comment_list_url
+    ):
+        response = api_client.get(
+            comment_list_url, {"fields": "player.first_name", "expand": "user"}
+        )
+
+        assert response.status_code == 400
+        assert "`player`" in response.data["fields"][0]
+
+    def test_expanding_plain_field_returns_400(self, api_client, comment_list_url):
+        response = api_client.get(comment_list_url, {"expand": "player.first_name"})
+
+        assert response.status_code == 400
+        assert response.data["expand"] == [
+            "`player.first_name`: Has no fields to expand."
+        ]
+
+    def test_write_requests_ignore_fields(
+        self, api_client, comment_detail_url, general_user, comments
+    ):
+        api_client.force_authenticate(user=general_user)
+        url = comment_detail_url(comments[0].id)
+        response = api_client.patch(f"{url}?fields=id", data={"body": "New Body"})
+
+        assert response.status_code == 200
+        assert response.data["body"] == "New Body"
+        assert {"id", "body", "created_at"} <= set(response.data)
@@ -0,0 +1,125 @@
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from core.values_serializers import ValuesModelSerializer
+from roster.models import Comment, Player, Team
+from roster.serializers.comment import (
+    CommentListRetrieveAdminSerializer,
+    CommentListRetrievePublicSerializer,
+)
+from roster.serializers.player import (
+    PlayerCommentListAdminSerializer,
+    PlayerCommentListPublicSerializer,
+    PlayerListRetrieveAdminSerializer,
+    PlayerListRetrievePublicSerializer,
+)
+from roster.serializers.team import (
+    TeamListRetrieveAdminSerializer,
+    TeamListRetrievePublicSerializer,
+    TeamPlayerListAdminSerializer,
+    TeamPlayerListPublicSerializer,
+)
+from user_account.serializers import (
+    UserAccountCommentListAdminSerializer,
+    UserAccountCommentListPublicSerializer,
+)
+
+VALUES_SERIALIZERS = [
+    (TeamListRetrievePublicSerializer, Team),
+    (TeamListRetrieveAdminSerializer, Team),
+    (TeamPlayerListPublicSerializer, Player),
+    (TeamPlayerListAdminSerializer, Player),
+    (PlayerListRetrievePublicSerializer, Player),
+    (PlayerListRetrieveAdminSerializer, Player),
+    (PlayerCommentListPublicSerializer, Comment),
+    (PlayerCommentListAdminSerializer, Comment),
+    (CommentListRetrievePublicSerializer, Comment),
+    (CommentListRetrieveAdminSerializer, Comment),
+    (UserAccountCommentListPublicSerializer, Comment),
+    (UserAccountCommentListAdminSerializer, Comment),
+]
+
+
+@pytest.mark.django_db
+class TestValuesModelSerializer:
+    @pytest.mark.parametrize(("serializer_class", "model"), VALUES_SERIALIZERS)
+    def test_values_rows_render_byte_identical_to_instances(
+        self, serializer_class, model, comments
+    ):
+        # Cover `None` and non-`None` values of every nullable column.
+        for obj in (Team, Player, Comment):
+            obj.objects.order_by("created_at").first().soft_delete()
+
+        queryset = model.objects.order_by("-created_at", "pk")
+        instances = serializer_class(list(queryset), many=True).data
+        rows = serializer_class(
+            list(serializer_class.get_values_queryset(queryset)), many=True
+        ).data
+
+        assert len(rows) == model.objects.count() > 1
+        assert JSONRenderer().render(rows) == JSONRenderer().render(instances)
+
+    def test_values_rows_are_fetched_with_one_query(
+        self, comments, django_assert_num_queries
+    ):
+        queryset = CommentListRetrieveAdminSerializer.get_values_queryset(
+            Comment.objects.all()
+        )
+
+        with django_assert_num_queries(1):
+            data = CommentListRetrieveAdminSerializer(list(queryset), many=True).data
+
+        assert data[0]["player"]["team"]["name"]
+
+    def test_values_rows_include_extra_paths(self, comments):
+        comment = comments[0]
+        row = CommentListRetrievePublicSerializer.get_values_queryset(
+            Comment.objects.filter(pk=comment.pk),
+            ["player__team__name", "created_at", "pk"],
+        ).get()
+
+        assert row.pk == row.id == comment.id
+        assert row.player__team__name == comment.player.team.name
+
+    def test_count_does_not_join_the_row_columns(self, comments):
+        queryset = CommentListRetrievePublicSerializer.get_values_queryset(
+            Comment.objects.all()
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            count = queryset.count()
+
+        assert count == len(comments)
+        assert "JOIN" not in context.captured_queries[0]["sql"]
+
+    def test_datetimes_render_in_current_timezone(self, teams):
+        team = teams[0]
+        queryset = Team.objects.filter(pk=team.pk)
+
+        with timezone.override("Asia/Tokyo"):
+            row = TeamListRetrievePublicSerializer.get_values_queryset(queryset)[0]
+            data = TeamListRetrievePublicSerializer(row).data
+
+        assert data["created_at"].endswith("+09:00")
+
+
+@pytest.mark.django_db
+class TestValuesModelSerializerNegative:
+    def test_fails_to_compile_fields_without_model_column(self, teams):
+        class TeamWithMethodSerializer(ValuesModelSerializer):
+            label = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Team
+                fields = ["id", "label"]
+
+            def get_label(self, obj):
+                return obj.name
+
+        with pytest.raises(ImproperlyConfigured):
+            TeamWithMethodSerializer.get_values_queryset(Team.objects.all())
@@ -0,0 +1,178 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from core.counters import rebuild_counter
+from core.soft_delete import restore, soft_delete
+from roster.models import (
+    Comment,
+    Player,
+    PlayerCommentStat,
+    SportCommenterStat,
+    Team,
+    TeamPlayerStat,
+)
+from roster.stats import rebuild_stats
+from user_account.models import UserAccount
+
+COUNTERS = [
+    (Team, "player_count", Player, "team"),
+    (Player, "comment_count", Comment, "player"),
+    (UserAccount, "comment_count", Comment, "user"),
+]
+
+
+def rebuild_counters():
+    """Return the number of counters that drifted from their active children."""
+    return sum(rebuild_counter(*counter) for counter in COUNTERS)
+
+
+def rollup_rows():
+    return {
+        model: set(
+            model.objects.exclude(**{counter: 0}).values_list(
+                *[field.attname for field in model._meta.concrete_fields[1:]]
+            )
+        )
+        for model, counter in [
+            (PlayerCommentStat, "comment_count"),
+            (TeamPlayerStat, "player_count"),
+            (SportCommenterStat, "comment_count"),
+        ]
+    }
+
+
+def deleted_at_of(queryset):
+    return set(queryset.values_list("deleted_at", flat=True))
+
+
+@pytest.mark.django_db
+class TestCascadingSoftDelete:
+    # ========================================================================
+    # Soft Delete - Positive Cases
+    # ========================================================================
+    def test_team_stamps_players_and_comments_with_its_deleted_at(
+        self, teams, players, comments
+    ):
+        teams[0].soft_delete()
+
+        assert deleted_at_of(Player.objects.filter(team=teams[0])) == {
+            teams[0].deleted_at
+        }
+        assert deleted_at_of(Comment.objects.all()) == {teams[0].deleted_at}
+
+    def test_user_stamps_its_comments(self, general_user, comments):
+        general_user.soft_delete()
+
+        assert deleted_at_of(Comment.objects.filter(user=general_user)) == {
+            general_user.deleted_at
+        }
+
+    def test_player_stamps_only_its_comments(self, players, comments):
+        players[0].soft_delete()
+
+        assert deleted_at_of(players[0].comments.all()) == {players[0].deleted_at}
+        assert deleted_at_of(players[1].comments.all()) == {None}
+
+    def test_counters_and_rollups_match_a_rebuild(self, teams, players, comments):
+        teams[0].soft_delete()
+
+        incremental = rollup_rows()
+        rebuild_stats()
+
+        assert rebuild_counters() == 0
+        assert rollup_rows() == incremental
+        assert Team.objects.get(pk=teams[0].pk).player_count == 0
+        assert UserAccount.objects.get(pk=comments[0].user_id).comment_count == 0
+
+    def test_statements_do_not_grow_with_descendants(self, teams, general_user):
+        queries = []
+        for team, size in [(teams[0], 2), (teams[1], 20)]:
+            for _ in range(size):
+                player = Player.objects.create(
+                    first_name="First", last_name="Last", team=team
+                )
+                Comment.objects.create(user=general_user, player=player, body="Body")
+
+            with CaptureQueriesContext(connection) as captured:
+                soft_delete(Team.objects.filter(pk=team.pk))
+            queries.append(len(captured))
+
+        assert queries[0] == queries[1]
+
+    def test_delete_endpoint_hides_players_from_public_list(
+        self, api_client, team_detail_url, player_list_url, super_user, teams, players
+    ):
+        api_client.force_authenticate(user=super_user)
+        api_client.delete(team_detail_url(teams[0].id))
+
+        api_client.force_authenticate(user=None)
+        response = api_client.get(player_list_url)
+
+        assert response.data["results"] == []
+
+    def test_me_delete_endpoint_stamps_comments(
+        self, api_client, me_url, general_user, comments
+    ):
+        api_client.force_authenticate(user=general_user)
+        response = api_client.delete(me_url)
+
+        assert response.status_code == 204
+        assert not Comment.objects.filter(deleted_at__isnull=True).exists()
+
+    # ========================================================================
+    # Restore - Positive Cases
+    # ========================================================================
+    def test_restore_brings_back_the_cascaded_rows(self, teams, players, comments):
+        before = rollup_rows()
+        teams[0].soft_delete()
+
+        teams[0].restore()
+
+        assert teams[0].deleted_at is None
+        assert not Player.objects.filter(deleted_at__isnull=False).exists()
+        assert not Comment.objects.filter(deleted_at__isnull=False).exists()
+        assert rebuild_counters() == 0
+        assert rollup_rows() == before
+
+    def test_restore_leaves_rows_deleted_on_their_own(self, teams, players, comments):
+        comments[2].soft_delete()
+        players[2].soft_delete()
+        teams[0].soft_delete()
+
+        teams[0].restore()
+
+        assert Comment.objects.get(pk=comments[2].pk).deleted_at is not None
+        assert Player.objects.get(pk=players[2].pk).deleted_at is not None
+        assert Player.objects.get(pk=players[0].pk).deleted_at is None
+        assert rebuild_counters() == 0
+
+    # ========================================================================
+    # Negative Cases
+    # ========================================================================
+    def test_deleting_twice_keeps_the_first_deleted_at(self, teams, players, comments):
+        teams[0].soft_delete()
+        first = teams[0].deleted_at
+
+        soft_delete(Team.objects.filter(pk=teams[0].pk))
+
+        assert Team.objects.get(pk=teams[0].pk).deleted_at == first
+        assert deleted_at_of(Comment.objects.all()) == {first}
+        assert rebuild_counters() == 0
+
+    def test_restore_of_active_rows_does_nothing(self, teams, players, comments):
+        comments[0].soft_delete()
+
+        restored = restore(Team.objects.filter(pk=teams[0].pk))
+
+        assert restored == 0
+        assert Comment.objects.get(pk=comments[0].pk).deleted_at is not None
+
+    def test_restore_does_not_match_other_deleted_at(self, teams, players):
+        Player.objects.filter(pk=players[0].pk).update(deleted_at=timezone.now())
+        teams[0].soft_delete()
+
+        teams[0].restore()
+
+        assert Player.objects.get(pk=players[0].pk).deleted_at is not None
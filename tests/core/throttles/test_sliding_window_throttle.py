@@ -0,0 +1,82 @@
+import multiprocessing
+
+import pytest
+
+from core.cache_backends import SQLiteCounterCache
+from core.throttling import SlidingWindowRateThrottle
+
+# Start of a bucket of the "3/min" rate, whose buckets last 6 seconds.
+NOW = 600.0
+
+
+class Throttle(SlidingWindowRateThrottle):
+    rate = "3/min"
+
+    def __init__(self, now=NOW):
+        super().__init__()
+        self.now = now
+        self.timer = lambda: self.now
+
+    def get_cache_key(self, request, view):
+        return "throttle_test_key"
+
+
+def request_many(throttle, times):
+    return [throttle.allow_request(None, None) for _ in range(times)]
+
+
+def hammer(path, attempts):
+    throttle = Throttle()
+    throttle.cache = cache = SQLiteCounterCache(path, {})
+    for _ in range(attempts):
+        if throttle.allow_request(None, None):
+            cache.incr("allowed")
+
+
+class TestSlidingWindowRateThrottle:
+    def test_allows_up_to_the_rate(self):
+        assert request_many(Throttle(), 4) == [True, True, True, False]
+
+    def test_rejected_requests_are_not_counted(self):
+        throttle = Throttle()
+        request_many(throttle, 10)
+
+        assert throttle.cache.get("throttle_test_key:100") == 3
+
+    def test_oldest_bucket_is_weighted_by_its_part_in_the_window(self):
+        request_many(Throttle(), 3)
+
+        # At 660 the window starts at 600 and holds the 3 requests in full.
+        assert request_many(Throttle(now=660.0), 1) == [False]
+        # Half of the oldest bucket has left the window: 1.5 + 1 <= 3.
+        assert request_many(Throttle(now=663.0), 2) == [True, False]
+
+    def test_requests_of_other_keys_are_not_counted(self):
+        request_many(Throttle(), 3)
+        other = Throttle()
+        other.get_cache_key = lambda request, view: "throttle_other_key"
+
+        assert request_many(other, 1) == [True]
+
+    def test_wait_is_the_time_until_one_more_request_is_allowed(self):
+        throttle = Throttle()
+        request_many(throttle, 4)
+        wait = throttle.wait()
+
+        assert wait == pytest.approx(62)
+        assert request_many(Throttle(now=NOW + wait - 0.5), 1) == [False]
+        assert request_many(Throttle(now=NOW + wait), 1) == [True]
+
+    def test_counts_requests_of_every_process_sharing_the_cache(self, tmp_path):
+        path = str(tmp_path / "throttle.sqlite3")
+        cache = SQLiteCounterCache(path, {})
+        cache.set("allowed", 0)
+        context = multiprocessing.get_context("fork")
+        processes = [context.Process(target=hammer, args=(path, 10)) for _ in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        assert cache.get("allowed") == 3
+        assert cache.get("throttle_test_key:100") == 3
@@ -0,0 +1,116 @@
+import json
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from roster.models import Comment, Player, Team, TeamPlayerStat
+from user_account.models import UserAccount
+
+
+def purge(archive_dir, **options):
+    stdout = StringIO()
+    call_command(
+        "purge_deleted", archive_dir=str(archive_dir), sleep=0, stdout=stdout, **options
+    )
+    return stdout.getvalue()
+
+
+def backdate(instance, days=100):
+    """Soft-delete `instance` and its descendants `days` ago."""
+    instance.soft_delete()
+    deleted_at = timezone.now() - timedelta(days=days)
+    for model in (Comment, Player, Team, UserAccount):
+        model.objects.filter(deleted_at=instance.deleted_at).update(
+            deleted_at=deleted_at
+        )
+
+
+def archive_files(archive_dir):
+    return sorted(path.name for path in archive_dir.glob("*.jsonl.gz"))
+
+
+@pytest.mark.django_db
+class TestPurgeDeletedCommand:
+    # ========================================================================
+    # Positive Cases
+    # ========================================================================
+    def test_purges_rows_deleted_before_retention(self, tmp_path, comments):
+        backdate(comments[0])
+        comments[1].soft_delete()
+
+        purge(tmp_path)
+
+        assert set(Comment.objects.values_list("pk", flat=True)) == {
+            comments[1].pk,
+            comments[2].pk,
+        }
+
+    def test_archive_is_restored_by_loaddata(self, tmp_path, comments):
+        backdate(comments[0])
+
+        purge(tmp_path)
+        [name] = archive_files(tmp_path)
+        call_command("loaddata", str(tmp_path / name), stdout=StringIO())
+
+        restored = Comment.objects.get(pk=comments[0].pk)
+        assert restored.body == comments[0].body
+        assert restored.deleted_at is not None
+
+    def test_purges_team_with_cascaded_rows_and_rollups(
+        self, tmp_path, teams, players, comments
+    ):
+        backdate(teams[0])
+
+        output = purge(tmp_path)
+
+        assert not Team.objects.filter(pk=teams[0].pk).exists()
+        assert not Player.objects.exists()
+        assert not Comment.objects.exists()
+        assert not TeamPlayerStat.objects.filter(team=teams[0]).exists()
+        assert "roster.Player: 3 row(s) purged" in output
+        assert "row(s)/s" in output
+
+    def test_archives_one_file_per_batch(self, tmp_path, general_user, comments):
+        backdate(general_user)
+
+        purge(tmp_path, batch_size=2)
+
+        files = archive_files(tmp_path)
+        assert len([name for name in files if name.startswith("roster.comment")]) == 2
+        assert len([name for name in files if name.startswith("user_account")]) == 1
+        assert not UserAccount.objects.filter(pk=general_user.pk).exists()
+
+    def test_resumes_with_cutoff_of_checkpoint(self, tmp_path, comments):
+        backdate(comments[0], days=100)
+        cutoff = timezone.now() - timedelta(days=200)
+        (tmp_path / "checkpoint.json").write_text(
+            json.dumps({"cutoff": cutoff.isoformat(), "positions": {}})
+        )
+
+        purge(tmp_path)
+
+        assert Comment.objects.filter(pk=comments[0].pk).exists()
+        assert not (tmp_path / "checkpoint.json").exists()
+
+    # ========================================================================
+    # Negative Cases
+    # ========================================================================
+    def test_keeps_rows_deleted_within_retention(self, tmp_path, comments):
+        backdate(comments[0], days=10)
+
+        purge(tmp_path, retention_days=30)
+
+        assert Comment.objects.filter(pk=comments[0].pk).exists()
+        assert archive_files(tmp_path) == []
+
+    def test_keeps_deleted_parent_with_rows_left(self, tmp_path, players, comments):
+        backdate(players[0])
+        Comment.objects.filter(player=players[0]).update(deleted_at=None)
+
+        purge(tmp_path)
+
+        assert Player.objects.filter(pk=players[0].pk).exists()
+        assert Comment.objects.filter(player=players[0]).count() == 2
@@ -0,0 +1,51 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from roster.models import Player, Team
+from user_account.models import UserAccount
+
+
+@pytest.mark.django_db
+class TestRebuildCountersCommand:
+    def test_fixes_drifted_counters(self, comments, players, teams, general_user):
+        Team.objects.update(player_count=0)
+        Player.objects.update(comment_count=42)
+        UserAccount.objects.update(comment_count=0)
+
+        call_command("rebuild_counters", stdout=StringIO())
+
+        teams[0].refresh_from_db()
+        players[0].refresh_from_db()
+        players[2].refresh_from_db()
+        general_user.refresh_from_db()
+
+        assert teams[0].player_count == len(players)
+        assert teams[1].player_count == 0
+        assert players[0].comment_count == 2
+        assert players[2].comment_count == 0
+        assert general_user.comment_count == len(comments)
+
+    def test_ignores_soft_deleted_rows(self, comments, players, general_user):
+        Player.objects.filter(pk=players[0].pk).update(
+            deleted_at=comments[0].created_at
+        )
+        comments[0].soft_delete()
+
+        call_command("rebuild_counters", stdout=StringIO())
+
+        players[0].refresh_from_db()
+        general_user.refresh_from_db()
+        team = players[0].team
+        team.refresh_from_db()
+
+        assert players[0].comment_count == 1
+        assert general_user.comment_count == len(comments) - 1
+        assert team.player_count == len(players) - 1
+
+    def test_reports_nothing_to_fix_when_counters_are_correct(self, comments):
+        out = StringIO()
+        call_command("rebuild_counters", stdout=out)
+
+        assert "roster.Team.player_count: 0 row(s) fixed" in out.getvalue()
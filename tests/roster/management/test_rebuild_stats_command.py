@@ -0,0 +1,55 @@
+from datetime import date
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from roster.models import PlayerCommentStat, SportCommenterStat, TeamPlayerStat
+
+
+@pytest.mark.django_db
+class TestRebuildStatsCommand:
+    def test_recounts_rollups_by_created_at(
+        self, comment_filter_data, players, general_user_2
+    ):
+        call_command("rebuild_stats", stdout=StringIO())
+
+        player_days = set(
+            PlayerCommentStat.objects.values_list("player_id", "day", "comment_count")
+        )
+        commenters = SportCommenterStat.objects.get(
+            user=general_user_2, month=date(2024, 6, 1)
+        )
+
+        assert player_days == {
+            (players[0].id, date(2022, 1, 1), 1),
+            (players[1].id, date(2023, 1, 1), 1),
+            (players[2].id, date(2024, 1, 1), 1),
+            (players[2].id, date(2024, 6, 1), 1),
+        }
+        assert commenters.sport == "baseball"
+        assert commenters.comment_count == 1
+
+    def test_ignores_soft_deleted_rows(self, comments, players, teams):
+        comments[0].soft_delete()
+        players[1].soft_delete()
+        PlayerCommentStat.objects.update(comment_count=42)
+        TeamPlayerStat.objects.all().delete()
+
+        call_command("rebuild_stats", stdout=StringIO())
+
+        assert PlayerCommentStat.objects.get(player=players[0]).comment_count == 1
+        assert TeamPlayerStat.objects.get(team=teams[0]).player_count == 2
+
+    def test_reports_rows_per_rollup(self, comments):
+        out = StringIO()
+        call_command("rebuild_stats", stdout=out)
+
+        assert "roster.PlayerCommentStat: 2 row(s)" in out.getvalue()
+        assert "roster.SportCommenterStat: 1 row(s)" in out.getvalue()
+
+    def test_empty_tables_report_zero_rows(self, db):
+        out = StringIO()
+        call_command("rebuild_stats", stdout=out)
+
+        assert "roster.TeamPlayerStat: 0 row(s)" in out.getvalue()
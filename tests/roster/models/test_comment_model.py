@@ -2,6 +2,7 @@ from uuid import UUID
 
 import pytest
 from django.core.exceptions import ValidationError
+from django.db import connection
 
 from roster.models import Comment
 
@@ -64,3 +65,82 @@ def test_success_to_check_str_method(comments):
     result = comment_over_100.__str__()
 
     assert result == comment_over_100.body[:100] + "..."
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="EXPLAIN format")
+def test_public_list_query_uses_active_created_index(comments):
+    plan = (
+        Comment.objects.filter(deleted_at__isnull=True)
+        .order_by("-created_at", "-id")[:10]
+        .explain()
+    )
+
+    assert "comment_active_created_idx" in plan
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="EXPLAIN format")
+def test_player_comments_query_uses_player_created_index(players, comments):
+    plan = Comment.objects.filter(player=players[0]).order_by("-created_at").explain()
+
+    assert "comment_player_created_idx" in plan
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="EXPLAIN format")
+def test_user_comments_query_uses_user_created_index(general_user, comments):
+    plan = Comment.objects.filter(user=general_user).order_by("-created_at").explain()
+
+    assert "comment_user_created_idx" in plan
+
+
+@pytest.mark.django_db
+def test_creating_comment_increments_player_and_user_comment_count(
+    comments, players, general_user
+):
+    players[0].refresh_from_db()
+    general_user.refresh_from_db()
+
+    assert players[0].comment_count == 2
+    assert general_user.comment_count == len(comments)
+
+
+@pytest.mark.django_db
+def test_soft_delete_decrements_player_and_user_comment_count_once(
+    comments, players, general_user
+):
+    comment = comments[0]
+
+    comment.soft_delete()
+    comment.soft_delete()
+    players[0].refresh_from_db()
+    general_user.refresh_from_db()
+
+    assert players[0].comment_count == 1
+    assert general_user.comment_count == len(comments) - 1
+
+
+@pytest.mark.django_db
+def test_soft_delete_keeps_the_first_stamp_and_bumps_updated_at(comments):
+    comment = comments[0]
+    updated_at = comment.updated_at
+
+    comment.soft_delete()
+    deleted_at = comment.deleted_at
+    comment.soft_delete()
+
+    assert comment.deleted_at == deleted_at
+    assert comment.updated_at > updated_at
+
+
+@pytest.mark.django_db
+def test_restore_undoes_soft_delete_and_comment_count(comments, players):
+    comment = comments[0]
+
+    comment.soft_delete()
+    comment.restore()
+    players[0].refresh_from_db()
+
+    assert comment.deleted_at is None
+    assert players[0].comment_count == 2
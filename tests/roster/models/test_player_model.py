@@ -2,6 +2,7 @@ from uuid import UUID
 
 import pytest
 from django.core.exceptions import ValidationError
+from django.db import connection
 
 from roster.models import Player
 
@@ -82,3 +83,49 @@ def test_success_to_check_str_method(players):
     result = player.__str__()
 
     assert result == player.first_name + player.last_name
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="EXPLAIN format")
+def test_public_list_query_uses_active_created_index(players):
+    plan = (
+        Player.objects.filter(deleted_at__isnull=True)
+        .order_by("-created_at", "-id")[:10]
+        .explain()
+    )
+
+    assert "player_active_created_idx" in plan
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="EXPLAIN format")
+def test_team_players_query_uses_team_created_index(teams, players):
+    plan = Player.objects.filter(team=teams[0]).order_by("-created_at").explain()
+
+    assert "player_team_created_idx" in plan
+
+
+@pytest.mark.django_db
+def test_creating_player_increments_team_player_count(players, teams):
+    teams[0].refresh_from_db()
+
+    assert teams[0].player_count == len(players)
+
+
+@pytest.mark.django_db
+def test_soft_delete_decrements_team_player_count_once(players, teams):
+    player = players[0]
+
+    player.soft_delete()
+    player.soft_delete()
+    teams[0].refresh_from_db()
+
+    assert teams[0].player_count == len(players) - 1
+
+
+@pytest.mark.django_db
+def test_deleting_player_decrements_team_player_count(players, teams):
+    players[0].delete()
+    teams[0].refresh_from_db()
+
+    assert teams[0].player_count == len(players) - 1
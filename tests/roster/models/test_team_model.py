@@ -2,6 +2,7 @@ from uuid import UUID
 
 import pytest
 from django.core.exceptions import ValidationError
+from django.db import connection
 
 from roster.models import Team
 
@@ -88,3 +89,15 @@ def test_success_to_check_str_method(teams):
     result = team.__str__()
 
     assert result == team.name
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="EXPLAIN format")
+def test_public_list_query_uses_active_created_index(teams):
+    plan = (
+        Team.objects.filter(deleted_at__isnull=True)
+        .order_by("-created_at", "-id")[:10]
+        .explain()
+    )
+
+    assert "team_active_created_idx" in plan
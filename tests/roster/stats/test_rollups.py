@@ -0,0 +1,229 @@
+import pytest
+from django.utils import timezone
+
+from roster.models import (
+    Comment,
+    Player,
+    PlayerCommentStat,
+    SportCommenterStat,
+    Team,
+    TeamPlayerStat,
+)
+from roster.serializers.comment import CommentPatchSerializer
+from roster.serializers.player import PlayerPatchSerializer
+from roster.serializers.team import TeamPatchSerializer
+from roster.stats import rebuild_stats
+
+
+def rollup_rows():
+    return {
+        "player_comments": set(
+            PlayerCommentStat.objects.filter(comment_count__gt=0).values_list(
+                "player_id", "day", "comment_count"
+            )
+        ),
+        "team_players": set(
+            TeamPlayerStat.objects.filter(player_count__gt=0).values_list(
+                "team_id", "month", "player_count"
+            )
+        ),
+        "sport_commenters": set(
+            SportCommenterStat.objects.filter(comment_count__gt=0).values_list(
+                "sport", "month", "user_id", "comment_count"
+            )
+        ),
+    }
+
+
+def player_day_count(player, day):
+    return PlayerCommentStat.objects.get(player=player, day=day).comment_count
+
+
+@pytest.fixture
+def today():
+    return timezone.localdate()
+
+
+@pytest.fixture
+def this_month(today):
+    return today.replace(day=1)
+
+
+@pytest.mark.django_db
+class TestStatsRollups:
+    # ========================================================================
+    # Creates
+    # ========================================================================
+    def test_comment_create_counts_player_day(self, comments, players, today):
+        assert player_day_count(players[0], today) == 2
+        assert player_day_count(players[1], today) == 1
+
+    def test_comment_create_counts_sport_commenter(
+        self, comments, general_user, this_month
+    ):
+        stat = SportCommenterStat.objects.get(
+            sport="baseball", month=this_month, user=general_user
+        )
+
+        assert stat.comment_count == len(comments)
+
+    def test_player_create_counts_team_month(self, players, teams, this_month):
+        stat = TeamPlayerStat.objects.get(team=teams[0], month=this_month)
+
+        assert stat.player_count == len(players)
+
+    def test_bulk_create_counts_every_comment(
+        self, api_client, comment_bulk_create_url, general_user, players, today
+    ):
+        api_client.force_authenticate(user=general_user)
+        response = api_client.post(
+            comment_bulk_create_url,
+            data=[
+                {"player_id": str(players[2].id), "body": "Bulk One"},
+                {"player_id": str(players[2].id), "body": "Bulk Two"},
+            ],
+            format="json",
+        )
+
+        assert response.status_code == 201
+        assert player_day_count(players[2], today) == 2
+
+    # ========================================================================
+    # Deletes
+    # ========================================================================
+    def test_soft_delete_uncounts_comment_once(self, comments, players, today):
+        comments[0].soft_delete()
+        comments[0].soft_delete()
+
+        assert player_day_count(players[0], today) == 1
+
+    def test_soft_delete_uncounts_player(self, players, teams, this_month):
+        players[0].soft_delete()
+
+        stat = TeamPlayerStat.objects.get(team=teams[0], month=this_month)
+        assert stat.player_count == len(players) - 1
+
+    def test_hard_delete_uncounts_comment(self, comments, general_user, this_month):
+        comments[2].delete()
+
+        stat = SportCommenterStat.objects.get(
+            sport="baseball", month=this_month, user=general_user
+        )
+        assert stat.comment_count == len(comments) - 1
+
+    # ========================================================================
+    # Reassignments
+    # ========================================================================
+    def test_moving_comment_moves_player_day(self, comments, players, today):
+        serializer = CommentPatchSerializer(
+            comments[0], data={"player_id": str(players[2].id)}, partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        assert player_day_count(players[0], today) == 1
+        assert player_day_count(players[2], today) == 1
+
+    def test_moving_player_to_team_of_other_sport_moves_commenters(
+        self, comments, players, teams, general_user, this_month
+    ):
+        serializer = PlayerPatchSerializer(
+            players[0], data={"team_id": str(teams[1].id)}, partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        stats = dict(
+            SportCommenterStat.objects.filter(
+                month=this_month, user=general_user
+            ).values_list("sport", "comment_count")
+        )
+        assert stats == {"baseball": 1, "basketball": 2}
+        assert TeamPlayerStat.objects.get(team=teams[1]).player_count == 1
+
+    def test_changing_team_sport_moves_commenters(
+        self, comments, teams, general_user, this_month
+    ):
+        serializer = TeamPatchSerializer(
+            teams[0], data={"sport": "football"}, partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        stats = dict(
+            SportCommenterStat.objects.filter(
+                month=this_month, user=general_user
+            ).values_list("sport", "comment_count")
+        )
+        assert stats == {"baseball": 0, "football": len(comments)}
+
+    def test_incremental_rollups_match_rebuild(self, comments, players, teams):
+        comments[1].soft_delete()
+        players[1].soft_delete()
+        Comment.objects.create(
+            user=comments[0].user, player=players[2], body="Another Comment"
+        )
+        Player.objects.create(first_name="New", last_name="Player", team=teams[2])
+
+        incremental = rollup_rows()
+        rebuild_stats()
+
+        assert rollup_rows() == incremental
+
+    def test_bulk_moves_match_rebuild(self, comments, players, teams):
+        players[2].soft_delete()
+        updates = [
+            (
+                Comment,
+                CommentPatchSerializer,
+                [{"id": str(comments[0].id), "player_id": str(players[1].id)}],
+            ),
+            (
+                Player,
+                PlayerPatchSerializer,
+                [
+                    {"id": str(players[0].id), "team_id": str(teams[1].id)},
+                    {"id": str(players[2].id), "team_id": str(teams[2].id)},
+                ],
+            ),
+            (
+                Team,
+                TeamPatchSerializer,
+                [{"id": str(teams[1].id), "sport": "football"}],
+            ),
+        ]
+        for model, serializer_class, data in updates:
+            instances = model.objects.select_related().in_bulk(
+                [item["id"] for item in data]
+            )
+            serializer = serializer_class(instances, data=data, many=True, partial=True)
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+
+        incremental = rollup_rows()
+        rebuild_stats()
+
+        assert rollup_rows() == incremental
+
+    # ========================================================================
+    # Negative Cases
+    # ========================================================================
+    def test_removing_uncounted_rows_does_not_go_below_zero(self, comments, players):
+        PlayerCommentStat.objects.all().delete()
+
+        comments[0].soft_delete()
+
+        assert not PlayerCommentStat.objects.filter(player=players[0]).exists()
+
+    def test_moving_soft_deleted_comment_does_not_change_player_days(
+        self, comments, players, today
+    ):
+        comments[0].soft_delete()
+        serializer = CommentPatchSerializer(
+            comments[0], data={"player_id": str(players[2].id)}, partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        assert player_day_count(players[0], today) == 1
+        assert not PlayerCommentStat.objects.filter(player=players[2]).exists()
@@ -1,8 +1,12 @@
+import json
 from uuid import uuid4
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils.dateparse import parse_datetime
 
+from core.cache import invalidate_models
 from core.tests.test_base import TestBase
 from roster.models import Comment
 
@@ -84,6 +88,107 @@ class TestCommentViewSet(TestBase):
         assert response.status_code == 400
         assert "player_id" in response.data
 
+    # ========================================================================
+    # Bulk Create Action - Positive Cases
+    # ========================================================================
+    def test_bulk_create_returns_201_and_saves_comments_for_request_user(
+        self, api_client, comment_bulk_create_url, general_user, players
+    ):
+        api_client.force_authenticate(user=general_user)
+        data = [
+            {"body": "Bulk Comment 1", "player_id": str(players[0].id)},
+            {"body": "Bulk Comment 2", "player_id": str(players[1].id)},
+        ]
+        response = api_client.post(comment_bulk_create_url, data=data, format="json")
+
+        assert response.status_code == 201
+        assert response.data[1]["player"]["team"]["id"] == str(players[1].team_id)
+        assert (
+            Comment.objects.filter(user=general_user, body__startswith="Bulk").count()
+            == 2
+        )
+
+    # ========================================================================
+    # Bulk Create Action - Negative Cases
+    # ========================================================================
+    def test_bulk_create_returns_401_for_anonymous_user(
+        self, api_client, comment_bulk_create_url, comment_data_from_view
+    ):
+        response = api_client.post(
+            comment_bulk_create_url, data=[comment_data_from_view], format="json"
+        )
+
+        assert response.status_code == 401
+
+    def test_bulk_create_fails_when_exceeding_max_items(
+        self, api_client, comment_bulk_create_url, general_user, players
+    ):
+        api_client.force_authenticate(user=general_user)
+        data = [{"body": "Bulk Comment", "player_id": str(players[0].id)}] * 1001
+        response = api_client.post(comment_bulk_create_url, data=data, format="json")
+
+        assert response.status_code == 400
+        assert not Comment.objects.filter(body="Bulk Comment").exists()
+
+    # ========================================================================
+    # Bulk Update Action - Positive Cases
+    # ========================================================================
+    def test_bulk_update_moves_comments_and_player_comment_counts(
+        self, api_client, comment_bulk_create_url, admin_user, players, comments
+    ):
+        api_client.force_authenticate(user=admin_user)
+        data = [
+            {"id": str(comment.id), "player_id": str(players[2].id)}
+            for comment in comments[:2]
+        ]
+        response = api_client.patch(comment_bulk_create_url, data=data, format="json")
+
+        assert response.status_code == 200
+        assert {item["player"]["id"] for item in response.data} == {str(players[2].id)}
+        players[0].refresh_from_db()
+        players[2].refresh_from_db()
+        assert (players[0].comment_count, players[2].comment_count) == (0, 2)
+
+    # ========================================================================
+    # Bulk Update Action - Negative Cases
+    # ========================================================================
+    def test_bulk_update_returns_403_for_comment_owner(
+        self, api_client, comment_bulk_create_url, general_user, comments
+    ):
+        api_client.force_authenticate(user=general_user)
+        data = [{"id": str(comments[0].id), "body": "Edited"}]
+        response = api_client.patch(comment_bulk_create_url, data=data, format="json")
+
+        assert response.status_code == 403
+
+    # ========================================================================
+    # Bulk Destroy Action - Positive Cases
+    # ========================================================================
+    def test_bulk_destroy_soft_deletes_comments_and_uncounts_them(
+        self, api_client, comment_bulk_create_url, super_user, players, comments
+    ):
+        api_client.force_authenticate(user=super_user)
+        data = [str(comments[0].id), str(comments[1].id)]
+        response = api_client.delete(comment_bulk_create_url, data=data, format="json")
+
+        assert response.status_code == 200
+        assert Comment.objects.filter(deleted_at__isnull=True).count() == 1
+        players[0].refresh_from_db()
+        assert players[0].comment_count == 0
+
+    # ========================================================================
+    # Bulk Destroy Action - Negative Cases
+    # ========================================================================
+    def test_bulk_destroy_returns_403_for_comment_owner(
+        self, api_client, comment_bulk_create_url, general_user, comments
+    ):
+        api_client.force_authenticate(user=general_user)
+        response = api_client.delete(
+            comment_bulk_create_url, data=[str(comments[0].id)], format="json"
+        )
+
+        assert response.status_code == 403
+
     # ========================================================================
     # List Action - Positive Cases
     # ========================================================================
@@ -534,6 +639,77 @@ class TestCommentViewSet(TestBase):
 
         assert created_at_data == descending
 
+    def test_list_runs_constant_number_of_queries_regardless_of_page_size(
+        self, api_client, comment_list_url, general_user, general_user_2, players
+    ):
+        Comment.objects.create(user=general_user, player=players[0], body="Body")
+
+        with CaptureQueriesContext(connection) as small_page_queries:
+            api_client.get(comment_list_url)
+
+        Comment.objects.bulk_create(
+            [
+                Comment(
+                    user=[general_user, general_user_2][i % 2],
+                    player=players[i % len(players)],
+                    body=f"Body {i}",
+                )
+                for i in range(10)
+            ]
+        )
+        invalidate_models(Comment)
+
+        with CaptureQueriesContext(connection) as full_page_queries:
+            response = api_client.get(comment_list_url)
+
+        assert len(response.data["results"]) == 10
+        assert len(full_page_queries) == len(small_page_queries)
+
+    def test_list_supports_cursor_pagination(
+        self, api_client, comment_list_url, comments
+    ):
+        url = comment_list_url + "?pagination=cursor"
+        response = api_client.get(url)
+
+        ids = [item["id"] for item in response.data["results"]]
+        expected_ids = [
+            str(comment.id)
+            for comment in Comment.objects.order_by("-created_at", "-pk")
+        ]
+
+        assert set(response.data.keys()) == {"next", "previous", "results"}
+        assert ids == expected_ids
+
+    # ========================================================================
+    # Export Action - Positive Cases
+    # ========================================================================
+    def test_export_streams_all_comments_with_one_query(
+        self, api_client, comment_export_url, comments, general_user
+    ):
+        api_client.force_authenticate(user=general_user)
+        response = api_client.get(comment_export_url)
+
+        with CaptureQueriesContext(connection) as queries:
+            rows = [json.loads(line) for line in self.get_streamed_lines(response)]
+
+        assert len(rows) == len(comments)
+        assert rows[0]["player"]["team"]["id"] == str(comments[0].player.team_id)
+        assert len(queries) == 1
+
+    def test_export_csv_escapes_formulas(
+        self, api_client, comment_export_url, comments, general_user
+    ):
+        Comment.objects.filter(id=comments[0].id).update(body="=HYPERLINK(1)")
+        Comment.objects.filter(id=comments[1].id).update(body="-1")
+        api_client.force_authenticate(user=general_user)
+
+        response = api_client.get(comment_export_url + "?export_format=csv")
+        content = "\n".join(self.get_streamed_lines(response))
+
+        assert "'=HYPERLINK(1)" in content
+        assert "'-1" in content
+        assert "\n=HYPERLINK" not in content and ",=HYPERLINK" not in content
+
     # ========================================================================
     # Retrieve Action - Positive Cases
     # ========================================================================
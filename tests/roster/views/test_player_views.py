@@ -1,10 +1,14 @@
+import json
 from uuid import uuid4
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils.dateparse import parse_datetime
 
+from core.cache import invalidate_models
 from core.tests.test_base import TestBase
-from roster.models import Player
+from roster.models import Comment, Player
 
 
 @pytest.mark.django_db
@@ -100,6 +104,267 @@ class TestPlayerViewSet(TestBase):
         assert response.status_code == 400
         assert field in response.data
 
+    # ========================================================================
+    # Bulk Create Action - Positive Cases
+    # ========================================================================
+    def test_bulk_create_returns_201_and_saves_all_players(
+        self, api_client, player_bulk_create_url, admin_user, teams
+    ):
+        api_client.force_authenticate(user=admin_user)
+        data = [
+            {"first_name": "Bulk", "last_name": "One", "team_id": str(teams[0].id)},
+            {"first_name": "Bulk", "last_name": "Two", "team_id": str(teams[1].id)},
+        ]
+        response = api_client.post(player_bulk_create_url, data=data, format="json")
+
+        assert response.status_code == 201
+        assert [item["team"]["id"] for item in response.data] == [
+            str(teams[0].id),
+            str(teams[1].id),
+        ]
+        assert Player.objects.filter(first_name="Bulk").count() == 2
+
+    def test_bulk_create_resolves_team_ids_with_one_query(
+        self, api_client, player_bulk_create_url, admin_user, teams
+    ):
+        api_client.force_authenticate(user=admin_user)
+
+        def build_data(size):
+            return [
+                {
+                    "first_name": "Bulk",
+                    "last_name": "Player",
+                    "team_id": str(teams[i % len(teams)].id),
+                }
+                for i in range(size)
+            ]
+
+        with CaptureQueriesContext(connection) as small:
+            api_client.post(player_bulk_create_url, data=build_data(3), format="json")
+        with CaptureQueriesContext(connection) as large:
+            api_client.post(player_bulk_create_url, data=build_data(30), format="json")
+
+        assert len(small) == len(large)
+
+    def test_bulk_create_increments_team_player_count(
+        self, api_client, player_bulk_create_url, admin_user, teams
+    ):
+        api_client.force_authenticate(user=admin_user)
+        data = [
+            {"first_name": "Bulk", "last_name": "Player", "team_id": str(teams[1].id)}
+        ] * 3
+        api_client.post(player_bulk_create_url, data=data, format="json")
+
+        teams[1].refresh_from_db()
+
+        assert teams[1].player_count == 3
+
+    # ========================================================================
+    # Bulk Create Action - Negative Cases
+    # ========================================================================
+    def test_bulk_create_returns_401_for_anonymous_user(
+        self, api_client, player_bulk_create_url, player_data
+    ):
+        response = api_client.post(
+            player_bulk_create_url, data=[player_data], format="json"
+        )
+
+        assert response.status_code == 401
+
+    def test_bulk_create_returns_per_item_errors_for_nonexistent_team_id(
+        self, api_client, player_bulk_create_url, admin_user, player_data
+    ):
+        api_client.force_authenticate(user=admin_user)
+        invalid_data = {**player_data, "team_id": str(uuid4())}
+        malformed_data = {**player_data, "team_id": "not-a-uuid"}
+        response = api_client.post(
+            player_bulk_create_url,
+            data=[player_data, invalid_data, malformed_data],
+            format="json",
+        )
+
+        assert response.status_code == 400
+        assert response.data[0] == {}
+        assert response.data[1]["team_id"][0].code == "does_not_exist"
+        assert response.data[2]["team_id"][0].code == "incorrect_type"
+        assert not Player.objects.filter(first_name=player_data["first_name"]).exists()
+
+    # ========================================================================
+    # Bulk Update Action - Positive Cases
+    # ========================================================================
+    def test_bulk_update_returns_200_and_updates_players_in_order(
+        self, api_client, player_bulk_create_url, admin_user, teams, players
+    ):
+        api_client.force_authenticate(user=admin_user)
+        data = [
+            {"id": str(players[1].id), "team_id": str(teams[1].id)},
+            {"id": str(players[0].id), "first_name": "Traded"},
+        ]
+        response = api_client.patch(player_bulk_create_url, data=data, format="json")
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.data] == [
+            str(players[1].id),
+            str(players[0].id),
+        ]
+        assert response.data[0]["team"]["id"] == str(teams[1].id)
+        players[0].refresh_from_db()
+        players[1].refresh_from_db()
+        assert players[0].first_name == "Traded"
+        assert players[0].updated_at > players[0].created_at
+        assert players[1].team_id == teams[1].id
+
+    def test_bulk_update_moves_team_player_counts_and_stats(
+        self, api_client, player_bulk_create_url, admin_user, teams, players
+    ):
+        api_client.force_authenticate(user=admin_user)
+        data = [
+            {"id": str(player.id), "team_id": str(teams[2].id)} for player in players
+        ]
+        api_client.patch(player_bulk_create_url, data=data[:2], format="json")
+
+        teams[0].refresh_from_db()
+        teams[2].refresh_from_db()
+        assert (teams[0].player_count, teams[2].player_count) == (1, 2)
+        assert teams[2].player_stats.get().player_count == 2
+
+    def test_bulk_update_runs_same_queries_for_any_number_of_players(
+        self, api_client, player_bulk_create_url, admin_user, teams
+    ):
+        api_client.force_authenticate(user=admin_user)
+        players = [
+            Player.objects.create(first_name="Bulk", last_name="Player", team=teams[0])
+            for _ in range(20)
+        ]
+
+        def build_data(size):
+            return [
+                {"id": str(player.id), "team_id": str(teams[1 + i % 2].id)}
+                for i, player in enumerate(players[:size])
+            ]
+
+        with CaptureQueriesContext(connection) as small:
+            api_client.patch(player_bulk_create_url, data=build_data(2), format="json")
+        with CaptureQueriesContext(connection) as large:
+            api_client.patch(player_bulk_create_url, data=build_data(20), format="json")
+
+        assert len(small) == len(large)
+
+    def test_bulk_update_writes_only_columns_set_by_items(
+        self, api_client, player_bulk_create_url, admin_user, teams, players
+    ):
+        api_client.force_authenticate(user=admin_user)
+        data = [{"id": str(players[0].id), "team_id": str(teams[1].id)}]
+        with CaptureQueriesContext(connection) as captured:
+            api_client.patch(player_bulk_create_url, data=data, format="json")
+
+        [update] = [
+            query["sql"]
+            for query in captured.captured_queries
+            if query["sql"].startswith('UPDATE "roster_player"')
+        ]
+        assert '"team_id"' in update
+        assert '"first_name"' not in update
+
+    # ========================================================================
+    # Bulk Update Action - Negative Cases
+    # ========================================================================
+    def test_bulk_update_returns_403_for_general_user(
+        self, api_client, player_bulk_create_url, general_user, players
+    ):
+        api_client.force_authenticate(user=general_user)
+        data = [{"id": str(players[0].id), "first_name": "Traded"}]
+        response = api_client.patch(player_bulk_create_url, data=data, format="json")
+
+        assert response.status_code == 403
+
+    def test_bulk_update_returns_per_item_errors_and_saves_nothing(
+        self, api_client, player_bulk_create_url, admin_user, teams, players
+    ):
+        api_client.force_authenticate(user=admin_user)
+        data = [
+            {"id": str(players[0].id), "team_id": str(teams[1].id)},
+            {"id": str(uuid4()), "first_name": "Ghost"},
+            {"id": str(players[1].id), "team_id": str(uuid4())},
+            {"id": str(players[0].id), "first_name": "Twice"},
+            {"first_name": "NoId"},
+        ]
+        response = api_client.patch(player_bulk_create_url, data=data, format="json")
+
+        assert response.status_code == 400
+        assert response.data[0] == {}
+        assert response.data[1]["id"] == ["Not found."]
+        assert response.data[2]["team_id"][0].code == "does_not_exist"
+        assert response.data[3]["id"] == ["Duplicate ID."]
+        assert response.data[4]["id"] == ["This field is required."]
+        players[0].refresh_from_db()
+        assert players[0].team_id == teams[0].id
+
+    # ========================================================================
+    # Bulk Destroy Action - Positive Cases
+    # ========================================================================
+    def test_bulk_destroy_soft_deletes_players_and_returns_per_item_status(
+        self, api_client, player_bulk_create_url, super_user, teams, players, comments
+    ):
+        api_client.force_authenticate(user=super_user)
+        missing_id = str(uuid4())
+        data = [str(players[0].id), missing_id, str(players[1].id)]
+        response = api_client.delete(player_bulk_create_url, data=data, format="json")
+
+        assert response.status_code == 200
+        assert response.data == [
+            {"id": str(players[0].id), "status": 204},
+            {"id": missing_id, "status": 404},
+            {"id": str(players[1].id), "status": 204},
+        ]
+        assert Player.objects.filter(deleted_at__isnull=False).count() == 2
+        assert not Comment.objects.filter(
+            player__in=players[:2], deleted_at__isnull=True
+        ).exists()
+        teams[0].refresh_from_db()
+        assert teams[0].player_count == 1
+
+    def test_bulk_destroy_runs_same_queries_for_any_number_of_players(
+        self, api_client, player_bulk_create_url, super_user, teams
+    ):
+        api_client.force_authenticate(user=super_user)
+        players = [
+            Player.objects.create(first_name="Bulk", last_name="Player", team=teams[0])
+            for _ in range(20)
+        ]
+        ids = [str(player.id) for player in players]
+
+        with CaptureQueriesContext(connection) as small:
+            api_client.delete(player_bulk_create_url, data=ids[:2], format="json")
+        with CaptureQueriesContext(connection) as large:
+            api_client.delete(player_bulk_create_url, data=ids[2:], format="json")
+
+        assert len(small) == len(large)
+
+    # ========================================================================
+    # Bulk Destroy Action - Negative Cases
+    # ========================================================================
+    def test_bulk_destroy_returns_403_for_admin_user(
+        self, api_client, player_bulk_create_url, admin_user, players
+    ):
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.delete(
+            player_bulk_create_url, data=[str(players[0].id)], format="json"
+        )
+
+        assert response.status_code == 403
+
+    def test_bulk_destroy_returns_400_for_malformed_ids(
+        self, api_client, player_bulk_create_url, super_user, players
+    ):
+        api_client.force_authenticate(user=super_user)
+        response = api_client.delete(
+            player_bulk_create_url, data=[str(players[0].id), "1"], format="json"
+        )
+
+        assert response.status_code == 400
+        assert not Player.objects.filter(deleted_at__isnull=False).exists()
+
     # ========================================================================
     # List Action - Positive Cases
     # ========================================================================
@@ -137,7 +402,14 @@ class TestPlayerViewSet(TestBase):
         response = api_client.get(player_list_url)
 
         player_data = response.data["results"][0]
-        expected_fields = {"id", "first_name", "last_name", "created_at", "team"}
+        expected_fields = {
+            "id",
+            "first_name",
+            "last_name",
+            "created_at",
+            "comment_count",
+            "team",
+        }
 
         assert set(player_data.keys()) == expected_fields
 
@@ -158,6 +430,7 @@ class TestPlayerViewSet(TestBase):
             "first_name",
             "last_name",
             "created_at",
+            "comment_count",
             "updated_at",
             "deleted_at",
             "team",
@@ -465,6 +738,115 @@ class TestPlayerViewSet(TestBase):
 
         assert created_at_data == descending
 
+    def test_list_orders_by_comment_count(
+        self, api_client, player_list_url, players, comments
+    ):
+        response = api_client.get(player_list_url + "?ordering=-comment_count")
+
+        comment_counts = [item["comment_count"] for item in response.data["results"]]
+
+        assert comment_counts == [2, 1, 0]
+
+    def test_list_runs_constant_number_of_queries_regardless_of_page_size(
+        self, api_client, player_list_url, teams
+    ):
+        Player.objects.create(first_name="First", last_name="Last", team=teams[0])
+
+        with CaptureQueriesContext(connection) as small_page_queries:
+            api_client.get(player_list_url)
+
+        Player.objects.bulk_create(
+            [
+                Player(first_name="First", last_name="Last", team=teams[i % len(teams)])
+                for i in range(10)
+            ]
+        )
+        invalidate_models(Player)
+
+        with CaptureQueriesContext(connection) as full_page_queries:
+            response = api_client.get(player_list_url)
+
+        assert len(response.data["results"]) == 10
+        assert len(full_page_queries) == len(small_page_queries)
+
+    # ========================================================================
+    # Export Action - Positive Cases
+    # ========================================================================
+    def test_export_streams_ndjson_with_public_fields(
+        self, api_client, player_export_url, players, general_user
+    ):
+        players[0].soft_delete()
+        api_client.force_authenticate(user=general_user)
+        response = api_client.get(player_export_url)
+
+        rows = [json.loads(line) for line in self.get_streamed_lines(response)]
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert len(rows) == len(players) - 1
+        assert set(rows[0].keys()) == {
+            "id",
+            "first_name",
+            "last_name",
+            "created_at",
+            "comment_count",
+            "team",
+        }
+
+    def test_export_includes_soft_deleted_player_and_admin_fields_for_admin(
+        self, api_client, player_export_url, players, admin_user
+    ):
+        players[0].soft_delete()
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get(player_export_url)
+
+        rows = [json.loads(line) for line in self.get_streamed_lines(response)]
+
+        assert len(rows) == len(players)
+        assert "deleted_at" in rows[0]
+
+    def test_export_streams_csv_with_flattened_nested_fields(
+        self, api_client, player_export_url, players, general_user
+    ):
+        api_client.force_authenticate(user=general_user)
+        response = api_client.get(player_export_url + "?export_format=csv")
+
+        lines = self.get_streamed_lines(response)
+
+        assert response["Content-Type"] == "text/csv"
+        assert 'filename="players.csv"' in response["Content-Disposition"]
+        assert lines[0] == (
+            "id,first_name,last_name,created_at,comment_count,team.id,team.name"
+        )
+        assert len(lines) == len(players) + 1
+
+    def test_export_respects_list_filters(
+        self, api_client, player_export_url, players, general_user
+    ):
+        api_client.force_authenticate(user=general_user)
+        response = api_client.get(player_export_url + "?search=Hello")
+
+        rows = [json.loads(line) for line in self.get_streamed_lines(response)]
+
+        assert [row["id"] for row in rows] == [str(players[1].id)]
+
+    # ========================================================================
+    # Export Action - Negative Cases
+    # ========================================================================
+    def test_export_fails_with_unknown_export_format(
+        self, api_client, player_export_url, general_user
+    ):
+        api_client.force_authenticate(user=general_user)
+        response = api_client.get(player_export_url + "?export_format=xml")
+
+        assert response.status_code == 400
+        assert "export_format" in response.data
+
+    def test_export_fails_with_anonymous_user(self, api_client, player_export_url):
+        response = api_client.get(player_export_url)
+
+        assert response.status_code == 401
+
     # ========================================================================
     # Retrieve Action - Positive Cases
     # ========================================================================
@@ -510,7 +892,14 @@ class TestPlayerViewSet(TestBase):
         response = api_client.get(url)
 
         player_data = response.data
-        expected_fields = {"id", "first_name", "last_name", "created_at", "team"}
+        expected_fields = {
+            "id",
+            "first_name",
+            "last_name",
+            "created_at",
+            "comment_count",
+            "team",
+        }
 
         assert set(player_data.keys()) == expected_fields
 
@@ -533,6 +922,7 @@ class TestPlayerViewSet(TestBase):
             "first_name",
             "last_name",
             "created_at",
+            "comment_count",
             "updated_at",
             "deleted_at",
             "team",
@@ -595,6 +985,20 @@ class TestPlayerViewSet(TestBase):
 
         assert response.status_code == 200
 
+    def test_patch_with_team_id_moves_player_count(
+        self, api_client, player_detail_url, players, teams, admin_user
+    ):
+        api_client.force_authenticate(user=admin_user)
+        api_client.patch(
+            player_detail_url(players[0].id), data={"team_id": teams[1].id}
+        )
+
+        teams[0].refresh_from_db()
+        teams[1].refresh_from_db()
+
+        assert teams[0].player_count == len(players) - 1
+        assert teams[1].player_count == 1
+
     @pytest.mark.parametrize(
         "field, value",
         [("first_name", "PatchFirstName"), ("last_name", "PatchLastName")],
@@ -975,6 +1379,34 @@ class TestPlayerViewSet(TestBase):
 
         assert response_created_at == descending_order
 
+    def test_comments_runs_constant_number_of_queries_regardless_of_page_size(
+        self, api_client, player_comments_url, players, general_user, general_user_2
+    ):
+        player = players[0]
+        url = player_comments_url(player.id)
+        Comment.objects.create(user=general_user, player=player, body="Body")
+
+        with CaptureQueriesContext(connection) as small_page_queries:
+            api_client.get(url)
+
+        Comment.objects.bulk_create(
+            [
+                Comment(
+                    user=[general_user, general_user_2][i % 2],
+                    player=player,
+                    body=f"Body {i}",
+                )
+                for i in range(10)
+            ]
+        )
+        invalidate_models(Comment)
+
+        with CaptureQueriesContext(connection) as full_page_queries:
+            response = api_client.get(url)
+
+        assert len(response.data["results"]) == 10
+        assert len(full_page_queries) == len(small_page_queries)
+
     # ========================================================================
     # Comments Action - Negative Cases
     # ========================================================================
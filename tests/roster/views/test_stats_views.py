@@ -0,0 +1,152 @@
+from datetime import date
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from core.tests.test_base import TestBase
+from roster.models import Comment
+
+STAT_URLS = [
+    "player_comment_stat_list_url",
+    "team_player_stat_list_url",
+    "sport_commenter_stat_list_url",
+]
+
+
+@pytest.fixture
+def dated_stats(comment_filter_data, player_filter_data):
+    # The fixtures backdate `created_at` with `bulk_update`, past the rollups.
+    call_command("rebuild_stats", stdout=StringIO())
+    return comment_filter_data
+
+
+@pytest.mark.django_db
+class TestStatsViewSets(TestBase):
+    # ========================================================================
+    # List Action - Positive Cases
+    # ========================================================================
+    def test_player_comments_returns_rows_per_player_and_day(
+        self, api_client, player_comment_stat_list_url, admin_user, comments, players
+    ):
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get(player_comment_stat_list_url)
+
+        assert response.status_code == 200
+        counts = {
+            row["player"]: row["comment_count"] for row in response.data["results"]
+        }
+        assert counts == {players[0].id: 2, players[1].id: 1}
+        assert set(response.data["results"][0]) == {"player", "day", "comment_count"}
+
+    def test_team_players_returns_rows_per_team_and_month(
+        self, api_client, team_player_stat_list_url, admin_user, players, teams
+    ):
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get(team_player_stat_list_url)
+
+        assert response.status_code == 200
+        assert response.data["count"] == 1
+        assert response.data["results"][0]["team"] == teams[0].id
+        assert response.data["results"][0]["player_count"] == len(players)
+
+    def test_sport_commenters_counts_users_per_sport_and_month(
+        self, api_client, sport_commenter_stat_list_url, admin_user, dated_stats
+    ):
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get(
+            sport_commenter_stat_list_url, {"created_at_year_gte": 2024}
+        )
+
+        assert response.status_code == 200
+        assert response.data["results"] == [
+            {
+                "sport": "baseball",
+                "month": "2024-06-01",
+                "active_commenters": 1,
+                "comment_count": 1,
+            },
+            {
+                "sport": "baseball",
+                "month": "2024-01-01",
+                "active_commenters": 1,
+                "comment_count": 1,
+            },
+        ]
+
+    def test_year_filters_select_rows_of_the_years(
+        self, api_client, player_comment_stat_list_url, admin_user, dated_stats
+    ):
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get(
+            player_comment_stat_list_url,
+            {"created_at_year_gte": 2023, "created_at_year_lte": 2023},
+        )
+
+        assert response.status_code == 200
+        assert [row["day"] for row in response.data["results"]] == [
+            date(2023, 1, 1).isoformat()
+        ]
+
+    def test_sport_filter_selects_teams_of_the_sport(
+        self, api_client, team_player_stat_list_url, admin_user, player_filter_data
+    ):
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get(team_player_stat_list_url, {"sport": "football"})
+
+        assert response.status_code == 200
+        assert [row["player_count"] for row in response.data["results"]] == [2]
+
+    def test_new_comment_is_listed_after_cached_response(
+        self,
+        api_client,
+        player_comment_stat_list_url,
+        admin_user,
+        general_user,
+        players,
+    ):
+        api_client.force_authenticate(user=admin_user)
+        first = api_client.get(player_comment_stat_list_url)
+        Comment.objects.create(user=general_user, player=players[0], body="Body")
+        second = api_client.get(player_comment_stat_list_url)
+
+        assert first.data["count"] == 0
+        assert second.data["count"] == 1
+
+    def test_soft_deleted_rows_are_not_listed(
+        self, api_client, player_comment_stat_list_url, admin_user, comments
+    ):
+        comments[2].soft_delete()
+
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get(player_comment_stat_list_url)
+
+        assert response.data["count"] == 1
+
+    # ========================================================================
+    # List Action - Negative Cases
+    # ========================================================================
+    @pytest.mark.parametrize("url", STAT_URLS)
+    def test_list_returns_401_for_anonymous_user(self, url, api_client, request):
+        response = api_client.get(request.getfixturevalue(url))
+
+        assert response.status_code == 401
+
+    @pytest.mark.parametrize("url", STAT_URLS)
+    def test_list_returns_403_for_general_user(
+        self, url, api_client, general_user, request
+    ):
+        api_client.force_authenticate(user=general_user)
+        response = api_client.get(request.getfixturevalue(url))
+
+        assert response.status_code == 403
+
+    def test_list_returns_400_for_invalid_year(
+        self, api_client, team_player_stat_list_url, admin_user
+    ):
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get(
+            team_player_stat_list_url, {"created_at_year_gte": "recent"}
+        )
+
+        assert response.status_code == 400
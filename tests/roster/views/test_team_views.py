@@ -88,6 +88,142 @@ class TestTeamViewSet(TestBase):
         assert response.status_code == 400
         assert "name" in response.data
 
+    # ========================================================================
+    # Bulk Create Action - Positive Cases
+    # ========================================================================
+    def test_bulk_create_returns_201_and_saves_all_teams(
+        self, api_client, team_bulk_create_url, admin_user
+    ):
+        api_client.force_authenticate(user=admin_user)
+        data = [
+            {"name": "Bulk Team A", "sport": "baseball"},
+            {"name": "Bulk Team B", "sport": "football"},
+        ]
+        response = api_client.post(team_bulk_create_url, data=data, format="json")
+
+        assert response.status_code == 201
+        assert [item["name"] for item in response.data] == [
+            "Bulk Team A",
+            "Bulk Team B",
+        ]
+        assert Team.objects.filter(name__startswith="Bulk Team").count() == 2
+
+    def test_bulk_create_invalidates_cached_list(
+        self, api_client, team_list_url, team_bulk_create_url, admin_user, teams
+    ):
+        api_client.get(team_list_url)
+        api_client.force_authenticate(user=admin_user)
+        api_client.post(
+            team_bulk_create_url,
+            data=[{"name": "Bulk Team", "sport": "baseball"}],
+            format="json",
+        )
+
+        api_client.force_authenticate(user=None)
+        response = api_client.get(team_list_url)
+
+        assert response["X-Cache"] == "MISS"
+        assert response.data["count"] == len(teams) + 1
+
+    # ========================================================================
+    # Bulk Create Action - Negative Cases
+    # ========================================================================
+    def test_bulk_create_returns_403_for_general_user(
+        self, api_client, team_bulk_create_url, general_user, team_data
+    ):
+        api_client.force_authenticate(user=general_user)
+        response = api_client.post(
+            team_bulk_create_url, data=[team_data], format="json"
+        )
+
+        assert response.status_code == 403
+
+    def test_bulk_create_returns_per_item_errors_and_saves_nothing(
+        self, api_client, team_bulk_create_url, admin_user
+    ):
+        api_client.force_authenticate(user=admin_user)
+        data = [
+            {"name": "Bulk Team A", "sport": "baseball"},
+            {"name": "invalid@name", "sport": "invalid choice"},
+        ]
+        response = api_client.post(team_bulk_create_url, data=data, format="json")
+
+        assert response.status_code == 400
+        assert response.data[0] == {}
+        assert set(response.data[1].keys()) == {"name", "sport"}
+        assert not Team.objects.filter(name="Bulk Team A").exists()
+
+    @pytest.mark.parametrize("data", [[], {"name": "Team", "sport": "baseball"}])
+    def test_bulk_create_fails_without_non_empty_list(
+        self, data, api_client, team_bulk_create_url, admin_user
+    ):
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.post(team_bulk_create_url, data=data, format="json")
+
+        assert response.status_code == 400
+        assert "non_field_errors" in response.data
+
+    # ========================================================================
+    # Bulk Update Action - Positive Cases
+    # ========================================================================
+    def test_bulk_update_returns_200_and_updates_every_team(
+        self, api_client, team_bulk_create_url, admin_user, teams
+    ):
+        api_client.force_authenticate(user=admin_user)
+        data = [
+            {"id": str(teams[0].id), "name": "Renamed"},
+            {"id": str(teams[1].id), "sport": "football"},
+        ]
+        response = api_client.patch(team_bulk_create_url, data=data, format="json")
+
+        assert response.status_code == 200
+        assert [item["name"] for item in response.data] == ["Renamed", "Team Name 2"]
+        assert Team.objects.get(id=teams[1].id).sport == "football"
+
+    # ========================================================================
+    # Bulk Update Action - Negative Cases
+    # ========================================================================
+    def test_bulk_update_fails_with_invalid_sport_and_saves_nothing(
+        self, api_client, team_bulk_create_url, admin_user, teams
+    ):
+        api_client.force_authenticate(user=admin_user)
+        data = [
+            {"id": str(teams[0].id), "name": "Renamed"},
+            {"id": str(teams[1].id), "sport": "cricket"},
+        ]
+        response = api_client.patch(team_bulk_create_url, data=data, format="json")
+
+        assert response.status_code == 400
+        assert response.data[0] == {}
+        assert "sport" in response.data[1]
+        assert not Team.objects.filter(name="Renamed").exists()
+
+    # ========================================================================
+    # Bulk Destroy Action - Positive Cases
+    # ========================================================================
+    def test_bulk_destroy_soft_deletes_teams_with_their_players(
+        self, api_client, team_bulk_create_url, super_user, teams, players
+    ):
+        api_client.force_authenticate(user=super_user)
+        data = [str(teams[0].id), str(teams[1].id)]
+        response = api_client.delete(team_bulk_create_url, data=data, format="json")
+
+        assert response.status_code == 200
+        assert [item["status"] for item in response.data] == [204, 204]
+        assert Team.objects.filter(deleted_at__isnull=True).count() == 1
+        assert not teams[0].players.filter(deleted_at__isnull=True).exists()
+
+    # ========================================================================
+    # Bulk Destroy Action - Negative Cases
+    # ========================================================================
+    def test_bulk_destroy_fails_without_non_empty_list(
+        self, api_client, team_bulk_create_url, super_user
+    ):
+        api_client.force_authenticate(user=super_user)
+        response = api_client.delete(team_bulk_create_url, data=[], format="json")
+
+        assert response.status_code == 400
+
     # ========================================================================
     # List Action - Positive Cases
     # ========================================================================
@@ -125,7 +261,7 @@ class TestTeamViewSet(TestBase):
         response = api_client.get(team_list_url)
         data = response.data["results"][0]
 
-        expected_fields = {"id", "name", "sport", "created_at"}
+        expected_fields = {"id", "name", "sport", "created_at", "player_count"}
 
         assert set(data.keys()) == expected_fields
 
@@ -141,6 +277,7 @@ class TestTeamViewSet(TestBase):
             "name",
             "sport",
             "created_at",
+            "player_count",
             "updated_at",
             "deleted_at",
         }
@@ -358,7 +495,7 @@ class TestTeamViewSet(TestBase):
         url = team_detail_url(team_id)
         response = api_client.get(url)
 
-        expected_fields = {"id", "name", "sport", "created_at"}
+        expected_fields = {"id", "name", "sport", "created_at", "player_count"}
 
         assert set(response.data.keys()) == expected_fields
 
@@ -375,6 +512,7 @@ class TestTeamViewSet(TestBase):
             "name",
             "sport",
             "created_at",
+            "player_count",
             "updated_at",
             "deleted_at",
         }
@@ -3,6 +3,7 @@ from uuid import UUID
 import pytest
 from django.contrib.auth.hashers import check_password
 from django.core.exceptions import ValidationError
+from django.db import connection
 
 from user_account.models import UserAccount
 
@@ -105,3 +106,15 @@ def test_success_to_check_str_method(general_user):
     result = general_user.__str__()
 
     assert result == general_user.username
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="EXPLAIN format")
+def test_public_list_query_uses_active_created_index(users):
+    plan = (
+        UserAccount.objects.filter(deleted_at__isnull=True)
+        .order_by("-created_at", "-id")[:10]
+        .explain()
+    )
+
+    assert "user_active_created_idx" in plan
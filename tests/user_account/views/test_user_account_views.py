@@ -1,9 +1,14 @@
+import json
 from uuid import uuid4
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils.dateparse import parse_datetime
 
+from core.cache import invalidate_models
 from core.tests.test_base import TestBase
+from roster.models import Comment
 from user_account.models import UserAccount
 from user_account.serializers import UserAccountCreateSerializer
 from user_account.views import UserAccountViewSet
@@ -122,7 +127,7 @@ class TestUserAccountViewSet(TestBase):
         response = api_client.get(user_account_list_url)
         data = response.data["results"][0]
 
-        expected_fields = {"id", "username", "created_at"}
+        expected_fields = {"id", "username", "created_at", "comment_count"}
 
         assert set(data.keys()) == expected_fields
 
@@ -141,6 +146,7 @@ class TestUserAccountViewSet(TestBase):
             "is_staff",
             "is_active",
             "created_at",
+            "comment_count",
             "updated_at",
             "deleted_at",
         }
@@ -284,6 +290,37 @@ class TestUserAccountViewSet(TestBase):
         assert response_2.status_code == 200
         assert response_3.status_code == 429
 
+    # ========================================================================
+    # Export Action - Positive Cases
+    # ========================================================================
+    def test_export_streams_csv_with_admin_fields_for_admin(
+        self, api_client, user_account_export_url, users, admin_user
+    ):
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get(user_account_export_url + "?export_format=csv")
+
+        header = self.get_streamed_lines(response)[0].split(",")
+
+        assert {"email", "is_staff", "deleted_at"} <= set(header)
+
+    # ========================================================================
+    # Export Action - Negative Cases
+    # ========================================================================
+    def test_export_fails_with_anonymous_user(
+        self, api_client, user_account_export_url
+    ):
+        response = api_client.get(user_account_export_url)
+
+        assert response.status_code == 401
+
+    def test_export_fails_with_general_user(
+        self, api_client, user_account_export_url, general_user
+    ):
+        api_client.force_authenticate(user=general_user)
+        response = api_client.get(user_account_export_url)
+
+        assert response.status_code == 403
+
     # ========================================================================
     # Retrieve Action - Positive Cases
     # ========================================================================
@@ -311,7 +348,7 @@ class TestUserAccountViewSet(TestBase):
         url = user_account_detail_url(general_user.id)
         response = api_client.get(url)
 
-        expected_fields = {"id", "username", "created_at"}
+        expected_fields = {"id", "username", "created_at", "comment_count"}
 
         assert set(response.data.keys()) == expected_fields
 
@@ -330,6 +367,7 @@ class TestUserAccountViewSet(TestBase):
             "is_staff",
             "is_active",
             "created_at",
+            "comment_count",
             "updated_at",
             "deleted_at",
         }
@@ -753,6 +791,33 @@ class TestUserAccountViewSet(TestBase):
 
         assert created_at_data == descending
 
+    def test_comments_runs_constant_number_of_queries_regardless_of_page_size(
+        self, api_client, user_account_comments_url, general_user, players
+    ):
+        url = user_account_comments_url(general_user.id)
+        Comment.objects.create(user=general_user, player=players[0], body="Body")
+
+        with CaptureQueriesContext(connection) as small_page_queries:
+            api_client.get(url)
+
+        Comment.objects.bulk_create(
+            [
+                Comment(
+                    user=general_user,
+                    player=players[i % len(players)],
+                    body=f"Body {i}",
+                )
+                for i in range(10)
+            ]
+        )
+        invalidate_models(Comment)
+
+        with CaptureQueriesContext(connection) as full_page_queries:
+            response = api_client.get(url)
+
+        assert len(response.data["results"]) == 10
+        assert len(full_page_queries) == len(small_page_queries)
+
     # ========================================================================
     # Comments Action - Negative Cases
     # ========================================================================
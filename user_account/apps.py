@@ -1,6 +1,22 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_migrate, post_save
 
 
 class UserAccountConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'user_account'
+
+    def ready(self):
+        from core.authentication import invalidate_user_on_write
+        from core.cache import invalidate_on_write
+        from core.search import install_search_triggers_on_migrate
+
+        from .models import UserAccount
+
+        post_migrate.connect(install_search_triggers_on_migrate, sender=self)
+
+        for model in (UserAccount,):
+            post_save.connect(invalidate_on_write, sender=model)
+            post_delete.connect(invalidate_on_write, sender=model)
+            post_save.connect(invalidate_user_on_write, sender=model)
+            post_delete.connect(invalidate_user_on_write, sender=model)
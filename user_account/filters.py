@@ -1,13 +1,11 @@
-from django_filters import rest_framework as filters
-
-from core.filters import BaseFilterSet
+from core.filters import BaseFilterSet, IndexedCharFilter
 from roster.models import Comment
 
 from .models import UserAccount
 
 
 class UserAccountFilter(BaseFilterSet):
-    username = filters.CharFilter(field_name="username", lookup_expr="icontains")
+    username = IndexedCharFilter(field_name="username")
 
     class Meta:
         model = UserAccount
@@ -15,15 +13,9 @@ class UserAccountFilter(BaseFilterSet):
 
 
 class MeCommentFilter(BaseFilterSet):
-    team_name = filters.CharFilter(
-        field_name="player__team__name", lookup_expr="icontains"
-    )
-    player_first_name = filters.CharFilter(
-        field_name="player__first_name", lookup_expr="icontains"
-    )
-    player_last_name = filters.CharFilter(
-        field_name="player__last_name", lookup_expr="icontains"
-    )
+    team_name = IndexedCharFilter(field_name="player__team__name")
+    player_first_name = IndexedCharFilter(field_name="player__first_name")
+    player_last_name = IndexedCharFilter(field_name="player__last_name")
 
     class Meta:
         model = Comment
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("user_account", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="useraccount",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["-created_at", "-id"],
+                name="user_active_created_idx",
+            ),
+        ),
+    ]
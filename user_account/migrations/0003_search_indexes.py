@@ -0,0 +1,98 @@
+from django.db import migrations
+
+SEARCH_FIELDS = ["username"]
+
+
+def create_search_index(schema_editor, model, fields):
+    table = model._meta.db_table
+    columns = [model._meta.get_field(name).column for name in fields]
+
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for column in columns:
+            schema_editor.execute(
+                f'CREATE INDEX IF NOT EXISTS "{table}_{column}_trgm" ON "{table}" '
+                f'USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+            )
+    elif schema_editor.connection.vendor == "sqlite":
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        select_list = ", ".join(f't."{column}"' for column in columns)
+        new_values = ", ".join(f'new."{column}"' for column in columns)
+        assignments = ", ".join(f'"{column}" = new."{column}"' for column in columns)
+        map_rowid = (
+            f'(SELECT rowid FROM "{table}_search_map" WHERE object_id = {{}}.id)'
+        )
+
+        schema_editor.execute(
+            f'CREATE TABLE IF NOT EXISTS "{table}_search_map" '
+            f"(rowid INTEGER PRIMARY KEY, object_id char(32) NOT NULL UNIQUE)"
+        )
+        schema_editor.execute(
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS "{table}_search" '
+            f"USING fts5({column_list}, tokenize='trigram')"
+        )
+        schema_editor.execute(
+            f'INSERT INTO "{table}_search_map" (object_id) SELECT id FROM "{table}"'
+        )
+        schema_editor.execute(
+            f'INSERT INTO "{table}_search" (rowid, {column_list}) '
+            f"SELECT m.rowid, {select_list} "
+            f'FROM "{table}" t JOIN "{table}_search_map" m ON m.object_id = t.id'
+        )
+        schema_editor.execute(
+            f'CREATE TRIGGER IF NOT EXISTS "{table}_search_insert" '
+            f'AFTER INSERT ON "{table}" BEGIN '
+            f'INSERT INTO "{table}_search_map" (object_id) VALUES (new.id); '
+            f'INSERT INTO "{table}_search" (rowid, {column_list}) '
+            f"VALUES (last_insert_rowid(), {new_values}); "
+            f"END"
+        )
+        schema_editor.execute(
+            f'CREATE TRIGGER IF NOT EXISTS "{table}_search_update" '
+            f'AFTER UPDATE OF {column_list} ON "{table}" BEGIN '
+            f'UPDATE "{table}_search" SET {assignments} '
+            f"WHERE rowid = {map_rowid.format('new')}; "
+            f"END"
+        )
+        schema_editor.execute(
+            f'CREATE TRIGGER IF NOT EXISTS "{table}_search_delete" '
+            f'AFTER DELETE ON "{table}" BEGIN '
+            f'DELETE FROM "{table}_search" WHERE rowid = {map_rowid.format("old")}; '
+            f'DELETE FROM "{table}_search_map" WHERE object_id = old.id; '
+            f"END"
+        )
+
+
+def drop_search_index(schema_editor, model, fields):
+    table = model._meta.db_table
+
+    if schema_editor.connection.vendor == "postgresql":
+        for name in fields:
+            column = model._meta.get_field(name).column
+            schema_editor.execute(f'DROP INDEX IF EXISTS "{table}_{column}_trgm"')
+    elif schema_editor.connection.vendor == "sqlite":
+        for suffix in ("insert", "update", "delete"):
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS "{table}_search_{suffix}"')
+        schema_editor.execute(f'DROP TABLE IF EXISTS "{table}_search"')
+        schema_editor.execute(f'DROP TABLE IF EXISTS "{table}_search_map"')
+
+
+def create_search_indexes(apps, schema_editor):
+    model = apps.get_model("user_account", "useraccount")
+    create_search_index(schema_editor, model, SEARCH_FIELDS)
+
+
+def drop_search_indexes(apps, schema_editor):
+    model = apps.get_model("user_account", "useraccount")
+    drop_search_index(schema_editor, model, SEARCH_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user_account", "0002_soft_delete_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -4,9 +4,10 @@ from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.contrib.auth.validators import UnicodeUsernameValidator
 from django.core.mail import send_mail
 from django.db import models
-from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from core.soft_delete import restore, soft_delete
+
 from .managers import UserAccountManager
 
 
@@ -63,16 +64,32 @@ class UserAccount(AbstractBaseUser, PermissionsMixin):
         blank=True,
         help_text=_("Timestamp of when the user was deleted"),
     )
+    comment_count = models.PositiveIntegerField(
+        _("comment count"),
+        default=0,
+        editable=False,
+        help_text=_("Number of comments by the user that are not deleted"),
+    )
 
     objects = UserAccountManager()
 
     EMAIL_FIELD = "email"
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username"]
+    SEARCH_FIELDS = ["username"]
+    # Descendants soft-deleted and restored along with the user.
+    SOFT_DELETE_CASCADE = ("comments",)
 
     class Meta:
         verbose_name = _("user")
         verbose_name_plural = _("users")
+        indexes = [
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="user_active_created_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
         # abstract = True
 
     def clean(self):
@@ -92,5 +109,11 @@ class UserAccount(AbstractBaseUser, PermissionsMixin):
         return self.username
 
     def soft_delete(self):
-        self.deleted_at = timezone.now()
-        self.save(update_fields=["deleted_at"])
+        """Soft-delete the user and its `SOFT_DELETE_CASCADE` descendants."""
+        soft_delete(type(self)._base_manager.filter(pk=self.pk))
+        self.refresh_from_db(fields=["deleted_at", "updated_at"])
+
+    def restore(self):
+        """Restore the user and the descendants soft-deleted along with it."""
+        restore(type(self)._base_manager.filter(pk=self.pk))
+        self.refresh_from_db(fields=["deleted_at", "updated_at"])
@@ -2,6 +2,8 @@ from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
 
 from core.nested_serializers import PlayerNestedSerializer
+from core.patch_serializers import PatchModelSerializer
+from core.values_serializers import ValuesModelSerializer
 from roster.models import Comment
 
 from .models import UserAccount
@@ -34,8 +36,8 @@ class UserAccountCreateSerializer(serializers.ModelSerializer):
 class UserAccountListRetrievePublicSerializer(serializers.ModelSerializer):
     class Meta:
         model = UserAccount
-        fields = ["id", "username", "created_at"]
-        read_only_fields = ["id", "username", "created_at"]
+        fields = ["id", "username", "created_at", "comment_count"]
+        read_only_fields = ["id", "username", "created_at", "comment_count"]
 
 
 class UserAccountListRetrieveAdminSerializer(serializers.ModelSerializer):
@@ -49,6 +51,7 @@ class UserAccountListRetrieveAdminSerializer(serializers.ModelSerializer):
             "is_staff",
             "is_active",
             "created_at",
+            "comment_count",
             "updated_at",
             "deleted_at",
         ]
@@ -60,12 +63,13 @@ class UserAccountListRetrieveAdminSerializer(serializers.ModelSerializer):
             "is_staff",
             "is_active",
             "created_at",
+            "comment_count",
             "updated_at",
             "deleted_at",
         ]
 
 
-class UserAccountPatchSerializer(serializers.ModelSerializer):
+class UserAccountPatchSerializer(PatchModelSerializer):
     class Meta:
         model = UserAccount
         fields = [
@@ -90,7 +94,7 @@ class UserAccountPatchSerializer(serializers.ModelSerializer):
 # ==================================================
 # UserAccountComment
 # ==================================================
-class UserAccountCommentListPublicSerializer(serializers.ModelSerializer):
+class UserAccountCommentListPublicSerializer(ValuesModelSerializer):
     player = PlayerNestedSerializer(read_only=True)
 
     class Meta:
@@ -99,7 +103,7 @@ class UserAccountCommentListPublicSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "body", "created_at", "updated_at", "player"]
 
 
-class UserAccountCommentListAdminSerializer(serializers.ModelSerializer):
+class UserAccountCommentListAdminSerializer(ValuesModelSerializer):
     player = PlayerNestedSerializer(read_only=True)
 
     class Meta:
@@ -125,7 +129,7 @@ class MeRetrieveSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "username", "email", "created_at", "updated_at"]
 
 
-class MePatchSerializer(serializers.ModelSerializer):
+class MePatchSerializer(PatchModelSerializer):
     class Meta:
         model = UserAccount
         fields = ["id", "username", "email", "created_at", "updated_at"]
@@ -1,15 +1,29 @@
 from django.urls import include, path
 from rest_framework.routers import SimpleRouter
 
-from .views import MeAPIView, MeCommentAPIView, UserAccountViewSet
+from .views import (
+    AsyncMeCommentAPIView,
+    AsyncUserAccountViewSet,
+    MeAPIView,
+    MeCommentAPIView,
+    UserAccountViewSet,
+)
 
 router = SimpleRouter()
 router.register(r"user-accounts", UserAccountViewSet, basename="user_account")
 
+# Read-only variants of the views above, for ASGI servers.
+async_router = SimpleRouter()
+async_router.register(
+    r"user-accounts", AsyncUserAccountViewSet, basename="async-user_account"
+)
+
 # fmt: off
 urlpatterns = [
     path("user-accounts/me/", MeAPIView.as_view(), name="me"),
     path("user-accounts/me/comments/", MeCommentAPIView.as_view(), name="me_comments"),
+    path("async/user-accounts/me/comments/", AsyncMeCommentAPIView.as_view(), name="async-me_comments"),
     path("", include(router.urls)),
+    path("async/", include(async_router.urls)),
 ]
 # fmt: on
@@ -1,12 +1,21 @@
 from django_filters import rest_framework as django_filters
-from rest_framework import filters, generics, viewsets
+from rest_framework import filters, generics, permissions, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 
+from core.cache import cache_response
+from core.conditional import conditional_response
+from core.filters import IndexedSearchFilter
+from core.mixins.asynchronous import AsyncReadMixin
+from core.mixins.batch import BatchRetrieveMixin
+from core.mixins.caching import CachedResponseMixin
+from core.mixins.conditional import ConditionalResponseMixin
+from core.mixins.export import ExportMixin
+from core.mixins.querysets import SerializerQuerySetMixin
 from core.mixins.throttles import UserRoleBasedThrottleMixin
 from core.permissions import IsSuperUser
-from roster.models import Comment
+from roster.models import Comment, Player, Team
 
 from .filters import MeCommentFilter, UserAccountFilter
 from .models import UserAccount
@@ -23,16 +32,25 @@ from .serializers import (
 )
 
 
-class UserAccountViewSet(UserRoleBasedThrottleMixin, viewsets.ModelViewSet):
+class UserAccountViewSet(
+    UserRoleBasedThrottleMixin,
+    CachedResponseMixin,
+    ConditionalResponseMixin,
+    SerializerQuerySetMixin,
+    BatchRetrieveMixin,
+    ExportMixin,
+    viewsets.ModelViewSet,
+):
     http_method_names = ["get", "post", "patch", "delete"]
     filter_backends = (
         django_filters.DjangoFilterBackend,
-        filters.SearchFilter,
+        IndexedSearchFilter,
         filters.OrderingFilter,
     )
     filterset_class = UserAccountFilter
+    cache_models = (UserAccount, Comment, Player, Team)
     search_fields = ["username"]
-    ordering_fields = ["username", "created_at"]
+    ordering_fields = ["username", "created_at", "comment_count"]
 
     def get_queryset(self):
         if self.request.user.is_staff:
@@ -43,9 +61,15 @@ class UserAccountViewSet(UserRoleBasedThrottleMixin, viewsets.ModelViewSet):
         return qs.order_by("-created_at")
 
     def get_permissions(self):
-        if self.action in ["create", "list", "retrieve", "comments"]:
+        if self.action in [
+            "create",
+            "list",
+            "retrieve",
+            "batch",
+            "comments",
+        ]:
             permission_class = [AllowAny]
-        elif self.action == "partial_update":
+        elif self.action in ["partial_update", "export"]:
             permission_class = [IsAdminUser]
         elif self.action == "destroy":
             permission_class = [IsSuperUser]
@@ -56,7 +80,7 @@ class UserAccountViewSet(UserRoleBasedThrottleMixin, viewsets.ModelViewSet):
     def get_serializer_class(self):
         if self.action == "create":
             return UserAccountCreateSerializer
-        elif self.action in ["list", "retrieve"]:
+        elif self.action in ["list", "retrieve", "batch", "export"]:
             if self.request.user.is_staff:
                 return UserAccountListRetrieveAdminSerializer
             return UserAccountListRetrievePublicSerializer
@@ -67,7 +91,16 @@ class UserAccountViewSet(UserRoleBasedThrottleMixin, viewsets.ModelViewSet):
     def perform_destroy(self, instance):
         instance.soft_delete()
 
+    def get_comments_queryset(self, user):
+        if self.request.user.is_staff:
+            comment_qs = Comment.objects.filter(user=user)
+        else:
+            comment_qs = Comment.objects.filter(user=user, deleted_at__isnull=True)
+        return comment_qs.order_by("-created_at")
+
     @action(detail=True, methods=["get"], url_name="comments")
+    @cache_response
+    @conditional_response
     def comments(self, request, pk=None):
         target_user = self.get_object()
 
@@ -75,14 +108,13 @@ class UserAccountViewSet(UserRoleBasedThrottleMixin, viewsets.ModelViewSet):
 
         if is_admin:
             serializer_class = UserAccountCommentListAdminSerializer
-            comment_qs = Comment.objects.filter(user=target_user)
         else:
             serializer_class = UserAccountCommentListPublicSerializer
-            comment_qs = Comment.objects.filter(
-                user=target_user, deleted_at__isnull=True
-            )
 
-        comments = comment_qs.order_by("-created_at")
+        serializer_class = self.get_sparse_serializer_class(serializer_class)
+        comments = self.optimize_queryset(
+            self.get_comments_queryset(target_user), serializer_class
+        )
 
         page = self.paginate_queryset(comments)
         if page is not None:
@@ -94,7 +126,30 @@ class UserAccountViewSet(UserRoleBasedThrottleMixin, viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class MeAPIView(UserRoleBasedThrottleMixin, generics.RetrieveUpdateDestroyAPIView):
+class AsyncUserAccountViewSet(AsyncReadMixin, UserAccountViewSet):
+    @action(detail=True, methods=["get"], url_name="comments")
+    @cache_response
+    @conditional_response
+    async def comments(self, request, pk=None):
+        target_user = await self.aget_object()
+
+        if request.user.is_staff:
+            serializer_class = UserAccountCommentListAdminSerializer
+        else:
+            serializer_class = UserAccountCommentListPublicSerializer
+
+        serializer_class = self.get_sparse_serializer_class(serializer_class)
+        comments = self.optimize_queryset(
+            self.get_comments_queryset(target_user), serializer_class
+        )
+        return await self.alist_queryset(comments, serializer_class)
+
+
+class MeAPIView(
+    UserRoleBasedThrottleMixin,
+    SerializerQuerySetMixin,
+    generics.RetrieveUpdateDestroyAPIView,
+):
     http_method_names = ["get", "patch", "delete"]
     permission_classes = [IsAuthenticated]
 
@@ -106,20 +161,26 @@ class MeAPIView(UserRoleBasedThrottleMixin, generics.RetrieveUpdateDestroyAPIVie
         return MeRetrieveSerializer
 
     def get_object(self):
-        return self.request.user
+        # `request.user` only holds the cached authentication snapshot.
+        queryset = UserAccount.objects.filter(pk=self.request.user.pk)
+        if self.request.method in permissions.SAFE_METHODS:
+            queryset = self.optimize_queryset(queryset, values=False)
+        return queryset.get()
 
     def perform_destroy(self, instance):
         instance.soft_delete()
 
 
-class MeCommentAPIView(UserRoleBasedThrottleMixin, generics.ListAPIView):
+class MeCommentAPIView(
+    UserRoleBasedThrottleMixin, SerializerQuerySetMixin, generics.ListAPIView
+):
     http_method_names = ["get"]
     serializer_class = MeCommentListSerializer
     permission_classes = [IsAuthenticated]
 
     filter_backends = (
         django_filters.DjangoFilterBackend,
-        filters.SearchFilter,
+        IndexedSearchFilter,
         filters.OrderingFilter,
     )
     filterset_class = MeCommentFilter
@@ -129,3 +190,8 @@ class MeCommentAPIView(UserRoleBasedThrottleMixin, generics.ListAPIView):
     def get_queryset(self):
         qs = Comment.objects.filter(user=self.request.user, deleted_at__isnull=True)
         return qs.order_by("-created_at")
+
+
+class AsyncMeCommentAPIView(AsyncReadMixin, MeCommentAPIView):
+    async def get(self, request, *args, **kwargs):
+        return await self.list(request, *args, **kwargs)